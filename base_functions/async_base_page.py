@@ -0,0 +1,358 @@
+import asyncio
+import json
+import time
+
+from selenium.common.exceptions import InvalidSelectorException
+
+from base_functions.js_scripts import (
+    CDP_WAIT_FN, CDP_CLICK_POINT_FN, CDP_JS_CLICK_FN,
+    CDP_FOCUS_CLEAR_FN, CDP_TEXT_FN, CDP_VALUE_FN, CDP_SET_VALUE_FN)
+from utils.cdp import CDPError
+from utils.logger import get_test_id, get_test_name, get_logger
+from utils.retry import DEFAULT_RETRY_POLICY, TRANSIENT, classify_failure, is_invalid_selector_error, retry_budget
+
+from utils.exeption import (
+    ElementNotFoundError, ElementStaleError,
+    JavaScriptError, ElementInteractionError,
+    ElementVisibilityError, ElementNotClickableError)
+
+
+def _exception_text(details):
+    """CDP exceptionDetails: "Uncaught (in promise)" dan tashqari xato tavsifi ham (masalan SyntaxError: ...)"""
+    description = details.get("exception", {}).get("description")
+    return f"{details.get('text')}: {description}" if description else details.get("text")
+
+
+class AsyncBasePage:
+    """
+    BasePage ning asyncio varianti: WebDriver HTTP buyruqlari o'rniga CDP websocket (utils.cdp).
+    Bitta event loop da ko'plab sahifalar (har biri o'z CDPSession / browser context ida)
+    parallel ishlaydi, brauzer uchun alohida thread kerak emas.
+    Kutishlar polling qilmaydi: sahifa ichida MutationObserver, alertlar va tarmoq - CDP hodisalari.
+    Elementlar CDP objectId (str) ko'rinishida qaytadi.
+    """
+
+    # =======================================================================================
+    def __init__(self, session):
+        self.session = session
+        self.test_name = get_test_name()
+        self.logger = get_logger(self.test_name)
+        self.default_timeout = 30
+        # Bitta public amal (ichidagi kutish va retry lar bilan) uchun umumiy vaqt (None - default_timeout)
+        self.action_timeout = None
+        self.retry_policy = DEFAULT_RETRY_POLICY
+        self.test_id = get_test_id() or f"{self.test_name}[{id(self):x}]"
+        self.retry_budget = retry_budget(self.test_id)
+        self._dialogs = asyncio.Queue()
+        session.on("Page.javascriptDialogOpening", lambda params, _session_id: self._dialogs.put_nowait(params))
+        # Yopilgan dialog hodisasi navbatda qolmasin (boshqa yo'l bilan yopilgan yoki sahifa almashgan)
+        session.on("Page.javascriptDialogClosed", lambda params, _session_id: self._drain_dialogs())
+
+    # =======================================================================================
+
+    async def _evaluate(self, function, *args, await_promise=False, by_value=True, timeout=None):
+        """function(*args) ni sahifada bajarish. Argumentlar JSON sifatida qo'yiladi"""
+        expression = f"({function})({', '.join(json.dumps(arg) for arg in args)})"
+        response = await self.session.send("Runtime.evaluate", {
+            "expression": expression,
+            "awaitPromise": await_promise,
+            "returnByValue": by_value,
+        }, timeout=timeout)
+        if "exceptionDetails" in response:
+            raise JavaScriptError(f"JS xatoligi: {_exception_text(response['exceptionDetails'])}")
+        return response["result"]
+
+    async def _call_on(self, object_id, function, locator=None, args=()):
+        """this = element bo'lgan funksiyani chaqirish va qiymatini qaytarish"""
+        try:
+            response = await self.session.send("Runtime.callFunctionOn", {
+                "objectId": object_id,
+                "functionDeclaration": function,
+                "arguments": [{"value": arg} for arg in args],
+                "returnByValue": True,
+            })
+        except CDPError as e:
+            # objectId eskirgan (sahifa qayta yuklangan yoki element almashgan)
+            raise ElementStaleError("Element DOM da yangilandi", locator, e)
+        if "exceptionDetails" in response:
+            raise JavaScriptError(f"JS xatoligi: {_exception_text(response['exceptionDetails'])}", locator)
+        return response["result"].get("value")
+
+    # =======================================================================================
+
+    def _new_deadline(self):
+        """Amal deadline i (time.monotonic): action_timeout yoki default_timeout"""
+        return time.monotonic() + (self.action_timeout or self.default_timeout)
+
+    def _timeout(self, deadline):
+        """Ichki kutish vaqti: default_timeout, lekin amal deadline idan ko'p emas"""
+        return round(max(min(self.default_timeout, deadline - time.monotonic()), 0.001), 3)
+
+    async def _retry_sleep(self, attempt, retry_delay, deadline):
+        """BasePage._retry_sleep kabi: kutish test retry byudjeti va amal deadline i bilan cheklanadi"""
+        delay = min(self.retry_policy.delay(attempt) if retry_delay is None else retry_delay,
+                    self.retry_budget.remaining)
+        delay = max(min(delay, deadline - time.monotonic()), 0)
+        slept = await self.retry_policy.async_sleep(attempt, test_name=self.test_name, delay=delay)
+        self.retry_budget.charge(slept)
+        return slept
+
+    def _can_retry(self, error, attempt, retries, attempt_started, deadline, retry_delay=None):
+        """
+        BasePage._can_retry kabi: qayta urinish faqat vaqtinchalik xatoda (utils.retry.classify_failure),
+        byudjet va amal deadline i tugamagan bo'lsa. Bir sahifada bir nechta amal parallel ketishi
+        mumkin, shuning uchun deadline obyektda emas, argument sifatida uzatiladi.
+        """
+        now = time.monotonic()
+        attempt_time = now - attempt_started
+        if attempt:
+            self.retry_budget.charge(attempt_time)
+
+        kind = classify_failure(error)
+        expired = now >= deadline
+        if kind == TRANSIENT and not self.retry_budget.exhausted and not expired:
+            return True
+
+        remaining = range(attempt, retries - 1)
+        delays = sum(self.retry_policy.delay(n) if retry_delay is None else retry_delay for n in remaining)
+        self.retry_budget.record_stop(kind if kind != TRANSIENT else "budget", len(remaining) * attempt_time + delays)
+        if kind == TRANSIENT and expired:
+            self.logger.warning(f"❗ {self.test_name}: amal deadline i tugadi: {str(error)}")
+        elif kind == TRANSIENT:
+            self.logger.warning(f"❗ {self.test_name}: retry byudjeti ({self.retry_budget.seconds}s) tugadi: {str(error)}")
+        else:
+            self.logger.debug("%s: Deterministik xato, qayta urinilmaydi: %s", self.test_name, type(error).__name__)
+        return False
+
+    # =======================================================================================
+
+    async def goto(self, url, timeout=60):
+        """Sahifaga o'tish va load hodisasini kutish"""
+        self._drain_dialogs()
+        await self.session.navigate(url, timeout=timeout)
+        self.logger.info("⏺ %s: Sahifa ochildi: %s", self.__class__.__name__, url)
+
+    async def wait_for_network_idle(self, idle_time=0.5, timeout=30):
+        """Tarmoq so'rovlari tugashini kutish (CDP Network hodisalari)"""
+        await self.session.wait_for_network_idle(idle_time=idle_time, timeout=timeout)
+
+    # ==============================================================================================
+
+    async def wait_for_element(self, locator, timeout=None, wait_type="presence", error_message=True):
+        """Umumiy kutish funksiyasi (BasePage.wait_for_element bilan bir xil shartlar):
+        * "presence" - DOMda mavjudligini kutadi
+        * "visibility" = Ko'rinadigan holatga kelishini kutadi
+        * "clickable" - Bosiladigan holatga kelishini kutadi
+        Element objectId sini qaytaradi.
+        """
+        page_name = self.__class__.__name__
+        timeout = timeout or self.default_timeout
+
+        if wait_type not in ("presence", "visibility", "clickable"):
+            raise ValueError(f"Notogri wait_type: '{wait_type}'. Faqat 'presence', 'visibility', yoki 'clickable', bo'lishi mumkin.")
+
+        by, value = locator
+        try:
+            result = await self._evaluate(CDP_WAIT_FN, by, value, wait_type, int(timeout * 1000),
+                                          await_promise=True, by_value=False, timeout=timeout + 5)
+        except JavaScriptError as e:
+            if is_invalid_selector_error(e.message):
+                # Locator noto'g'ri - qayta urinish foydasiz (classify_failure: DETERMINISTIC)
+                message = "Notogri locator"
+                if error_message:
+                    self.logger.warning(f"❗ {page_name}: {message}: {locator}: {e.message}")
+                raise ElementInteractionError(message, locator, InvalidSelectorException(e.message))
+            e.locator = locator
+            if error_message:
+                self.logger.warning(f"❗ {page_name}: {e.message}: {locator}")
+            raise
+        except (CDPError, asyncio.TimeoutError) as e:
+            message = f"Element {wait_type} kutishida kutilmagan xatolik"
+            if error_message:
+                self.logger.warning(f"❗  {page_name}: {message}: {locator}: {str(e)}")
+            raise ElementInteractionError(message, locator, e)
+
+        if result.get("objectId"):
+            return result["objectId"]
+
+        message = f"Element {timeout}s ichida {wait_type} shartiga yetmadi."
+        if error_message:
+            self.logger.warning(f"{page_name}: {message}: {locator}")
+        if wait_type == "visibility":
+            raise ElementVisibilityError(message, locator)
+        elif wait_type == "clickable":
+            raise ElementNotClickableError(message, locator)
+        raise ElementNotFoundError(message, locator)
+
+    # ===============================================================================================
+
+    async def _mouse_click(self, x, y):
+        """Haqiqiy sichqoncha bosilishi (WebDriver click kabi)"""
+        for event in ("mousePressed", "mouseReleased"):
+            await self.session.send("Input.dispatchMouseEvent", {
+                "type": event, "x": x, "y": y, "button": "left", "clickCount": 1})
+
+    async def click(self, locator, retries=3, retry_delay=None):
+        """
+        Asosiy click funksiyasi: clickable kutish -> scroll -> sichqoncha bosilishi.
+        Element boshqa element bilan yopilgan bo'lsa qayta uriniladi; oxirgi urinishda,
+        retry byudjeti yoki amal deadline i tugaganda JS click.
+        """
+        page_name = self.__class__.__name__
+        self.logger.debug("%s: Running click: %s", page_name, locator)
+        self._drain_dialogs()
+        deadline = self._new_deadline()
+
+        for attempt in range(retries):
+            attempt_started = time.monotonic()
+            try:
+                element = await self.wait_for_element(locator, timeout=self._timeout(deadline), wait_type="clickable")
+                point = await self._call_on(element, CDP_CLICK_POINT_FN, locator)
+                if not point["obscured"]:
+                    await self._mouse_click(point["x"], point["y"])
+                    self.logger.info("⏺ %s: Click: %s", page_name, locator)
+                    return True
+
+                if (attempt == retries - 1 or self.retry_budget.exhausted
+                        or time.monotonic() >= deadline):
+                    self.logger.info("Majburiy JS Click sinab ko'riladi...")
+                    await self._call_on(element, CDP_JS_CLICK_FN, locator)
+                    self.logger.info("⏺ %s: JS Click: %s", page_name, locator)
+                    return True
+                self.logger.warning(f"❗ Element boshqa element bilan yopilgan: {locator}")
+                if attempt:
+                    self.retry_budget.charge(time.monotonic() - attempt_started)
+
+            except Exception as e:
+                if not self._can_retry(e, attempt, retries, attempt_started, deadline, retry_delay):
+                    raise
+                self.logger.warning(f"{page_name}: Qayta urinish ({attempt + 1}/{retries}): {str(e)}")
+
+            if attempt + 1 < retries:
+                await self._retry_sleep(attempt, retry_delay, deadline)
+
+        message = f"Element barcha usullar bilan bosilmadi ({retries}/{retries})"
+        self.logger.warning(f"{page_name}: {message}: {locator}")
+        raise ElementInteractionError(message, locator)
+
+    # ==============================================================================================
+
+    async def input_text(self, locator, text=None, retries=3, retry_delay=None, check=False, get_value=False):
+        """
+        Elementni topish va matn kiritish funksiyasi (Input.insertText - input hodisalari bilan).
+        check=True - BasePage.input_text kabi: value kiritilgan matnga teng bo'lmasa to'g'ridan-to'g'ri qo'yiladi.
+        """
+        page_name = self.__class__.__name__
+        self.logger.debug("%s: Running -> input_text: %s", page_name, locator)
+        self._drain_dialogs()
+        deadline = self._new_deadline()
+
+        for attempt in range(retries):
+            attempt_started = time.monotonic()
+            try:
+                if get_value:
+                    element = await self.wait_for_element(locator, timeout=self._timeout(deadline), wait_type="presence")
+                    value = await self._call_on(element, CDP_VALUE_FN, locator)
+                    self.logger.info('⏺ Input: get_value -> "%s"', value)
+                    return value
+
+                element = await self.wait_for_element(locator, timeout=self._timeout(deadline), wait_type="clickable")
+                if text:
+                    await self._call_on(element, CDP_FOCUS_CLEAR_FN, locator)
+                    await self.session.send("Input.insertText", {"text": text})
+                    self.logger.info("Input: send_key -> '%s'", text)
+
+                if check:
+                    value = await self._call_on(element, CDP_VALUE_FN, locator)
+                    self.logger.info("Check Input Value: -> '%s'", value)
+                    if value != text:
+                        await self._call_on(element, CDP_SET_VALUE_FN, locator, args=(text,))
+                return True
+
+            except Exception as e:
+                if not self._can_retry(e, attempt, retries, attempt_started, deadline, retry_delay):
+                    self.logger.error(f"Matn kiritishda xatolik: {str(e)}: {locator}")
+                    raise
+                self.logger.warning(f"❗ Input yangilandi, qayta urinish ({attempt + 1})")
+                if attempt + 1 < retries:
+                    await self._retry_sleep(attempt, retry_delay, deadline)
+
+        message = f"Matn {retries} urinishdan keyin ham kiritilmadi"
+        self.logger.error(f"{page_name}: {message}: {locator}")
+        raise ElementInteractionError(message, locator)
+
+    # ==============================================================================================
+
+    async def get_text(self, locator, retries=3, retry_delay=None):
+        """Elementning matnini olish"""
+        page_name = self.__class__.__name__
+        self.logger.debug("%s: Running -> get_text: %s", page_name, locator)
+        deadline = self._new_deadline()
+
+        for attempt in range(retries):
+            attempt_started = time.monotonic()
+            try:
+                element = await self.wait_for_element(locator, timeout=self._timeout(deadline), wait_type="visibility")
+                text = await self._call_on(element, CDP_TEXT_FN, locator)
+                self.logger.info("%s: Element text -> '%s'", page_name, text)
+                return text
+
+            except Exception as e:
+                if not self._can_retry(e, attempt, retries, attempt_started, deadline, retry_delay):
+                    raise
+                self.logger.warning(f"Element yangilandi, qayta urinish ({attempt + 1})")
+                if attempt + 1 < retries:
+                    await self._retry_sleep(attempt, retry_delay, deadline)
+
+        message = f"Element matni {retries} urinishdan keyin ham olinmadi"
+        self.logger.error(f"{page_name}: {message}: {locator}")
+        raise ElementInteractionError(message, locator)
+
+    # ==================================================================================================
+
+    def _drain_dialogs(self):
+        """
+        Navbatdagi eski dialog hodisalarini tashlab yuborish. Dialog chiqarishi mumkin bo'lgan amallar
+        (goto, click, input_text) boshida chaqiriladi: handle_alert shu amal ochgan dialogni oladi.
+        """
+        dropped = 0
+        while not self._dialogs.empty():
+            self._dialogs.get_nowait()
+            dropped += 1
+        if dropped:
+            self.logger.debug("%s: %s ta eski dialog hodisasi tashlab yuborildi", self.__class__.__name__, dropped)
+
+    async def _next_dialog(self, timeout):
+        return await asyncio.wait_for(self._dialogs.get(), timeout)
+
+    async def handle_alert(self, accept=True, second_alert=False, timeout=10):
+        """
+        Alert oynasini boshqarish (Page.javascriptDialogOpening hodisasi kutiladi)
+        accept=True - OK bosiladi, aks holda Cancel
+        second_alert=True - Keyingi alert chiqsa avtomatik OK bosadi
+        """
+        page_name = self.__class__.__name__
+
+        try:
+            dialog = await self._next_dialog(timeout)
+            self.logger.info("%s: Alert matni: '%s'", page_name, dialog.get("message", "").strip())
+            await self.session.send("Page.handleJavaScriptDialog", {"accept": accept})
+            self.logger.info("%s: %s bosildi.", page_name, 'OK' if accept else 'Cancel')
+
+            # Keyingi alert (Agar chiqsa, OK qilish)
+            if second_alert:
+                try:
+                    second = await self._next_dialog(timeout)
+                    self.logger.info("%s: Keyingi alert matni: '%s'", page_name, second.get("message", "").strip())
+                    await self.session.send("Page.handleJavaScriptDialog", {"accept": True})
+                    self.logger.info("%s: Keyingi alert OK bosildi.", page_name)
+                except asyncio.TimeoutError:
+                    self.logger.debug("%s: Keyingi alert chiqmadi.", page_name)
+            return True
+
+        except asyncio.TimeoutError:
+            self.logger.debug("%s: Alert %s soniya ichida chiqmadi", page_name, timeout)
+
+        except Exception as e:
+            self.logger.error(f"{page_name}: Alert boshqarishda xatolik: {str(e)}")
+            raise
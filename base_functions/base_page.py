@@ -1,20 +1,36 @@
 import os
 import time
+from contextlib import contextmanager
 from datetime import datetime
 
-from colorama import init
 from selenium.webdriver import Keys
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.select import Select
 from selenium.webdriver.support.wait import WebDriverWait
 
-from utils.logger import get_test_name, configure_logging
+from base_functions.instrumentation import action, profiled, track_sleep
+from base_functions.js_scripts import (
+    SMART_CLICK_JS, OPTIONS_SNAPSHOT_JS, SELECT_OPTION_JS,
+    RESOLVE_FIELDS_JS, SET_FIELDS_JS, READ_FIELDS_JS,
+    VISIBLE_FLAGS_JS, READ_ELEMENTS_JS, WAIT_FOR_JS)
+from utils.driver import ensure_script_timeout, is_navigation_error
+from utils.click_strategies import get_click_strategy_store
+from utils.element_cache import ElementCache
+from utils.locators import SHADOW_PATH, FrameTracker, plan_for
+from utils.logger import get_test_id, get_test_name, get_logger
+from utils.profiler import install_command_counter
+from utils.retry import (
+    DEFAULT_RETRY_POLICY, OPTION_TEXT_POLICY, TRANSIENT,
+    classify_failure, is_invalid_selector_error, retry_budget)
+from utils.screenshots import get_screenshot_service
+from utils.text_match import find_best_match
 
 from selenium.common.exceptions import (
-    WebDriverException, NoSuchElementException,
+    WebDriverException, NoSuchElementException, NoSuchFrameException,
     StaleElementReferenceException,
-    TimeoutException, JavascriptException)
+    TimeoutException, JavascriptException, InvalidSelectorException)
 
 from utils.exeption import (
     ElementNotFoundError, ElementStaleError,
@@ -23,25 +39,232 @@ from utils.exeption import (
     ElementNotClickableError)
 
 
-init(autoreset=True)
-
-
 class BasePage:
+    # Element keshi (opt-in): subclassda use_element_cache = True qilinadi
+    use_element_cache = False
+    element_cache_size = 64
+    # Kutishlar sahifa ichidagi MutationObserver bilan (False - WebDriverWait polling)
+    event_waits = True
+    # Locator uchun ishlagan click usulini diskda eslab qolish (CLICK_LEARNING=1 - barcha sahifalar uchun)
+    learn_click_strategy = False
+
     # =======================================================================================
     def __init__(self, driver):
-        self.driver = driver
+        self.driver = install_command_counter(driver)
         self.test_name = get_test_name()
-        self.logger = configure_logging(self.test_name)
+        self.logger = get_logger(self.test_name)
         self.default_timeout = 30
+        # Bitta public amal (ichidagi barcha kutish, scroll va retry lar bilan) uchun umumiy vaqt (None - default_timeout)
+        self.action_timeout = None
         self.default_page_load_timeout = 120
         self.actions = ActionChains
+        self.smart_click = False
+        self.smart_click_timeout = 5
+        self.smart_click_poll = 0.1
+        self.retry_policy = DEFAULT_RETRY_POLICY
+        self.option_retry_policy = OPTION_TEXT_POLICY
+        self.element_cache = ElementCache(self.element_cache_size) if self.use_element_cache else None
+        # Kompozit locatorlar (utils.locators): joriy frame kuzatiladi, ortiqcha switch lar qilinmaydi
+        self.frames = FrameTracker(self.driver)
+        # pytest dan tashqarida har bir sahifa obyekti o'z byudjetiga ega
+        self.test_id = get_test_id() or f"{self.test_name}[{id(self):x}]"
+        self.retry_budget = retry_budget(self.test_id)
+        learning = self.learn_click_strategy or os.getenv("CLICK_LEARNING", "").strip().lower() in ("1", "true", "yes", "on")
+        self.click_strategies = get_click_strategy_store() if learning else None
+        self._action_stack = []
+        self._block_deadline = None
+
+    # =========================================================================================
+
+    @contextmanager
+    def deadline(self, seconds):
+        """
+        Blok ichidagi barcha amallar uchun umumiy deadline:
+            with page.deadline(10):
+                page.click(...)
+                page.get_text(...)
+        """
+        previous = self._block_deadline
+        end_time = time.monotonic() + seconds
+        self._block_deadline = end_time if previous is None else min(previous, end_time)
+        try:
+            yield
+        finally:
+            self._block_deadline = previous
+
+    def _new_deadline(self, timeout=None):
+        """Yuqori darajadagi amal deadline i: amalga berilgan timeout yoki action_timeout, blok deadline idan oshmaydi"""
+        end_time = time.monotonic() + (timeout or self.action_timeout or self.default_timeout)
+        return end_time if self._block_deadline is None else min(end_time, self._block_deadline)
+
+    def _current_deadline(self):
+        if self._action_stack and self._action_stack[0].deadline is not None:
+            return self._action_stack[0].deadline
+        return self._block_deadline
+
+    def _timeout(self, timeout=None):
+        """Kutish vaqti: so'ralgan (yoki default) vaqt, lekin faol amal deadline idan ko'p emas"""
+        timeout = timeout or self.default_timeout
+        deadline = self._current_deadline()
+        if deadline is None:
+            return timeout
+        return round(max(min(timeout, deadline - time.monotonic()), 0), 3)
+
+    # =========================================================================================
+
+    def _retry_sleep(self, attempt, retry_delay=None, policy=None):
+        """
+        Qayta urinishdan oldin kutish. retry_delay berilsa aynan shuncha,
+        aks holda retry policy (backoff + jitter) bo'yicha kutiladi.
+        """
+        policy = policy or self.retry_policy
+        # Test retry byudjeti yoki amal deadline i tugagan bo'lsa kutilmaydi, aks holda kutish qolgan vaqt bilan cheklanadi
+        delay = min(policy.delay(attempt) if retry_delay is None else retry_delay, self.retry_budget.remaining)
+        deadline = self._current_deadline()
+        if deadline is not None:
+            delay = max(min(delay, deadline - time.monotonic()), 0)
+        slept = policy.sleep(attempt, driver=self.driver, test_name=self.test_name, delay=delay)
+        self.retry_budget.charge(slept)
+        track_sleep(self, slept)
+        if self._action_stack:
+            self._action_stack[0].attempt_started = time.monotonic()
+        return slept
+
+    def _can_retry(self, error, attempt, retries, retry_delay=None):
+        """
+        Xatodan keyin qayta urinish kerakmi: muvaffaqiyatsiz urinish vaqti test byudjetidan ayriladi,
+        deterministik xato (utils.retry.classify_failure), byudjet yoki amal deadline i tugasa False.
+        To'xtatilganda qolgan urinishlar tejagan taxminiy vaqt hisobotga yoziladi.
+        """
+        now = time.monotonic()
+        attempt_time = now - self._action_stack[0].attempt_started if self._action_stack else 0.0
+        if attempt:
+            # Birinchi urinish retry emas - faqat qayta urinishlar byudjetdan ayriladi
+            self.retry_budget.charge(attempt_time)
+        if self._action_stack:
+            self._action_stack[0].attempt_started = now
+
+        kind = classify_failure(error)
+        deadline = self._current_deadline()
+        expired = deadline is not None and now >= deadline
+        if kind == TRANSIENT and not self.retry_budget.exhausted and not expired:
+            return True
+
+        remaining = range(attempt, retries - 1)
+        delays = sum(self.retry_policy.delay(n) if retry_delay is None else retry_delay for n in remaining)
+        self.retry_budget.record_stop(kind if kind != TRANSIENT else "budget", len(remaining) * attempt_time + delays)
+        if kind == TRANSIENT and expired:
+            self.logger.warning(f"❗ {self.test_name}: amal deadline i tugadi: {str(error)}")
+        elif kind == TRANSIENT:
+            self.logger.warning(f"❗ {self.test_name}: retry byudjeti ({self.retry_budget.seconds}s) tugadi: {str(error)}")
+        else:
+            self.logger.debug("%s: Deterministik xato, qayta urinilmaydi: %s", self.test_name, type(error).__name__)
+        return False
+
+    # =========================================================================================
+
+    def enable_element_cache(self, maxsize=None):
+        """Shu page uchun element keshini yoqish"""
+        self.element_cache = ElementCache(maxsize or self.element_cache_size)
+        return self.element_cache
+
+    def reset_element_cache(self):
+        """Navigatsiyadan keyin keshni tozalash"""
+        if self.element_cache is not None:
+            self.element_cache.clear()
+
+    def _forget_element(self, locator):
+        """Stale bo'lgan elementni keshdan chiqarish"""
+        if self.element_cache is not None and locator is not None:
+            self.element_cache.invalidate(locator)
+
+    def _cached_element(self, locator, wait_type, timeout):
+        """
+        Keshdagi elementni wait_type shartiga tekshirib qaytaradi.
+        Kesh o'chiq, element yo'q yoki stale bo'lsa None.
+        "presence" uchun bitta arzon buyruq (is_enabled) bilan element hali DOM da ekanligi tekshiriladi.
+        """
+        if self.element_cache is None:
+            return None
+
+        self.element_cache.check_url(lambda: self.driver.current_url)
+        element = self.element_cache.get(locator)
+        if element is None:
+            return None
+
+        conditions = {
+            "visibility": EC.visibility_of,
+            "clickable": EC.element_to_be_clickable
+        }
+        try:
+            if wait_type == "presence":
+                element.is_enabled()
+                return element
+            return WebDriverWait(self.driver, timeout).until(conditions[wait_type](element))
+        except StaleElementReferenceException:
+            self.element_cache.invalidate(locator)
+            return None
+
+    def _in_document(self, locator, timeout):
+        """Kompozit locator frame lariga o'tib, joriy hujjat ichidagi (by, value) ni qaytaradi"""
+        plan = plan_for(locator)
+        self.frames.enter(plan.frames, timeout)
+        return plan.target
+
+    # =========================================================================================
+
+    def _wait_until(self, locator, wait_type, timeout, target=None):
+        """
+        Shartni bitta execute_async_script chaqiruvida kutish (WAIT_FOR_JS, polling yo'q).
+        Shart bajarilmasa TimeoutException - chaqiruvchilar WebDriverWait dagi kabi xatolarni ushlaydi.
+        """
+        by, value = locator if locator is not None else (None, None)
+        # execute_async_script kutish tugashidan oldin uzilmasligi uchun
+        ensure_script_timeout(self.driver, timeout + 5)
+        end_time = time.monotonic() + timeout
+        refreshed = False
+
+        while True:
+            # Umumiy sessiyadagi context driver (utils.browser_contexts): kutish bo'laklanadi,
+            # shunda boshqa context lar buyruqlari navbat kutib qolmaydi
+            slice_ms = int(getattr(self.driver, "wait_slice", 0) * 1000)
+            remaining_ms = max(int((end_time - time.monotonic()) * 1000), 0)
+            call_ms = min(remaining_ms, slice_ms) if slice_ms else remaining_ms
+            try:
+                result = self.driver.execute_async_script(WAIT_FOR_JS, by, value, wait_type, call_ms, target)
+            except JavascriptException as e:
+                # Kutish paytida sahifa qayta yuklandi - qolgan vaqt bilan yangi sahifada davom etamiz
+                if is_navigation_error(e) and time.monotonic() < end_time:
+                    continue
+                raise
+            except TimeoutException:
+                # Sessiyadagi script timeout eslab qolingandan kichik (boshqa kod o'zgartirgan)
+                if refreshed or time.monotonic() >= end_time:
+                    raise
+                ensure_script_timeout(self.driver, timeout + 5, refresh=True)
+                refreshed = True
+                continue
+
+            if isinstance(result, dict) and "error" in result:
+                if is_invalid_selector_error(result["error"]):
+                    raise InvalidSelectorException(f"Notogri locator: {locator}: {result['error']}")
+                raise JavascriptException(result["error"])
+            if result:
+                return result
+            if call_ms < remaining_ms:
+                continue
+            raise TimeoutException(f"'{wait_type}' sharti {timeout}s ichida bajarilmadi: {locator}")
 
     # =========================================================================================
 
     def take_screenshot(self, filename=None):
-        """Fayl nomiga vaqt va test nomini qo'shib, screenshotni saqlash"""
+        """
+        Fayl nomiga vaqt va test nomini qo'shib, screenshotni saqlash.
+        Test threadida faqat PNG olinadi va aynan takror kadr tekshiriladi; qolgani ScreenshotService worker larida.
+        Oldindan band qilingan fayl yo'lini qaytaradi, aynan takror kadr tashlab yuborilsa None.
+        """
         try:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
             test_name = self.test_name if self.test_name != "unknown_test" else "default"
 
             # Fayl nomini yasash
@@ -50,12 +273,12 @@ class BasePage:
             else:
                 filename = f"{test_name}_{timestamp}"
 
-            screenshot_dir = "screenshot"
-            os.makedirs(screenshot_dir, exist_ok=True)
-
-            screenshot_path = os.path.join(screenshot_dir, f"{filename}.png")
-            self.driver.save_screenshot(screenshot_path)
-            self.logger.info(f"Screenshot saved at {screenshot_path}")
+            screenshot_path = get_screenshot_service().capture(self.driver, filename, key=self.test_name)
+            if screenshot_path is None:
+                self.logger.info("Screenshot oldingisi bilan bir xil, saqlanmadi: %s", filename)
+            else:
+                self.logger.info("Screenshot saved at %s", screenshot_path)
+            return screenshot_path
 
         except Exception as e:
             self.logger.error(f"❌ Screenshot olishda xatolik: {str(e)}")
@@ -65,7 +288,7 @@ class BasePage:
         page_name = self.__class__.__name__
         try:
             element.click()
-            self.logger.info(f"⏺ {page_name}: {'Retry' if retry else ''}Click: {locator}")
+            self.logger.info("⏺ %s: %sClick: %s", page_name, 'Retry' if retry else '', locator)
             return True
         except WebDriverException:
             if error_message:
@@ -74,22 +297,51 @@ class BasePage:
 
     # =======================================================================
 
+    def _learned_click(self, locator):
+        """
+        O'rganilgan qisqa yo'l (utils.click_strategies): oldingi ishga tushirishlarda faqat JS click ishlagan
+        locator to'g'ridan-to'g'ri JS bilan bosiladi. Ishlamasa yozuv o'chiriladi va to'liq zanjirga qaytiladi.
+        """
+        page_name = self.__class__.__name__
+        if self.click_strategies.lookup(page_name, locator) != "js":
+            return False
+
+        started = time.monotonic()
+        # Element umuman yo'q bo'lsa xato shu yerda - zanjir ham xuddi shunday tugardi
+        element_dom = self.wait_for_element(locator, wait_type="presence")
+        if element_dom is not None and self._js_click(element_dom, locator):
+            saved = self.click_strategies.record_learned(page_name, locator, time.monotonic() - started)
+            self.logger.debug("%s: O'rganilgan JS click (~%.2fs tejaldi): %s", page_name, saved, locator)
+            return True
+
+        self._forget_element(locator)
+        self.click_strategies.forget(page_name, locator)
+        return False
+
+    def _learn_click(self, locator, strategy, started):
+        """To'liq zanjirda ishlagan usulni eslab qolish"""
+        if self.click_strategies is not None:
+            self.click_strategies.record(self.__class__.__name__, locator, strategy, time.monotonic() - started)
+
+    # =======================================================================
+
     def _js_click(self, element, locator=None, retry=False):
         """JS orqali majburish bosamiz"""
         page_name = self.__class__.__name__
         try:
             self.driver.execute_script("arguments[0].click();", element)
-            self.logger.info(f"⏺ {page_name}: {'Retry' if retry else ''}JS Click: {locator}")
+            self.logger.info("⏺ %s: %sJS Click: %s", page_name, 'Retry' if retry else '', locator)
             return True
         except WebDriverException:
             self.logger.warning(f"❗ {'Retry' if retry else ''}JS Click ishlamadi: {locator}")
 
     # ===============================================================================================================
 
+    @profiled
     def _scroll_to_element(self, element, locator, timeout=None):
         """Scroll qilish funksiyasi"""
         page_name = self.__class__.__name__
-        timeout = timeout or self.default_timeout
+        timeout = self._timeout(timeout)
 
         try:
             if element is None:
@@ -100,7 +352,7 @@ class BasePage:
             self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'auto', block: 'center'});", element)
 
             if element.is_displayed():
-                self.logger.info(f"⏺ {page_name}: Scroll muvaffaqiyatli bajarildi: {locator}")
+                self.logger.info("⏺ %s: Scroll muvaffaqiyatli bajarildi: %s", page_name, locator)
                 return element
 
         except NoSuchElementException as e:
@@ -130,6 +382,7 @@ class BasePage:
 
     # ==============================================================================================
 
+    @action
     def wait_for_element(self, locator, timeout=None, wait_type="presence", error_message=True, screenshot=False):
         """Umumiy kutish funksiyasi:
         * "presence" - DOMda mavjudligini kutadi
@@ -138,7 +391,7 @@ class BasePage:
         """
 
         page_name = self.__class__.__name__
-        timeout = timeout or self.default_timeout
+        timeout = self._timeout(timeout)
 
         wait_types = {
             "presence": EC.presence_of_element_located,
@@ -150,7 +403,16 @@ class BasePage:
             raise ValueError(f"Notogri wait_type: '{wait_type}'. Faqat 'presence', 'visibility', yoki 'clickable', bo'lishi mumkin.")
 
         try:
-            element = WebDriverWait(self.driver, timeout).until(wait_types[wait_type](locator))
+            target = self._in_document(locator, timeout)
+            element = self._cached_element(locator, wait_type, timeout)
+            if element is None:
+                # Shadow yo'lini faqat brauzer ichidagi skript topa oladi
+                if self.event_waits or target[0] == SHADOW_PATH:
+                    element = self._wait_until(target, wait_type, self._timeout(timeout))
+                else:
+                    element = WebDriverWait(self.driver, self._timeout(timeout)).until(wait_types[wait_type](target))
+                if self.element_cache is not None:
+                    self.element_cache.put(locator, element)
             return element
 
         except StaleElementReferenceException as e:
@@ -159,7 +421,7 @@ class BasePage:
                 self.logger.warning(f"❗ {page_name}: {message}: {locator}: {str(e)}")
                 raise ElementStaleError(message, locator, e)
 
-        except TimeoutException as e:
+        except (TimeoutException, NoSuchFrameException) as e:
             message = f"Element {timeout}s ichida {wait_type} shartiga yetmadi."
             if error_message:
                 self.logger.warning(f"{page_name}: {message}: {locator}: {str(e)}")
@@ -181,6 +443,7 @@ class BasePage:
 
     # ===============================================================================================
 
+    @action
     def click_input_by_text(self, locator, element_text, input_type='checkbox'):
         """
         Texti bo‘yicha input (checkbox yoki radio) ni topib bosadi
@@ -196,7 +459,7 @@ class BasePage:
         for element in elements:
             text = element.text.strip()
             if text == element_text:
-                self.logger.info(f"{page_name}: '{element_text}' topildi – tanlanmoqda...")
+                self.logger.info("%s: '%s' topildi – tanlanmoqda...", page_name, element_text)
                 input_element = element.find_element(By.TAG_NAME, 'input')
 
                 if not input_element.is_displayed():
@@ -206,12 +469,12 @@ class BasePage:
                 if not status:
                     try:
                         input_element.click()
-                        self.logger.info(f"{page_name}: Oddiy click bajarildi.")
+                        self.logger.info("%s: Oddiy click bajarildi.", page_name)
                     except WebDriverException:
                         self.logger.warning(f"{page_name}: Oddiy click ishlamadi, JS click sinab ko‘riladi.")
                         self._js_click(input_element)
 
-                self.logger.info(f"{page_name}: '{element_text}' {'tanlandi' if not status else 'avvaldan tanlangan'}")
+                self.logger.info("%s: '%s' %s", page_name, element_text, 'tanlandi' if not status else 'avvaldan tanlangan')
                 return True
 
         message = f"'{element_text}' matnli {input_type} topilmadi."
@@ -220,13 +483,62 @@ class BasePage:
 
     # ===============================================================================================
 
-    def click(self, locator, retries=3, retry_delay=2):
-        """Asosiy click funksiyasi"""
+    @profiled
+    def _smart_click(self, locator, timeout=None):
+        """
+        Presence, scroll, visibility, clickable va occlusion tekshiruvlarini
+        har bir poll uchun bitta JS chaqiruvida bajaradi. Muvaffaqiyatsiz bo'lsa False qaytaradi.
+        """
+        page_name = self.__class__.__name__
+        timeout = self._timeout(timeout or self.smart_click_timeout)
+
+        end_time = time.monotonic() + timeout
+        state = None
+        while True:
+            try:
+                by, value = self._in_document(locator, timeout)
+                result = self.driver.execute_script(SMART_CLICK_JS, by, value) or {}
+            except (JavascriptException, StaleElementReferenceException, NoSuchFrameException) as e:
+                self.logger.debug("%s: Smart click skripti ishlamadi: %s: %s", page_name, locator, e)
+                return False
+
+            state = result.get("state")
+            if state == "ready":
+                if self._click(result["element"], locator, error_message=False):
+                    return True
+                self.logger.debug("%s: Smart click: native click ishlamadi: %s", page_name, locator)
+                return False
+
+            if time.monotonic() >= end_time:
+                break
+            time.sleep(self.smart_click_poll)
+            track_sleep(self, self.smart_click_poll, retry=False)
+
+        self.logger.debug("%s: Smart click: element '%s' holatida qoldi (%ss): %s", page_name, state, timeout, locator)
+        return False
+
+    # ===============================================================================================
+
+    @action
+    def click(self, locator, retries=3, retry_delay=None, smart=None):
+        """
+        Asosiy click funksiyasi
+        smart=True - avval bitta JS chaqiruvli smart click, ishlamasa oddiy zanjir
+        (None bo'lsa self.smart_click ishlatiladi)
+        """
 
         page_name = self.__class__.__name__
-        self.logger.debug(f"{page_name}: Running click: {locator}")
+        self.logger.debug("%s: Running click: %s", page_name, locator)
+
+        smart = self.smart_click if smart is None else smart
+        if smart and self._smart_click(locator):
+            return True
+        if self.click_strategies is not None and self._learned_click(locator):
+            return True
 
+        started = time.monotonic()
         attempt = 0
+        retry_number = 0
         while attempt < retries:
             try:
                 element_dom = self.wait_for_element(locator, wait_type="presence")
@@ -234,28 +546,37 @@ class BasePage:
                 self.wait_for_element(locator, wait_type="visibility")
                 element_clickable = self.wait_for_element(locator, wait_type="clickable")
                 if element_clickable and self._click(element_clickable, locator):
+                    self._learn_click(locator, "native", started)
                     return True
+                self._forget_element(locator)
 
-                time.sleep(retry_delay)
+                self._retry_sleep(retry_number, retry_delay)
+                retry_number += 1
                 self.logger.info("Retry Click sinab ko'riladi...")
                 element_clickable = self.wait_for_element(locator, wait_type="clickable")
                 if element_clickable and self._click(element_clickable, locator, retry=True):
+                    self._learn_click(locator, "retry", started)
                     return True
+                self._forget_element(locator)
 
-                time.sleep(retry_delay)
+                self._retry_sleep(retry_number, retry_delay)
+                retry_number += 1
                 self.logger.info("Majburiy JS Click sinab ko'riladi...")
                 element_dom = self.wait_for_element(locator, wait_type="presence")
                 if element_dom and self._js_click(element_dom, locator):
+                    self._learn_click(locator, "js", started)
                     return True
 
-            except (ElementStaleError, ScrollError, JavaScriptError) as e:
-                self.logger.warning(f"{page_name}: Qayta urinish ({attempt + 1}/{retries}): {str(e)}")
-                time.sleep(retry_delay)
-
             except Exception as e:
-                self.logger.warning(f"Kutilmagan xatolik: {str(e)}: {locator}")
-                self.take_screenshot(f"{page_name.lower()}_click_error")
-                raise
+                self._forget_element(locator)
+                if not self._can_retry(e, attempt, retries, retry_delay):
+                    self.logger.warning(f"Kutilmagan xatolik: {str(e)}: {locator}")
+                    self.take_screenshot(f"{page_name.lower()}_click_error")
+                    raise
+                self.logger.warning(f"{page_name}: Qayta urinish ({attempt + 1}/{retries}): {str(e)}")
+                if attempt + 1 < retries:
+                    self._retry_sleep(retry_number, retry_delay)
+                    retry_number += 1
 
             attempt += 1
 
@@ -267,12 +588,12 @@ class BasePage:
 
     # ==============================================================================================
 
-    def wait_for_element_visible(self, locator, retries=3, retry_delay=2):
+    @action
+    def wait_for_element_visible(self, locator, retries=3, retry_delay=None):
         """Elementni ko'rinishini kutish"""
         page_name = self.__class__.__name__
-        self.logger.debug(f"{page_name}: Running -> wait_for_element_visible: {locator}")
+        self.logger.debug("%s: Running -> wait_for_element_visible: %s", page_name, locator)
 
-        time.sleep(1)
         attempt = 0
         while attempt < retries:
             try:
@@ -281,17 +602,18 @@ class BasePage:
                 element = self.wait_for_element(locator, wait_type='visibility')
 
                 if element:
-                    self.logger.info(f"⏺ {page_name}: Element topildi: {locator}")
+                    self.logger.info("⏺ %s: Element topildi: %s", page_name, locator)
                     return element
 
-            except (ElementStaleError, ScrollError, JavaScriptError) as e:
-                self.logger.warning(f"❗ {page_name}: {e.message}, qayta urinish ({attempt + 1}/{retries})")
-                time.sleep(retry_delay)
-
             except Exception as e:
-                self.logger.warning(f"❗ Kutilmagan xatolik: {str(e)}: {locator}")
-                self.take_screenshot(f"{page_name.lower()}_visible_error")
-                raise
+                self._forget_element(locator)
+                if not self._can_retry(e, attempt, retries, retry_delay):
+                    self.logger.warning(f"❗ Kutilmagan xatolik: {str(e)}: {locator}")
+                    self.take_screenshot(f"{page_name.lower()}_visible_error")
+                    raise
+                self.logger.warning(f"❗ {page_name}: {str(e)}, qayta urinish ({attempt + 1}/{retries})")
+                if attempt + 1 < retries:
+                    self._retry_sleep(attempt, retry_delay)
 
             attempt += 1
 
@@ -302,15 +624,23 @@ class BasePage:
 
     # ==============================================================================================
 
+    @profiled
     def _wait_for_presence_all(self, locator, timeout=None, visible_only=False):
         """Elementlar ro'yxatini kutish"""
         page_name = self.__class__.__name__
-        timeout = timeout or self.default_timeout
+        timeout = self._timeout(timeout)
 
         try:
-            elements = WebDriverWait(self.driver, timeout).until(EC.presence_of_all_elements_located(locator))
+            target = self._in_document(locator, timeout)
+            if self.event_waits or target[0] == SHADOW_PATH:
+                elements = self._wait_until(target, "presence_all", self._timeout(timeout))
+            else:
+                elements = WebDriverWait(self.driver, self._timeout(timeout)).until(
+                    EC.presence_of_all_elements_located(target))
             if visible_only:
-                elements = [element for element in elements if element.is_displayed()]
+                # Har bir element uchun is_displayed() o'rniga bitta JS chaqiruvi
+                flags = self.driver.execute_script(VISIBLE_FLAGS_JS, elements)
+                elements = [element for element, visible in zip(elements, flags) if visible]
             return elements
 
         except StaleElementReferenceException as e:
@@ -318,7 +648,7 @@ class BasePage:
             self.logger.warning(f"❗ {page_name}: {message}: {locator}")
             raise ElementStaleError(message, locator, e)
 
-        except TimeoutException as e:
+        except (TimeoutException, NoSuchFrameException) as e:
             message = "Elementlar ro'yxati topilmadi"
             self.logger.error(f"❌ {page_name}: {message}: {locator}")
             raise ElementNotFoundError(message, locator, e)
@@ -330,12 +660,18 @@ class BasePage:
 
     # ============================================================================================
 
+    @profiled
     def _wait_for_invisibility_of_element(self, element, timeout=None, error_message=None):
         """Element ni ko'rinmas bo'lishini kutish"""
-        timeout = timeout or self.default_timeout
+        timeout = self._timeout(timeout)
 
         try:
+            if self.event_waits:
+                return self._wait_until(None, "element_invisibility", timeout, target=element)
             return WebDriverWait(self.driver, timeout).until(EC.invisibility_of_element(element))
+        except StaleElementReferenceException:
+            # Element DOM dan olib tashlangan - demak ko'rinmaydi
+            return True
         except TimeoutException as e:
             if error_message:
                 self.logger.error(f"❌ Element interfeysdan yo'qolmadi: {e}")
@@ -343,13 +679,18 @@ class BasePage:
 
     # ===============================================================================================
 
+    @profiled
     def _wait_for_invisibility_of_locator(self, locator, timeout=None, raise_error=True):
         """Locator ko'rinmas bo'lishini kutish"""
         page_name = self.__class__.__name__
-        timeout = timeout or self.default_timeout
+        timeout = self._timeout(timeout)
 
         try:
-            WebDriverWait(self.driver, timeout).until(EC.invisibility_of_element_located(locator))
+            target = self._in_document(locator, timeout)
+            if self.event_waits or target[0] == SHADOW_PATH:
+                self._wait_until(target, "invisibility", self._timeout(timeout))
+            else:
+                WebDriverWait(self.driver, self._timeout(timeout)).until(EC.invisibility_of_element_located(target))
             return True
 
         except StaleElementReferenceException as e:
@@ -372,10 +713,11 @@ class BasePage:
 
         # =======================================================================================
 
-    def input_text(self, locator, text=None, retries=3, retry_delay=2, check=False, get_value=False):
+    @action
+    def input_text(self, locator, text=None, retries=3, retry_delay=None, check=False, get_value=False):
         """Elementni topish va matn kiritish funksiyasi"""
         page_name = self.__class__.__name__
-        self.logger.debug(f"{page_name}: Running -> input_text: {locator}")
+        self.logger.debug("%s: Running -> input_text: %s", page_name, locator)
 
         attempt = 0
         while attempt < retries:
@@ -383,7 +725,7 @@ class BasePage:
                 if get_value:
                     element_dom = self.wait_for_element(locator, wait_type='presence')
                     value = element_dom.get_attribute("value")
-                    self.logger.info(f'⏺ Input: get_value -> "{value}"')
+                    self.logger.info('⏺ Input: get_value -> "%s"', value)
                     return value
 
                 if text:
@@ -393,32 +735,34 @@ class BasePage:
 
                     element_clickable.clear()
                     element_clickable.send_keys(text)
-                    self.logger.info(f"Input: send_key -> '{text}'")
+                    self.logger.info("Input: send_key -> '%s'", text)
 
                 if check:
                     element_dom = self.wait_for_element(locator, wait_type='presence')
                     check_text = self.driver.execute_script("return arguments[0].value;", element_dom)
-                    self.logger.info(f"Check Input Value: -> '{check_text}'")
+                    self.logger.info("Check Input Value: -> '%s'", check_text)
                     if check_text != text:
                         self.driver.execute_script(f"arguments[0].value = '{text}';", element_dom)
                 return True
 
-            except ElementStaleError:
+            except Exception as e:
+                self._forget_element(locator)
+                if not self._can_retry(e, attempt, retries, retry_delay):
+                    self.logger.error(f"Matn kiritishda xatolik: {str(e)}: {locator}")
+                    self.take_screenshot(f"{page_name.lower()}_input_error")
+                    raise
                 self.logger.warning(f"❗ Input yangilandi, qayta urinish ({attempt + 1})")
+                if attempt + 1 < retries:
+                    self._retry_sleep(attempt, retry_delay)
                 attempt += 1
-                time.sleep(retry_delay)
-
-            except Exception as e:
-                self.logger.error(f"Matn kiritishda xatolik: {str(e)}: {locator}")
-                self.take_screenshot(f"{page_name.lower()}_input_error")
-                raise
 
     # ==============================================================================================
 
-    def clear_element(self, locator, retries=3, retry_delay=2):
+    @action
+    def clear_element(self, locator, retries=3, retry_delay=None):
         """Elementni tozalash"""
         page_name = self.__class__.__name__
-        self.logger.debug(f"{page_name}: Running -> clear_element: {locator}")
+        self.logger.debug("%s: Running -> clear_element: %s", page_name, locator)
 
         attempt = 0
         while attempt < retries:
@@ -439,16 +783,18 @@ class BasePage:
                     return True
 
                 element.clear()
-                self.logger.info(f"Element muvaffaqiyatli tozalandi: {locator}")
+                self.logger.info("Element muvaffaqiyatli tozalandi: %s", locator)
                 return True
 
-            except ElementStaleError:
+            except Exception as e:
+                self._forget_element(locator)
+                if not self._can_retry(e, attempt, retries, retry_delay):
+                    self.logger.error(f"Element textni o'chirishda kutilmagan xato: {str(e)}")
+                    raise
                 self.logger.warning(f"❗ Element yangilandi, qayta urinish: ({attempt + 1})")
+                if attempt + 1 < retries:
+                    self._retry_sleep(attempt, retry_delay)
                 attempt += 1
-                time.sleep(retry_delay)
-
-            except Exception as e:
-                self.logger.error(f"Element textni o'chirishda kutilmagan xato: {str(e)}")
 
         message = f"❗ Element {retries} urinishdan keyin ham tozalanmadi: {locator}"
         self.logger.warning(message)
@@ -456,6 +802,7 @@ class BasePage:
 
     # =================================================================================================
 
+    @action
     def upload_file(self, locator, file_path):
         """Fayl yuklash funksiyasi"""
         page_name = self.__class__.__name__
@@ -470,10 +817,10 @@ class BasePage:
             file_input = self.driver.find_element(*locator)
 
             if not file_input.is_displayed():
-                self._scroll_to_element(file_input)
+                self._scroll_to_element(file_input, locator)
 
             file_input.send_keys(file_path)
-            self.logger.info(f"✅ Fayl muvaffaqiyatli yuklandi: {file_path}")
+            self.logger.info("✅ Fayl muvaffaqiyatli yuklandi: %s", file_path)
 
         except NoSuchElementException as e:
             message = "Fayl input elementi topilmadi"
@@ -487,11 +834,12 @@ class BasePage:
 
     # ==============================================================================================
 
-    def get_text(self, locator, retries=3, retry_delay=2):
+    @action
+    def get_text(self, locator, retries=3, retry_delay=None):
         """Elementning matnini olish"""
 
         page_name = self.__class__.__name__
-        self.logger.debug(f"{page_name}: Running -> get_text: {locator}")
+        self.logger.debug("%s: Running -> get_text: %s", page_name, locator)
 
         attempt = 0
         while attempt < retries:
@@ -500,17 +848,83 @@ class BasePage:
                 self._scroll_to_element(element_dom, locator)
                 element = self.wait_for_element(locator, wait_type='visibility')
 
-                self.logger.info(f"{page_name}: Element text -> '{element.text}'")
-                return element.text if element else None
+                text = element.text if element else None
+                self.logger.info("%s: Element text -> '%s'", page_name, text)
+                return text
 
-            except ElementStaleError:
+            except Exception as e:
+                self._forget_element(locator)
+                if not self._can_retry(e, attempt, retries, retry_delay):
+                    self.logger.error(f"Element matnini olishda xato: {str(e)}")
+                    raise
                 self.logger.warning(f"Element yangilandi, qayta urinish ({attempt + 1})")
+                if attempt + 1 < retries:
+                    self._retry_sleep(attempt, retry_delay)
                 attempt += 1
-                time.sleep(retry_delay)
 
-            except Exception as e:
-                self.logger.error(f"Element matnini olishda xato: {str(e)}")
-                raise
+    # ================================================================================================
+
+    @profiled
+    def _read_elements_chunk(self, locator, attributes, offset, limit, visible_only):
+        by, value = self._in_document(locator, self._timeout())
+        return self.driver.execute_script(READ_ELEMENTS_JS, by, value, list(attributes), offset, limit, visible_only)
+
+    def iter_elements(self, locator, attributes=(), chunk_size=500, visible_only=False, timeout=None):
+        """
+        Locatorga mos elementlarni bo'laklab o'qiydigan generator.
+        Har bir bo'lak (chunk_size ta element) bitta JS chaqiruvida olinadi, xotira bo'lak hajmi bilan cheklanadi.
+        Har bir qator: {"index", "text", "visible", "attrs": {nom: qiymat}}
+        Birinchi element paydo bo'lguncha timeout gacha kutiladi. Bo'laklar orasida DOM
+        o'zgarsa, keyingi bo'lak yangi holatdan (index bo'yicha) o'qiladi.
+        """
+        page_name = self.__class__.__name__
+        timeout = self._timeout(timeout)
+
+        def first_chunk(_):
+            chunk = self._read_elements_chunk(locator, attributes, 0, chunk_size, visible_only)
+            return chunk if chunk["total"] else False
+
+        try:
+            chunk = WebDriverWait(self.driver, timeout).until(first_chunk)
+        except (TimeoutException, NoSuchFrameException) as e:
+            message = "Elementlar ro'yxati topilmadi"
+            self.logger.error(f"❌ {page_name}: {message}: {locator}")
+            raise ElementNotFoundError(message, locator, e)
+        except JavascriptException as e:
+            message = "Elementlarni o'qish skriptida xatolik"
+            self.logger.error(f"❌ {page_name}: {message}: {locator}: {str(e)}")
+            raise JavaScriptError(message, locator, e)
+
+        offset = 0
+        while True:
+            yield from chunk["rows"]
+            offset += chunk_size
+            if offset >= chunk["total"]:
+                return
+            chunk = self._read_elements_chunk(locator, attributes, offset, chunk_size, visible_only)
+
+    @action
+    def get_texts(self, locator, visible_only=True, chunk_size=500, timeout=None):
+        """Locatorga mos barcha elementlar matnlari ro'yxati (element.text ni tsiklda o'qish o'rniga)"""
+        page_name = self.__class__.__name__
+        texts = [row["text"] for row in self.iter_elements(locator, chunk_size=chunk_size,
+                                                           visible_only=visible_only, timeout=timeout)]
+        self.logger.info("%s: %s ta element matni olindi: %s", page_name, len(texts), locator)
+        return texts
+
+    @action
+    def get_attributes(self, locator, names, visible_only=False, chunk_size=500, timeout=None):
+        """
+        Locatorga mos barcha elementlar atributlari.
+        names - bitta nom (qiymatlar ro'yxati qaytadi) yoki nomlar ro'yxati (dict lar ro'yxati qaytadi)
+        """
+        page_name = self.__class__.__name__
+        single = isinstance(names, str)
+        rows = self.iter_elements(locator, attributes=[names] if single else names, chunk_size=chunk_size,
+                                  visible_only=visible_only, timeout=timeout)
+        values = [row["attrs"][names] if single else row["attrs"] for row in rows]
+        self.logger.info("%s: %s ta element atributi olindi: %s", page_name, len(values), locator)
+        return values
 
     # ================================================================================================
 
@@ -518,7 +932,7 @@ class BasePage:
         input_element = self.wait_for_element(input_locator, wait_type='visibility')
         selected_text = input_element.get_attribute("value")
         if selected_text == element_text:
-            self.logger.info(f"Option avvaldan tanlangan: {selected_text}")
+            self.logger.info("Option avvaldan tanlangan: %s", selected_text)
             return True
         else:
             self.logger.info("Input boshqa qiymatda")
@@ -531,49 +945,92 @@ class BasePage:
 
         for option in options:
             option_text = None
-            for _ in range(3):
+            for attempt in range(3):
                 option_text = option.text.strip()
                 if option_text:
                     break
                 self.logger.warning(f"Option text topilmadi, qayta uriniladi...")
-                time.sleep(1)
+                self._retry_sleep(attempt, policy=self.option_retry_policy)
 
             if option_text == element_str:
-                self.logger.info(f"Element topildi: '{option_text}', click qilinadi...")
+                self.logger.info("Element topildi: '%s', click qilinadi...", option_text)
                 if self._click(option, retry=True):
                     return True
         return False
 
     # ================================================================================================================
 
-    def click_options(self, input_locator, element_text, screenshot=True):
-        """Dropdown bilan ishlash funksiyasi. <select> ichidan <option> ni tanlaydi"""
-        page_name = self.__class__.__name__
-        self.logger.debug(f"{page_name}: Running -> click_options: {element_text} - {input_locator}")
+    def _options_snapshot(self, select_element, input_locator):
+        """
+        <select> ning barcha option matn/qiymatlarini bitta JS chaqiruvida olish.
+        Optionlar hali yuklanmagan (matnlar bo'sh) bo'lsa option_retry_policy bilan qayta uriniladi.
+        <select> bo'lmasa None qaytaradi.
+        """
+        snapshot = None
+        for attempt in range(3):
+            snapshot = self.driver.execute_script(OPTIONS_SNAPSHOT_JS, select_element)
+            if snapshot is None:
+                return None
+            if any(option["text"] for option in snapshot["options"]):
+                return snapshot
+            self.logger.warning(f"Option matnlari topilmadi, qayta uriniladi: {input_locator}")
+            self._retry_sleep(attempt, policy=self.option_retry_policy)
+        return snapshot
 
-        try:
-            # Avvaldan tanlanganligini tekshirish
-            if self._is_choose_dropdown_option(input_locator, element_text):
-                return True
+    # ================================================================================================================
 
-            # Select elementini kutish, kerak bolsa scroll qilish
+    @action
+    def click_options(self, input_locator, element_text, screenshot=True, fuzzy=False):
+        """
+        Dropdown bilan ishlash funksiyasi. <select> ichidan <option> ni tanlaydi.
+        Optionlar bitta JS chaqiruvida olinadi, matn indeksi bo'yicha topiladi va bitta JS chaqiruvida tanlanadi.
+        Moslik: aniq matn -> normallashgan matn -> value -> fuzzy (fuzzy=True bo'lsa, warning bilan).
+        Disabled optionlar tanlanmaydi.
+        """
+        page_name = self.__class__.__name__
+        self.logger.debug("%s: Running -> click_options: %s - %s", page_name, element_text, input_locator)
 
+        try:
             select_element = self.wait_for_element(input_locator, wait_type='visibility')
-            if not select_element.is_displayed():
-                self._scroll_to_element(select_element, input_locator)
+            snapshot = self._options_snapshot(select_element, input_locator)
+
+            if snapshot is None:
+                # <select> emas - eski usul: optionlarni birma-bir tekshirish
+                if self._is_choose_dropdown_option(input_locator, element_text):
+                    return True
+                options = select_element.find_elements(By.TAG_NAME, 'option')
+                if options and self._find_and_click_option(element_text, options):
+                    return True
+                message = f"'{element_text}' option topilmadi"
+                self.logger.warning(message)
+                raise ElementNotFoundError(message, input_locator)
 
-            options = select_element.find_elements(By.TAG_NAME, 'option')
+            options = snapshot["options"]
             if not options:
                 message = "❗ Optionlar ro'yxati bo'sh!"
                 self.logger.warning(f"{page_name}: {message}: {input_locator}")
                 raise ElementNotFoundError(message, input_locator)
 
-            if self._find_and_click_option(element_text, options):
+            option, match_type = find_best_match(options, element_text, fuzzy=fuzzy)
+            if option is None:
+                message = f"'{element_text}' option topilmadi <select> ichidan"
+                self.logger.warning(message)
+                raise ElementNotFoundError(message, input_locator)
+
+            # Avvaldan tanlanganligini tekshirish
+            if option["index"] == snapshot["selectedIndex"]:
+                self.logger.info("Option avvaldan tanlangan: %s", option["text"])
                 return True
 
-            message = f"'{element_text}' option topilmadi <select> ichidan"
-            self.logger.warning(message)
-            raise ElementNotFoundError(message, input_locator)
+            if match_type == "fuzzy":
+                self.logger.warning(f"❗ {page_name}: '{element_text}' aniq topilmadi, taxminiy moslik tanlanadi: "
+                                    f"'{option['text']}' ({input_locator})")
+            self.logger.info("Element topildi (%s): '%s', tanlanmoqda...", match_type, option["text"])
+            value = self.driver.execute_script(SELECT_OPTION_JS, select_element, option["index"])
+            if value != option["value"]:
+                # JS tanlovni sahifa qabul qilmadi - Select orqali
+                Select(select_element).select_by_index(option["index"])
+            return True
 
         except Exception as e:
             message = f"{page_name}: option tanlashda da kutilmagan xatolik - {str(e)}"
@@ -583,6 +1040,114 @@ class BasePage:
 
     # ========================================================================================================
 
+    def _resolve_fields(self, locators):
+        """
+        Locatorlarni bitta JS chaqiruvida topish; topilmaganlari uchun wait_for_element bilan kutiladi.
+        Kompozit locatorli maydonlar bitta frame da bo'lishi kerak.
+        """
+        plans = [plan_for(locator) for locator in locators]
+        if len({plan.frames for plan in plans}) > 1:
+            raise ValueError("fill_form maydonlari turli frame larda - har bir frame uchun alohida chaqiring")
+        if plans:
+            self.frames.enter(plans[0].frames, self._timeout())
+        targets = [plan.target for plan in plans]
+        resolved = self.driver.execute_script(RESOLVE_FIELDS_JS, [list(target) for target in targets])
+        missing = [i for i, info in enumerate(resolved) if info is None]
+        if missing:
+            # Hali paydo bo'lmagan maydonlarni kutib, faqat ularni qayta aniqlaymiz
+            for i in missing:
+                self.wait_for_element(locators[i], wait_type='presence')
+            retry = self.driver.execute_script(RESOLVE_FIELDS_JS, [list(targets[i]) for i in missing])
+            for i, info in zip(missing, retry):
+                if info is None:
+                    raise ElementNotFoundError("Forma maydoni topilmadi", locators[i])
+                resolved[i] = info
+        return resolved
+
+    @staticmethod
+    def _field_matches(kind, expected, state):
+        if kind in ('checkbox', 'radio'):
+            return state["checked"] == expected
+        if kind == 'select':
+            return state["selectedIndex"] == expected
+        return state["value"] == expected
+
+    def _fill_field(self, locator, kind, value, fuzzy=False):
+        """Bitta maydonni oddiy (send_keys/click) usulda to'ldirish"""
+        if kind == 'file':
+            return self.upload_file(locator, value)
+        if kind == 'select':
+            return self.click_options(locator, value, fuzzy=fuzzy)
+        if kind in ('checkbox', 'radio'):
+            element = self.wait_for_element(locator, wait_type='clickable')
+            if element.is_selected() != bool(value):
+                self.click(locator)
+            return True
+        if not value:
+            return self.clear_element(locator)
+        return self.input_text(locator, str(value))
+
+    @action
+    def fill_form(self, fields, fuzzy=False):
+        """
+        Formani bitta chaqiruvda to'ldirish. fields - {locator: qiymat} (tartib saqlanadi):
+        * matnli input/textarea - str
+        * checkbox/radio - True/False
+        * <select> - option matni (click_options kabi moslik, fuzzy=True bo'lsa taxminiy ham)
+        * file input - fayl yo'li (send_keys orqali)
+        Maydonlar bitta JS chaqiruvida topiladi, qiymatlar native input/change hodisalari bilan
+        o'rnatiladi va bitta chaqiruvda tekshiriladi. Qabul qilinmagan maydonlar send_keys bilan to'ldiriladi.
+        """
+        page_name = self.__class__.__name__
+        items = list(fields.items())
+        self.logger.debug("%s: Running -> fill_form: %s ta maydon", page_name, len(items))
+
+        try:
+            resolved = self._resolve_fields([locator for locator, _ in items])
+
+            scripted, fallback = [], []
+            for (locator, value), info in zip(items, resolved):
+                kind = info["kind"]
+                if kind == 'select':
+                    option, match_type = find_best_match(info["options"], value, fuzzy=fuzzy)
+                    if option is None:
+                        raise ElementNotFoundError(f"'{value}' option topilmadi <select> ichidan", locator)
+                    if match_type == "fuzzy":
+                        self.logger.warning(f"❗ {page_name}: '{value}' aniq topilmadi, taxminiy moslik tanlanadi: "
+                                            f"'{option['text']}' ({locator})")
+                    scripted.append((locator, value, info["element"], kind, option["index"]))
+                elif kind in ('checkbox', 'radio'):
+                    scripted.append((locator, value, info["element"], kind, bool(value)))
+                elif kind == 'text' and not info["readonly"]:
+                    scripted.append((locator, value, info["element"], kind, "" if value is None else str(value)))
+                else:
+                    # file input va boshqa elementlar faqat send_keys bilan
+                    fallback.append((locator, value, kind))
+
+            if scripted:
+                self.driver.execute_script(SET_FIELDS_JS, [[element, kind, expected]
+                                                           for _, _, element, kind, expected in scripted])
+                states = self.driver.execute_script(READ_FIELDS_JS, [element for _, _, element, _, _ in scripted])
+                for (locator, value, _, kind, expected), state in zip(scripted, states):
+                    if not self._field_matches(kind, expected, state):
+                        self.logger.warning(f"❗ {page_name}: JS qiymatni sahifa qabul qilmadi, send_keys bilan: {locator}")
+                        fallback.append((locator, value, kind))
+
+            for locator, value, kind in fallback:
+                self._fill_field(locator, kind, value, fuzzy=fuzzy)
+
+            self.logger.info("⏺ %s: Forma to'ldirildi: %s ta maydon (%s ta send_keys bilan)",
+                             page_name, len(items), len(fallback))
+            return True
+
+        except Exception as e:
+            self.logger.error(f"{page_name}: Formani to'ldirishda xatolik: {str(e)}")
+            self.take_screenshot(f"{page_name.lower()}_fill_form_error")
+            raise
+
+    # ========================================================================================================
+
+    @profiled
     def _check_dropdown_closed(self, options_locator, retry_count=3):
         """Dropdown yopilganini tekshirish"""
         page_name = self.__class__.__name__
@@ -621,37 +1186,42 @@ class BasePage:
 
     # ==================================================================================================================
 
+    @action
     def handle_alert(self, accept=True, second_alert=False, timeout=10):
         """
         Alert oynasini boshqarish
         accept=True - OK bosiladi, aks holda Cancel
-        handle_followup=True - Keyingi alert chiqsa avtomatik OK bosadi
+        second_alert=True - Keyingi alert chiqsa avtomatik OK bosadi.
+        Har bir alert timeout gacha kutiladi: keyingi alert yangi deadline oladi (page.deadline bloki bundan mustasno)
         """
         page_name = self.__class__.__name__
 
         try:
-            WebDriverWait(self.driver, timeout).until(EC.alert_is_present())
+            WebDriverWait(self.driver, self._timeout(timeout)).until(EC.alert_is_present())
             alert = self.driver.switch_to.alert
-            self.logger.info(f"{page_name}: Alert matni: '{alert.text.strip()}'")
+            self.logger.info("%s: Alert matni: '%s'", page_name, alert.text.strip())
 
             action = 'accept' if accept else 'dismiss'
             getattr(alert, action)()
-            self.logger.info(f"{page_name}: {'OK' if accept else 'Cancel'} bosildi.")
+            self.logger.info("%s: %s bosildi.", page_name, 'OK' if accept else 'Cancel')
 
             # Keyingi alert (Agar chiqsa, OK qilish)
             if second_alert:
+                # Birinchi alert kutishiga ketgan vaqt keyingi alert kutishini qisqartirmaydi
+                if self._action_stack:
+                    self._action_stack[0].deadline = self._new_deadline(timeout)
                 try:
-                    WebDriverWait(self.driver, timeout).until(EC.alert_is_present())
+                    WebDriverWait(self.driver, self._timeout(timeout)).until(EC.alert_is_present())
                     second = self.driver.switch_to.alert
-                    self.logger.info(f"{page_name}: Keyingi alert matni: '{second.text.strip()}'")
+                    self.logger.info("%s: Keyingi alert matni: '%s'", page_name, second.text.strip())
                     second.accept()
-                    self.logger.info(f"{page_name}: Keyingi alert OK bosildi.")
+                    self.logger.info("%s: Keyingi alert OK bosildi.", page_name)
                 except TimeoutException:
-                    self.logger.debug(f"{page_name}: Keyingi alert chiqmadi.")
+                    self.logger.debug("%s: Keyingi alert chiqmadi.", page_name)
             return True
 
         except TimeoutException:
-            self.logger.debug(f"{page_name}: Alert {timeout} soniya ichida chiqmadi")
+            self.logger.debug("%s: Alert %s soniya ichida chiqmadi", page_name, timeout)
 
         except Exception as e:
             self.logger.error(f"{page_name}: Alert boshqarishda xatolik: {str(e)}")
@@ -0,0 +1,107 @@
+import functools
+import inspect
+import time
+from datetime import datetime
+
+from utils.events import emit_event
+from utils.profiler import command_count, profiler
+
+LOCATOR_ARGS = ("locator", "input_locator", "options_locator")
+
+
+class ActionContext:
+    """Bitta amal chaqiruvi davomida yig'iladigan ko'rsatkichlar"""
+    __slots__ = ("retries", "sleep", "attempt_started", "deadline")
+
+    def __init__(self, deadline=None):
+        self.retries = 0
+        self.sleep = 0.0
+        # Joriy urinish boshlangan vaqt (retry byudjeti uchun)
+        self.attempt_started = time.monotonic()
+        # Yuqori darajadagi amal deadline i (time.monotonic): ichki kutishlar undan oshmaydi
+        self.deadline = deadline
+
+
+def _instrument(method, event):
+    params = list(inspect.signature(method).parameters)[1:]
+    locator_index = next((i for i, name in enumerate(params) if name in LOCATOR_ARGS), None)
+    locator_name = params[locator_index] if locator_index is not None else None
+    timeout_index = params.index("timeout") if "timeout" in params else None
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        stack = self._action_stack
+        top_level = not stack
+        if not top_level and not profiler.enabled:
+            return method(self, *args, **kwargs)
+
+        locator = None
+        if locator_name is not None:
+            locator = args[locator_index] if len(args) > locator_index else kwargs.get(locator_name)
+
+        deadline = None
+        if top_level:
+            timeout = None
+            if timeout_index is not None:
+                timeout = args[timeout_index] if len(args) > timeout_index else kwargs.get("timeout")
+            deadline = self._new_deadline(timeout)
+
+        context = ActionContext(deadline)
+        stack.append(context)
+        commands_before = command_count(self.driver)
+        started = time.perf_counter()
+        outcome, error = "ok", None
+        try:
+            result = method(self, *args, **kwargs)
+            if result is False:
+                outcome = "fail"
+            return result
+        except Exception as e:
+            outcome, error = "error", type(e).__name__
+            raise
+        finally:
+            duration = time.perf_counter() - started
+            commands = command_count(self.driver) - commands_before
+            stack.pop()
+            page = self.__class__.__name__
+            locator_str = str(locator) if locator is not None else None
+
+            profiler.record(page, method.__name__, locator_str, duration, commands,
+                            context.retries, context.sleep, outcome != "ok", top_level)
+            if event and top_level:
+                emit_event({
+                    "ts": datetime.now().isoformat(timespec="milliseconds"),
+                    "test": getattr(self, "test_name", None),
+                    "page": page,
+                    "method": method.__name__,
+                    "locator": locator_str,
+                    "duration_ms": round(duration * 1000, 3),
+                    "attempts": context.retries + 1,
+                    "commands": commands,
+                    "outcome": outcome,
+                    "error": error,
+                })
+
+    return wrapper
+
+
+def action(method):
+    """
+    Public BasePage amali uchun dekorator: amal tugagach bitta hodisa yoziladi
+    (method, locator, davomiylik, urinishlar soni, natija) va profilerga qo'shiladi.
+    Ichma-ich chaqirilgan amallar (masalan click ichidagi wait_for_element) alohida hodisa yozmaydi.
+    """
+    return _instrument(method, event=True)
+
+
+def profiled(method):
+    """Private kutish/yordamchi metodlar uchun: faqat profilerga yoziladi"""
+    return _instrument(method, event=False)
+
+
+def track_sleep(page, seconds, retry=True):
+    """Faol amallar stekiga kutish vaqti (va retry) qo'shish"""
+    for context in page._action_stack:
+        context.sleep += seconds
+        if retry:
+            context.retries += 1
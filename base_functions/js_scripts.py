@@ -0,0 +1,365 @@
+"""
+BasePage ichida ishlatiladigan JavaScript skriptlar.
+Har bir skript bitta execute_script chaqiruvida bajariladi.
+"""
+
+# Locator (by, value) ni brauzer ichida topish. Boshqa skriptlar boshiga qo'shiladi.
+FIND_ELEMENT_JS = """
+function __findAll(by, value, root) {
+    root = root || document;
+    switch (by) {
+        case 'css selector':
+            return Array.prototype.slice.call(root.querySelectorAll(value));
+        case 'id':
+            return Array.prototype.slice.call(root.querySelectorAll('[id="' + CSS.escape(value) + '"]'));
+        case 'name':
+            return Array.prototype.slice.call(root.querySelectorAll('[name="' + CSS.escape(value) + '"]'));
+        case 'class name':
+            // ShadowRoot da getElementsByClassName yo'q
+            return Array.prototype.slice.call(root.getElementsByClassName ? root.getElementsByClassName(value)
+                : root.querySelectorAll('.' + value.trim().split(/\\s+/).map(CSS.escape).join('.')));
+        case 'tag name':
+            return Array.prototype.slice.call(root.getElementsByTagName ? root.getElementsByTagName(value)
+                : root.querySelectorAll(value));
+        case 'shadow path':
+            // [[by, value], ...]: oxirgisidan oldingi qadamlar shadow host lar (utils.locators)
+            var steps = JSON.parse(value), scope = root;
+            for (var s = 0; s < steps.length - 1; s++) {
+                var host = __find(steps[s][0], steps[s][1], scope);
+                if (!host || !host.shadowRoot) { return []; }
+                scope = host.shadowRoot;
+            }
+            return __findAll(steps[steps.length - 1][0], steps[steps.length - 1][1], scope);
+        case 'xpath':
+            var snapshot = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) { nodes.push(snapshot.snapshotItem(i)); }
+            return nodes;
+        case 'link text':
+        case 'partial link text':
+            return Array.prototype.slice.call(root.querySelectorAll('a')).filter(function (a) {
+                var text = (a.innerText || a.textContent || '').trim();
+                return by === 'link text' ? text === value : text.indexOf(value) !== -1;
+            });
+    }
+    throw new Error('Nomalum locator turi: ' + by);
+}
+function __find(by, value, root) {
+    return __findAll(by, value, root)[0] || null;
+}
+"""
+
+# Element ko'rinishi va holati (selenium is_displayed / element_to_be_clickable ga yaqin, tezkor variant).
+# __isVisible: display/visibility/opacity, nol o'lcham va overflow: hidden|clip ajdod tashqarisida qolish.
+# Overflow faqat containing block zanjiri bo'ylab: position: absolute element static ajdodlardan chiqadi,
+# fixed - kesilmaydi. overflow: auto|scroll ichidagi element ko'rinadi deb olinadi (scroll qilish mumkin).
+# Selenium atomidan farqlari: opacity faqat elementning o'zida tekshiriladi, transform/contain bilan
+# hosil bo'lgan containing block lar va clip-path hisobga olinmaydi.
+# __isDisabled: disabled atributi va :disabled (disabled <fieldset> ichidagi boshqaruv elementlari, birinchi
+# <legend> dan tashqari) - W3C "Is Element Enabled" bilan bir xil.
+IS_VISIBLE_JS = """
+function __isVisible(el) {
+    if (!el.isConnected) { return false; }
+    var style = window.getComputedStyle(el);
+    if (style.display === 'none' || style.visibility === 'hidden' || parseFloat(style.opacity) === 0) {
+        return false;
+    }
+    var rect = el.getBoundingClientRect();
+    if (!(rect.width > 0 && rect.height > 0)) { return false; }
+    var position = style.position;
+    for (var p = el.parentElement; p && p !== document.documentElement; p = p.parentElement) {
+        if (position === 'fixed') { return true; }
+        var parentStyle = window.getComputedStyle(p);
+        // absolute element uchun static ajdod containing block emas - uni kesmaydi
+        if (position === 'absolute' && parentStyle.position === 'static') { continue; }
+        var clipX = parentStyle.overflowX === 'hidden' || parentStyle.overflowX === 'clip';
+        var clipY = parentStyle.overflowY === 'hidden' || parentStyle.overflowY === 'clip';
+        if (clipX || clipY) {
+            var box = p.getBoundingClientRect();
+            if (clipX && (rect.right <= box.left || rect.left >= box.right)) { return false; }
+            if (clipY && (rect.bottom <= box.top || rect.top >= box.bottom)) { return false; }
+        }
+        position = parentStyle.position;
+    }
+    return true;
+}
+function __isDisabled(el) {
+    return !!el.disabled || (typeof el.matches === 'function' && el.matches(':disabled'));
+}
+"""
+
+# Nuqtadagi element target ni yopadimi: null - yopmaydi, aks holda yopgan element.
+# Shadow DOM ichida hit test elementning o'z root ida qilinadi, ajdodlar shadow host lar orqali tekshiriladi
+HIT_TEST_JS = """
+function __obscuredBy(el, x, y) {
+    var root = el.getRootNode ? el.getRootNode() : document;
+    var hit = (root.elementFromPoint ? root : document).elementFromPoint(x, y);
+    for (var node = hit; node; node = node.parentNode || node.host) {
+        if (node === el) { return null; }
+    }
+    return hit;
+}
+"""
+
+# Smart click: presence -> scroll -> visibility -> clickable -> occlusion, hammasi bitta chaqiruvda.
+# Natija: {state: 'missing' | 'hidden' | 'disabled' | 'obscured' | 'ready', element: WebElement}
+SMART_CLICK_JS = FIND_ELEMENT_JS + IS_VISIBLE_JS + HIT_TEST_JS + """
+var el = __find(arguments[0], arguments[1]);
+if (!el) { return {state: 'missing'}; }
+
+var rect = el.getBoundingClientRect();
+var inView = rect.top >= 0 && rect.left >= 0 &&
+    rect.bottom <= (window.innerHeight || document.documentElement.clientHeight) &&
+    rect.right <= (window.innerWidth || document.documentElement.clientWidth);
+if (!inView) {
+    el.scrollIntoView({behavior: 'auto', block: 'center'});
+    rect = el.getBoundingClientRect();
+}
+
+if (!__isVisible(el)) { return {state: 'hidden', element: el}; }
+if (__isDisabled(el)) { return {state: 'disabled', element: el}; }
+
+var hit = __obscuredBy(el, rect.left + rect.width / 2, rect.top + rect.height / 2);
+if (hit) {
+    return {state: 'obscured', element: el, obscured_by: hit.tagName.toLowerCase()};
+}
+return {state: 'ready', element: el};
+"""
+
+# <select> ning barcha optionlari bitta chaqiruvda: {value, selectedIndex, options: [{index, text, value}]}
+OPTIONS_SNAPSHOT_JS = """
+var select = arguments[0];
+if (!select || !select.options) { return null; }
+var options = [];
+for (var i = 0; i < select.options.length; i++) {
+    var option = select.options[i];
+    options.push({index: i, text: (option.text || '').trim(), value: option.value, disabled: option.disabled});
+}
+return {value: select.value, selectedIndex: select.selectedIndex, options: options};
+"""
+
+# Optionni index bo'yicha tanlash va input/change hodisalarini yuborish; yangi qiymatni qaytaradi
+SELECT_OPTION_JS = """
+var select = arguments[0], index = arguments[1];
+select.selectedIndex = index;
+select.options[index].selected = true;
+select.dispatchEvent(new Event('input', {bubbles: true}));
+select.dispatchEvent(new Event('change', {bubbles: true}));
+return select.value;
+"""
+
+# fill_form: locatorlar ro'yxatini bitta chaqiruvda topish va maydon turini aniqlash
+# Natija: har bir locator uchun null yoki {element, kind, options, readonly}
+RESOLVE_FIELDS_JS = FIND_ELEMENT_JS + """
+var locators = arguments[0], result = [];
+for (var i = 0; i < locators.length; i++) {
+    var el = __find(locators[i][0], locators[i][1]);
+    if (!el) { result.push(null); continue; }
+    var tag = el.tagName.toLowerCase(), type = (el.type || '').toLowerCase();
+    var kind = 'text', options = null;
+    if (tag === 'select') {
+        kind = 'select';
+        options = [];
+        for (var j = 0; j < el.options.length; j++) {
+            options.push({index: j, text: (el.options[j].text || '').trim(), value: el.options[j].value,
+                          disabled: el.options[j].disabled});
+        }
+    } else if (type === 'checkbox' || type === 'radio') {
+        kind = type;
+    } else if (type === 'file') {
+        kind = 'file';
+    } else if (tag !== 'input' && tag !== 'textarea') {
+        kind = 'other';
+    }
+    result.push({element: el, kind: kind, options: options, readonly: !!(el.readOnly || el.disabled)});
+}
+return result;
+"""
+
+# fill_form: qiymatlarni native setter va input/change hodisalari bilan o'rnatish
+# arguments[0] = [[element, kind, qiymat], ...]
+SET_FIELDS_JS = """
+function fire(el) {
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+}
+var fields = arguments[0];
+for (var i = 0; i < fields.length; i++) {
+    var el = fields[i][0], kind = fields[i][1], value = fields[i][2];
+    if (kind === 'checkbox' || kind === 'radio') {
+        if (el.checked !== value) { el.click(); }
+    } else if (kind === 'select') {
+        el.selectedIndex = value;
+        fire(el);
+    } else {
+        var proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        var setter = Object.getOwnPropertyDescriptor(proto, 'value').set;
+        el.focus();
+        setter.call(el, value);
+        fire(el);
+        el.blur();
+    }
+}
+"""
+
+# fill_form: barcha maydonlar holatini bitta chaqiruvda o'qish
+READ_FIELDS_JS = """
+return arguments[0].map(function (el) {
+    return {
+        value: el.value,
+        checked: !!el.checked,
+        selectedIndex: el.selectedIndex === undefined ? null : el.selectedIndex
+    };
+});
+"""
+
+# Elementlar ro'yxatining ko'rinish holatlari: [true, false, ...]
+VISIBLE_FLAGS_JS = IS_VISIBLE_JS + """
+return arguments[0].map(function (el) { return __isVisible(el); });
+"""
+
+# Locatorga mos elementlarning bir sahifasi (offset, limit) bitta chaqiruvda:
+# {total, rows: [{index, text, visible, attrs: {nom: qiymat}}]}
+# Ko'rinmas elementlar matni selenium kabi bo'sh qaytadi.
+READ_ELEMENTS_JS = FIND_ELEMENT_JS + IS_VISIBLE_JS + """
+var by = arguments[0], value = arguments[1], names = arguments[2];
+var offset = arguments[3], limit = arguments[4], visibleOnly = arguments[5];
+var all = __findAll(by, value), rows = [];
+var end = Math.min(all.length, offset + limit);
+for (var i = offset; i < end; i++) {
+    var el = all[i], visible = __isVisible(el);
+    if (visibleOnly && !visible) { continue; }
+    var attrs = {};
+    for (var j = 0; j < names.length; j++) {
+        // selenium get_attribute kabi: avval property, bo'lmasa atribut
+        var prop = el[names[j]];
+        if (typeof prop === 'boolean') { attrs[names[j]] = prop ? 'true' : null; }
+        else if (typeof prop === 'string' || typeof prop === 'number') { attrs[names[j]] = String(prop); }
+        else { attrs[names[j]] = el.getAttribute(names[j]); }
+    }
+    rows.push({index: i, text: visible ? (el.innerText || '').trim() : '', visible: visible, attrs: attrs});
+}
+return {total: all.length, rows: rows};
+"""
+
+# Shart bajarilishini polling siz kutish: __waitFor(by, value, waitType, timeoutMs, target) -> Promise
+# waitType: presence | visibility | clickable (element qaytadi), presence_all (elementlar ro'yxati),
+# invisibility (locator, true qaytadi), element_invisibility (target elementi, true qaytadi).
+# Vaqt tugasa null. DOM o'zgarishlari MutationObserver bilan kuzatiladi; faqat CSS bilan
+# o'zgaradigan holatlar (transition/animation) uchun siyrak zaxira tekshiruv bor.
+WAIT_CONDITION_JS = """
+function __check(by, value, waitType, target) {
+    if (waitType === 'element_invisibility') { return !target.isConnected || !__isVisible(target); }
+    if (waitType === 'presence_all') {
+        var all = __findAll(by, value);
+        return all.length ? all : null;
+    }
+    var el = __find(by, value);
+    if (waitType === 'invisibility') { return !el || !__isVisible(el); }
+    if (!el) { return null; }
+    if (waitType === 'presence') { return el; }
+    if (!__isVisible(el)) { return null; }
+    if (waitType === 'clickable' && __isDisabled(el)) { return null; }
+    return el;
+}
+function __waitFor(by, value, waitType, timeoutMs, target) {
+    return new Promise(function (resolve) {
+        var found = __check(by, value, waitType, target);
+        if (found) { resolve(found); return; }
+
+        var observer, timer, fallback;
+        function finish(result) {
+            observer.disconnect();
+            clearTimeout(timer);
+            clearInterval(fallback);
+            document.removeEventListener('transitionend', recheck, true);
+            document.removeEventListener('animationend', recheck, true);
+            resolve(result);
+        }
+        var options = {childList: true, subtree: true, attributes: true, characterData: true};
+        function observeShadow() {
+            // Shadow root ichidagi o'zgarishlar hujjat observeriga ko'rinmaydi - yo'ldagi root lar ham kuzatiladi
+            var steps = JSON.parse(value), scope = document;
+            for (var s = 0; s < steps.length - 1; s++) {
+                var host = __find(steps[s][0], steps[s][1], scope);
+                if (!host || !host.shadowRoot) { return; }
+                scope = host.shadowRoot;
+                observer.observe(scope, options);
+            }
+        }
+        function recheck() {
+            var result = __check(by, value, waitType, target);
+            if (result) { finish(result); }
+            else if (by === 'shadow path') { observeShadow(); }
+        }
+        observer = new MutationObserver(recheck);
+        observer.observe(document.documentElement || document, options);
+        if (by === 'shadow path') { observeShadow(); }
+        document.addEventListener('transitionend', recheck, true);
+        document.addEventListener('animationend', recheck, true);
+        fallback = setInterval(recheck, 1000);
+        timer = setTimeout(function () { finish(null); }, timeoutMs);
+    });
+}
+"""
+
+# BasePage kutishlari: bitta execute_async_script chaqiruvida shart bajarilguncha yoki vaqt tugaguncha
+# arguments: by, value, waitType, timeoutMs, target (element_invisibility uchun), callback
+# Natija: element / elementlar / true, vaqt tugasa null, JS xatosida {error: matn}
+WAIT_FOR_JS = FIND_ELEMENT_JS + IS_VISIBLE_JS + WAIT_CONDITION_JS + """
+var done = arguments[arguments.length - 1];
+try {
+    __waitFor(arguments[0], arguments[1], arguments[2], arguments[3], arguments[4]).then(done, function (e) {
+        done({error: String(e)});
+    });
+} catch (e) {
+    done({error: String(e)});
+}
+"""
+
+# ---------------------------------------------------------------------------------
+# AsyncBasePage (CDP) funksiyalari: Runtime.evaluate / Runtime.callFunctionOn uchun
+
+# (by, value, waitType, timeoutMs) -> Promise<element | true | null>
+CDP_WAIT_FN = ("function (by, value, waitType, timeoutMs) {\n" + FIND_ELEMENT_JS + IS_VISIBLE_JS
+               + WAIT_CONDITION_JS + "return __waitFor(by, value, waitType, timeoutMs);\n}")
+
+# this = element: ko'rinish sohasiga olib kelish va markaz koordinatasi, ustini boshqa element yopganmi
+CDP_CLICK_POINT_FN = """
+function () {
+""" + HIT_TEST_JS + """
+    this.scrollIntoView({behavior: 'auto', block: 'center'});
+    var rect = this.getBoundingClientRect();
+    var x = rect.left + rect.width / 2, y = rect.top + rect.height / 2;
+    return {x: x, y: y, obscured: !!__obscuredBy(this, x, y)};
+}
+"""
+
+# this = element: JS click (yopilgan element uchun zaxira)
+CDP_JS_CLICK_FN = "function () { this.click(); }"
+
+# this = input: fokus va qiymatni tozalash (keyin Input.insertText matn kiritadi)
+CDP_FOCUS_CLEAR_FN = """
+function () {
+    this.focus();
+    var proto = this.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(this, '');
+    this.dispatchEvent(new Event('input', {bubbles: true}));
+}
+"""
+
+# this = element: ko'rinadigan matn (selenium element.text ga yaqin)
+CDP_TEXT_FN = "function () { return (this.innerText || this.textContent || '').trim(); }"
+
+# this = element: joriy value
+CDP_VALUE_FN = "function () { return this.value; }"
+
+# this = element: value ni to'g'ridan-to'g'ri qo'yish (input_text check=True da kiritilgan matn mos kelmasa)
+CDP_SET_VALUE_FN = """
+function (value) {
+    var proto = this.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(this, value);
+    this.dispatchEvent(new Event('input', {bubbles: true}));
+    this.dispatchEvent(new Event('change', {bubbles: true}));
+}
+"""
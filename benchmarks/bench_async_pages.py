@@ -0,0 +1,79 @@
+"""
+AsyncBasePage: bitta jarayon va bitta event loop da ko'plab brauzer sessiyalari.
+Soxta CDP serverida (har bir buyruqqa kechikish bilan) bir xil ssenariy
+ketma-ket va parallel (asyncio.gather) bajariladi.
+
+Ishga tushirish:
+    python -m benchmarks.bench_async_pages
+    python -m benchmarks.bench_async_pages --sessions 50 --latency 0.01
+"""
+import argparse
+import asyncio
+import logging
+import threading
+import time
+
+from selenium.webdriver.common.by import By
+
+from base_functions.async_base_page import AsyncBasePage
+from benchmarks.fake_cdp import FakeCDPServer
+from utils.cdp import CDPConnection
+
+NAME = (By.NAME, "first_name")
+SUBMIT = (By.ID, "submit")
+RESULT = (By.ID, "result")
+
+
+def build_page(dom):
+    """Forma: input, submit (alert chiqaradi va natija matnini yozadi)"""
+    dom.add(NAME, tag="input")
+    result = dom.add(RESULT, tag="div", text="")
+
+    def submit(element):
+        dom.alerts.append("Ma'lumot saqlandi")
+        result.text = "Saqlandi"
+    dom.add(SUBMIT, tag="button", text="Submit", on_click=submit)
+
+
+async def scenario(connection):
+    session = await connection.new_session(url="http://localhost/form")
+    page = AsyncBasePage(session)
+    page.logger.setLevel(logging.CRITICAL)
+    await page.input_text(NAME, "Bexruz")
+    await page.click(SUBMIT)
+    await page.handle_alert()
+    text = await page.get_text(RESULT)
+    await session.close()
+    return text
+
+
+async def run(sessions, latency, parallel):
+    async with FakeCDPServer(latency=latency) as server:
+        server.on_target(build_page)
+        connection = await CDPConnection.connect(server.ws_url)
+        start = time.perf_counter()
+        if parallel:
+            results = await asyncio.gather(*(scenario(connection) for _ in range(sessions)))
+        else:
+            results = [await scenario(connection) for _ in range(sessions)]
+        elapsed = time.perf_counter() - start
+        await connection.close()
+    assert results == ["Saqlandi"] * sessions, results
+    return elapsed, sum(server.commands.values())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=30)
+    parser.add_argument("--latency", type=float, default=0.005, help="har bir CDP buyrug'i kechikishi (soniya)")
+    args = parser.parse_args(argv)
+
+    threads = threading.active_count()
+    for label, parallel in (("ketma-ket", False), ("parallel", True)):
+        elapsed, commands = asyncio.run(run(args.sessions, args.latency, parallel))
+        print(f"{label:>10}: {args.sessions} sessiya {elapsed:6.2f}s  "
+              f"({commands} buyruq, {threading.active_count() - threads} qo'shimcha thread)")
+
+
+if __name__ == "__main__":
+    main()
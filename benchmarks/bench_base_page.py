@@ -0,0 +1,199 @@
+"""
+BasePage issiq yo'llari uchun micro-benchmark (brauzer va tarmoqsiz).
+Har bir amal uchun o'rtacha vaqt va WebDriver buyruqlari soni o'lchanadi.
+
+Ishga tushirish:
+    python -m benchmarks.bench_base_page                  # natijalar jadvali
+    python -m benchmarks.bench_base_page --latency 0.02   # har bir buyruqqa 20ms kechikish
+    python -m benchmarks.bench_base_page --check          # buyruqlar byudjetidan oshsa exit 1
+"""
+import argparse
+import logging
+import sys
+import time
+
+from selenium.webdriver.common.by import By
+
+from base_functions.base_page import BasePage
+from benchmarks.fake_driver import FakeDriver
+
+BUTTON = (By.ID, "submit")
+INPUT = (By.NAME, "first_name")
+SELECT = (By.ID, "country")
+DROPDOWN_OPTIONS = (By.CSS_SELECTOR, "ul.dropdown-menu")
+OPTIONS = [f"Country {i}" for i in range(50)]
+FORM_INPUTS = [(By.NAME, f"field_{i}") for i in range(6)]
+AGREE = (By.ID, "agree")
+TABLE_CELLS = (By.CSS_SELECTOR, "table#users td")
+TABLE_ROWS = 1000
+
+# Bitta amal uchun WebDriver buyruqlari byudjeti (regressiyani ushlash uchun)
+BUDGETS = {
+    "click": 5,
+    "input_text": 5,
+    "click_options": 3,
+    "_check_dropdown_closed": 1,
+    "handle_alert": 4,
+    "fill_form": 3,
+    "get_texts": 2,
+}
+
+
+def _page(driver):
+    page = BasePage(driver)
+    page.logger.setLevel(logging.CRITICAL)
+    return page
+
+
+def scenario_click(driver):
+    driver.dom.add(BUTTON, tag="button", text="Submit")
+    page = _page(driver)
+    return lambda: page.click(BUTTON)
+
+
+def scenario_input_text(driver):
+    element = driver.dom.add(INPUT, tag="input")
+    page = _page(driver)
+
+    def run():
+        element.value = ""
+        page.input_text(INPUT, "Bexruz")
+    return run
+
+
+def scenario_click_options(driver):
+    select = driver.dom.add_select(SELECT, OPTIONS)
+    page = _page(driver)
+
+    def run():
+        for option in select.children:
+            option.selected = False
+        page.click_options(SELECT, OPTIONS[40])
+    return run
+
+
+def scenario_check_dropdown_closed(driver):
+    driver.dom.add(DROPDOWN_OPTIONS, tag="ul", displayed=False)
+    page = _page(driver)
+    return lambda: page._check_dropdown_closed(DROPDOWN_OPTIONS)
+
+
+def scenario_handle_alert(driver):
+    page = _page(driver)
+
+    def run():
+        driver.dom.alerts.append("Ma'lumot saqlandi")
+        page.handle_alert()
+    return run
+
+
+def _form(driver):
+    inputs = [driver.dom.add(locator, tag="input") for locator in FORM_INPUTS]
+    checkbox = driver.dom.add(AGREE, tag="input", attrs={"type": "checkbox"})
+    checkbox.on_click = lambda element: setattr(element, "selected", not element.selected)
+    select = driver.dom.add_select(SELECT, OPTIONS)
+
+    def reset():
+        for element in inputs:
+            element.value = ""
+        checkbox.selected = False
+        for option in select.children:
+            option.selected = False
+    return reset
+
+
+def scenario_fill_form(driver):
+    reset = _form(driver)
+    page = _page(driver)
+    fields = {locator: f"qiymat {i}" for i, locator in enumerate(FORM_INPUTS)}
+    fields[AGREE] = True
+    fields[SELECT] = OPTIONS[40]
+
+    def run():
+        reset()
+        page.fill_form(fields)
+    return run
+
+
+def scenario_fill_form_sequential(driver):
+    """Taqqoslash uchun: xuddi shu forma maydonma-maydon to'ldiriladi"""
+    reset = _form(driver)
+    page = _page(driver)
+
+    def run():
+        reset()
+        for i, locator in enumerate(FORM_INPUTS):
+            page.input_text(locator, f"qiymat {i}")
+        page.click(AGREE)
+        page.click_options(SELECT, OPTIONS[40])
+    return run
+
+
+def _table(driver):
+    for i in range(TABLE_ROWS):
+        driver.dom.add(TABLE_CELLS, tag="td", text=f"user {i}", attrs={"data-id": str(i)})
+
+
+def scenario_get_texts(driver):
+    _table(driver)
+    page = _page(driver)
+    return lambda: page.get_texts(TABLE_CELLS)
+
+
+def scenario_get_texts_loop(driver):
+    """Taqqoslash uchun: har bir katakni element.text bilan o'qish"""
+    _table(driver)
+    page = _page(driver)
+    return lambda: [element.text for element in page._wait_for_presence_all(TABLE_CELLS, visible_only=True)]
+
+
+SCENARIOS = {
+    "click": scenario_click,
+    "input_text": scenario_input_text,
+    "click_options": scenario_click_options,
+    "_check_dropdown_closed": scenario_check_dropdown_closed,
+    "handle_alert": scenario_handle_alert,
+    "fill_form": scenario_fill_form,
+    "fill_form_sequential": scenario_fill_form_sequential,
+    "get_texts": scenario_get_texts,
+    "get_texts_loop": scenario_get_texts_loop,
+}
+
+
+def measure(name, rounds, latency):
+    driver = FakeDriver(latency=latency)
+    run = SCENARIOS[name](driver)
+    run()  # isitish (kesh, logger)
+
+    driver.reset_commands()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        run()
+    elapsed = time.perf_counter() - start
+    return elapsed / rounds * 1000, driver.command_count / rounds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.0, help="har bir buyruq kechikishi (soniya)")
+    parser.add_argument("--check", action="store_true", help="buyruqlar byudjetidan oshsa xato bilan chiqish")
+    parser.add_argument("scenarios", nargs="*", default=list(SCENARIOS))
+    args = parser.parse_args(argv)
+
+    failed = []
+    for name in args.scenarios:
+        ms, commands = measure(name, args.rounds, args.latency)
+        budget = BUDGETS.get(name)
+        status = ""
+        if budget is not None and commands > budget:
+            status = f"  <-- byudjet {budget} dan oshdi"
+            failed.append(name)
+        print(f"{name:>24}: {ms:9.3f} ms/op  {commands:7.1f} buyruq/op{status}")
+
+    if args.check and failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
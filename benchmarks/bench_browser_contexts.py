@@ -0,0 +1,121 @@
+"""
+Alohida brauzerlar va bitta brauzerdagi browser context lar taqqoslovi.
+
+* Soxta driver (sukut bo'yicha): N ta thread har biri o'z context ida BasePage oqimini bajaradi,
+  bittasi uzoq kutadi; kutish bo'laklashi (wait_slice) boshqa testlarni qanchalik ushlab turishi
+  va oyna almashtirish buyruqlari o'lchanadi.
+* --chrome: haqiqiy Chrome - N ta get_driver jarayoni va 1 ta jarayonda N ta context
+  uchun ishga tushish vaqti va jarayonlar daraxti RSS xotirasi.
+
+Ishga tushirish:
+    python -m benchmarks.bench_browser_contexts
+    python -m benchmarks.bench_browser_contexts --chrome --tests 8
+"""
+import argparse
+import threading
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+
+from base_functions.base_page import BasePage
+from benchmarks.fake_driver import FakeDriver, FakeElement
+from utils.browser_contexts import BrowserContexts
+
+BUTTON = (By.ID, "submit")
+SLOW = (By.ID, "slow")
+RESULT = (By.ID, "result")
+
+
+def populate(dom):
+    """Tugma bosilgach natija chiqadi"""
+    def on_click(element):
+        dom.add(RESULT, FakeElement(text="OK"))
+    dom.add(BUTTON, FakeElement(tag="button", on_click=on_click))
+
+
+def run_fake(tests, wait_slice, contended_wait_slice, latency, rounds=3):
+    """
+    Birinchi test 1s davomida element kutadi, qolganlari click/get_text bajaradi.
+    Qaytaradi: tezkor testlarning o'rtacha tugash vaqti, umumiy vaqt, buyruqlar, oyna almashtirishlar
+    """
+    base = FakeDriver(latency=latency)
+    base.executor.window_factory = populate
+    contexts = BrowserContexts(base, wait_slice=wait_slice, contended_wait_slice=contended_wait_slice)
+    drivers = [contexts.new_driver() for _ in range(tests)]
+    base.reset_commands()
+    finished = []
+
+    def slow_scenario(driver):
+        dom = base.executor.windows[driver.context_handle]
+        threading.Timer(1.0, lambda: dom.add(SLOW)).start()
+        BasePage(driver).wait_for_element(SLOW, timeout=5)
+
+    def quick_scenario(driver):
+        page = BasePage(driver)
+        for _ in range(rounds):
+            page.click(BUTTON)
+            assert page.get_text(RESULT) == "OK"
+        finished.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=slow_scenario, args=(drivers[0],))]
+    threads += [threading.Thread(target=quick_scenario, args=(driver,)) for driver in drivers[1:]]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.01)
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    switches = base.commands[Command.SWITCH_TO_WINDOW]
+    total = base.command_count
+    contexts.close_all()
+    return sum(finished) / len(finished), elapsed, total, switches
+
+
+def run_chrome(tests):
+    from utils.driver import get_driver
+    from utils.driver_pool import driver_memory_mb
+
+    start = time.perf_counter()
+    drivers = [get_driver("about:blank", headless=True) for _ in range(tests)]
+    separate_time = time.perf_counter() - start
+    separate_rss = sum(driver_memory_mb(driver) or 0 for driver in drivers)
+    for driver in drivers:
+        driver.quit()
+
+    start = time.perf_counter()
+    base = get_driver("about:blank", headless=True)
+    contexts = BrowserContexts(base)
+    for _ in range(tests):
+        contexts.new_driver("data:text/html,<p>context</p>")
+    shared_time = time.perf_counter() - start
+    shared_rss = driver_memory_mb(base) or 0
+    contexts.close_all()
+
+    print(f"{'alohida brauzerlar':>22}: {separate_time:6.2f}s, {separate_rss:7.0f} MB")
+    print(f"{'1 brauzer + context':>22}: {shared_time:6.2f}s, {shared_rss:7.0f} MB")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tests", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.001, help="soxta buyruq kechikishi (soniya)")
+    parser.add_argument("--chrome", action="store_true", help="haqiqiy Chrome bilan xotira o'lchovi")
+    args = parser.parse_args(argv)
+
+    if args.chrome:
+        run_chrome(args.tests)
+        return
+
+    print(f"{args.tests} ta test, 1 ta soxta brauzer:")
+    modes = (("bo'laklanmagan kutish", 0, 0), ("doimiy bo'lak 0.25s", 0.25, 0.25),
+             ("navbatga moslashuvchan", 0.25, 0.001))
+    for label, wait_slice, contended_wait_slice in modes:
+        quick, elapsed, total, switches = run_fake(args.tests, wait_slice, contended_wait_slice, args.latency)
+        print(f"{label:>24}: tezkor testlar {quick:5.2f}s, jami {elapsed:5.2f}s, "
+              f"{total} buyruq ({switches} ta oyna almashtirish)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+BasePage.click uchun WebDriver buyruqlari soni benchmarki (brauzersiz).
+Oxirida: doim yopilgan (obscured) tugma - to'liq zanjir va o'rganilgan JS click usuli taqqoslovi.
+
+Ishga tushirish:
+    python -m benchmarks.bench_click
+"""
+import logging
+import os
+import tempfile
+import time
+
+from selenium.webdriver.common.by import By
+
+from base_functions.base_page import BasePage
+from benchmarks.fake_driver import FakeDriver
+from utils.click_strategies import ClickStrategyStore
+
+BUTTON = (By.ID, "submit")
+ROUNDS = 200
+
+
+def run(smart, cache=False):
+    driver = FakeDriver()
+    driver.dom.add(BUTTON, tag="button", text="Submit")
+
+    page = BasePage(driver)
+    page.logger.setLevel(logging.CRITICAL)
+    page.smart_click = smart
+    if cache:
+        page.enable_element_cache()
+
+    driver.reset_commands()
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        page.click(BUTTON)
+    elapsed = time.perf_counter() - start
+
+    cache_stats = page.element_cache.stats() if page.element_cache else None
+    return driver.command_count / ROUNDS, elapsed / ROUNDS * 1000, dict(driver.commands), cache_stats
+
+
+def run_obscured(learn, rounds=20, retry_delay=0.05):
+    """Oddiy click har doim intercepted bo'ladigan tugma"""
+    driver = FakeDriver()
+    driver.dom.add(BUTTON, tag="button", text="Submit", obscured=True)
+    page = BasePage(driver)
+    page.logger.setLevel(logging.CRITICAL)
+    with tempfile.TemporaryDirectory() as directory:
+        if learn:
+            page.click_strategies = ClickStrategyStore(os.path.join(directory, "click_strategies.json"))
+
+        driver.reset_commands()
+        start = time.perf_counter()
+        for _ in range(rounds):
+            page.click(BUTTON, retry_delay=retry_delay)
+        elapsed = time.perf_counter() - start
+        stats = page.click_strategies.stats if learn else None
+    return driver.command_count / rounds, elapsed / rounds * 1000, stats
+
+
+def main():
+    modes = (("chain", False, False), ("cache", False, True), ("smart", True, False))
+    for name, smart, cache in modes:
+        per_click, ms, commands, cache_stats = run(smart, cache)
+        print(f"{name:>6}: {per_click:5.1f} buyruq/click  {ms:7.3f} ms/click  {commands}")
+        if cache_stats:
+            print(f"{'':>8}kesh: {cache_stats}")
+
+    print("Yopilgan tugma (retry_delay=0.05s):")
+    for name, learn in (("chain", False), ("learned", True)):
+        per_click, ms, stats = run_obscured(learn)
+        print(f"{name:>8}: {per_click:5.1f} buyruq/click  {ms:7.3f} ms/click" + (f"  {stats}" if stats else ""))
+
+
+if __name__ == "__main__":
+    main()
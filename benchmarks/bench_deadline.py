@@ -0,0 +1,61 @@
+"""
+Amal deadline i benchmarki (brauzersiz): presence -> visibility -> clickable zanjiri.
+Tugma default_timeout ga yaqin vaqtda DOM ga qo'shiladi, yana shuncha vaqtdan keyin ko'rinadi
+va hech qachon enabled bo'lmaydi. Deadline siz har bir bosqich yangi timeout oladi,
+deadline bilan butun click bitta action_timeout ichida tugaydi.
+
+Ishga tushirish:
+    python -m benchmarks.bench_deadline
+    python -m benchmarks.bench_deadline --timeout 0.5
+"""
+import argparse
+import logging
+import threading
+import time
+
+from selenium.webdriver.common.by import By
+
+from base_functions.base_page import BasePage
+from benchmarks.fake_driver import FakeDriver, FakeElement
+from utils.exeption import ElementInteractionError
+
+BUTTON = (By.ID, "submit")
+
+
+def run(timeout, action_timeout, rounds):
+    timings = []
+    for _ in range(rounds):
+        driver = FakeDriver()
+        page = BasePage(driver)
+        page.logger.setLevel(logging.CRITICAL)
+        page.default_timeout = timeout
+        page.action_timeout = action_timeout
+
+        button = FakeElement(tag="button", displayed=False, enabled=False)
+        threading.Timer(timeout * 0.8, lambda: driver.dom.add(BUTTON, button)).start()
+        threading.Timer(timeout * 1.6, lambda: setattr(button, "displayed", True)).start()
+
+        start = time.perf_counter()
+        try:
+            page.click(BUTTON)
+        except ElementInteractionError:
+            pass
+        timings.append(time.perf_counter() - start)
+        time.sleep(timeout)
+    return sum(timings) / len(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--timeout", type=float, default=0.3, help="default_timeout (soniya)")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    # action_timeout juda katta - har bir bosqich o'z timeout ini oladi (avvalgi xatti-harakat)
+    for label, action_timeout in (("bosqich bo'yicha", 10 ** 6), ("umumiy deadline", None)):
+        elapsed = run(args.timeout, action_timeout, args.rounds)
+        print(f"{label:>18}: click xatosi {elapsed:5.2f}s da (default_timeout={args.timeout}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Import vaqti benchmarki (python -X importtime, har bir o'lchov yangi jarayonda).
+
+* modullar - conftest, pages, utils.logger, base_functions.base_page ning kumulyativ import vaqti
+* sahifalar katalogi - vaqtinchalik paketda --pages ta sahifa moduli yaratiladi:
+  hammasini import qilish (eager) va reyestr orqali bittasini olish (lazy) solishtiriladi
+
+Ishga tushirish:
+    python -m benchmarks.bench_import_time
+    python -m benchmarks.bench_import_time --pages 500 --runs 5
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = ("conftest", "pages", "utils.logger", "base_functions.base_page")
+# pytest jarayonida allaqachon yuklangan modullar o'lchovga qo'shilmaydi
+PRELOAD = {"conftest": "pytest"}
+
+PAGE_TEMPLATE = '''from selenium.webdriver.common.by import By
+
+from base_functions.base_page import BasePage
+
+
+class Catalog{index}Page(BasePage):
+{locators}
+
+    def open_item(self, number):
+        self.click((By.CSS_SELECTOR, f"#item-{index}-{{number}}"))
+'''
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def run_python(code, extra_path=None, importtime=False):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (extra_path, ROOT))))
+    args = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", code]
+    return subprocess.run(args, cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+
+
+def import_time_ms(module):
+    """Modulning kumulyativ import vaqti (ms): -X importtime dagi top-level qator"""
+    samples = {}
+    preload = f"import {PRELOAD[module]}; " if module in PRELOAD else ""
+    for line in run_python(f"{preload}import {module}", importtime=True).stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match and not match.group(2):
+            samples[match.group(3)] = int(match.group(1)) / 1000
+    return samples.get(module, 0.0)
+
+
+def process_ms(code, extra_path, runs):
+    """Butun jarayon davomiyligi emas, faqat kod bajarilishi (interpreter start chiqarib tashlanadi)"""
+    timed = f"import time; _start = time.perf_counter()\n{code}\nprint((time.perf_counter() - _start) * 1000)"
+    return statistics.median(float(run_python(timed, extra_path).stdout.split()[-1]) for _ in range(runs))
+
+
+def make_catalog(directory, count):
+    package = os.path.join(directory, "catalog_pages")
+    os.makedirs(package)
+    open(os.path.join(package, "__init__.py"), "w").close()
+    for index in range(count):
+        locators = "\n".join(f'    FIELD_{n} = (By.CSS_SELECTOR, "#page-{index} .field-{n}")' for n in range(30))
+        with open(os.path.join(package, f"catalog_{index}_page.py"), "w", encoding="utf-8") as f:
+            f.write(PAGE_TEMPLATE.format(index=index, locators=locators))
+    return package
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=200, help="vaqtinchalik katalogdagi sahifalar soni")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    for module in MODULES:
+        print(f"{module:>26}: {import_time_ms(module):7.1f}ms")
+
+    with tempfile.TemporaryDirectory() as directory:
+        package = make_catalog(directory, args.pages)
+        eager = "\n".join(f"import catalog_pages.catalog_{index}_page" for index in range(args.pages))
+        lazy = (f"from utils.page_registry import PageRegistry\n"
+                f"registry = PageRegistry('catalog_pages', {package!r})\n"
+                f"registry.get('Catalog{args.pages // 2}Page')")
+        for label, code in (("eager (hammasi)", eager), ("reyestr (bittasi)", lazy)):
+            # Birinchi ishga tushirish .pyc keshini to'ldiradi
+            run_python(code, directory)
+            print(f"{label:>26}: {process_ms(code, directory, args.runs):7.1f}ms ({args.pages} ta sahifa)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Launch profillari taqqoslovi (haqiqiy Chrome kerak): brauzer ishga tushish vaqti,
+birinchi sahifa ochilishi va jarayonlar daraxti RSS xotirasi (Linux /proc).
+
+Ishga tushirish:
+    python -m benchmarks.bench_launch_profiles
+    python -m benchmarks.bench_launch_profiles --rounds 5 --profiles headless throughput throughput+no_images
+"""
+import argparse
+import statistics
+import time
+
+from utils.driver import get_driver
+from utils.driver_pool import driver_memory_mb
+
+# Jadval va skriptli, o'rtacha og'irlikdagi sahifa (tarmoqsiz)
+PAGE = "data:text/html," + (
+    "<table>" + "".join(f"<tr><td>{i}</td><td><input value='{i}'></td></tr>" for i in range(500)) + "</table>"
+    "<script>for (var i = 0; i < 200; i++) { document.body.appendChild(document.createElement('div')); }</script>"
+)
+
+
+def measure(profile, rounds):
+    startups, loads, memory = [], [], []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        driver = get_driver("about:blank", profile=profile, network_idle=False)
+        startups.append(time.perf_counter() - start)
+        try:
+            start = time.perf_counter()
+            driver.get(PAGE)
+            loads.append(time.perf_counter() - start)
+            rss = driver_memory_mb(driver)
+            if rss:
+                memory.append(rss)
+        finally:
+            driver.quit()
+    return (statistics.median(startups), statistics.median(loads),
+            statistics.median(memory) if memory else None)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--profiles", nargs="+", default=["headless", "throughput", "throughput+no_images"])
+    args = parser.parse_args(argv)
+
+    print(f"{'profil':>24} {'ishga tushish':>14} {'sahifa':>9} {'RSS':>10}")
+    for profile in args.profiles:
+        startup, load, rss = measure(profile, args.rounds)
+        rss_text = f"{rss:7.0f} MB" if rss else "       n/a"
+        print(f"{profile:>24} {startup:13.2f}s {load * 1000:7.0f}ms {rss_text}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Kompozit locatorlar benchmarki (brauzersiz): iframe ichidagi shadow DOM dagi forma.
+
+Stsenariylar:
+* qo'lda - har bir amal oldidan default_content + iframe ni topish + switch_to.frame, keyin ortga qaytish
+* kompozit - composite(frame >> shadow >> element): frame ga bir marta kiriladi, keyingi amallarda
+  switch qilinmaydi, shadow yo'li bitta skriptda topiladi
+
+Ishga tushirish:
+    python -m benchmarks.bench_locators
+    python -m benchmarks.bench_locators --actions 100 --latency 0.005
+"""
+import argparse
+import logging
+import time
+
+from selenium.webdriver.common.by import By
+
+from base_functions.base_page import BasePage
+from benchmarks.fake_driver import FakeDriver
+from utils.locators import compile_locator, composite
+
+FRAME = (By.CSS_SELECTOR, "iframe#payment")
+PAY = (By.CSS_SELECTOR, "button.pay")
+TOTAL = (By.CSS_SELECTOR, "span.total")
+
+PAY_BUTTON = composite(("frame", "iframe#payment"), ("shadow", "card-form"), PAY)
+PAY_TOTAL = composite(("frame", "iframe#payment"), ("shadow", "card-form"), TOTAL)
+PLAIN_PAY = composite(("frame", "iframe#payment"), PAY)
+PLAIN_TOTAL = composite(("frame", "iframe#payment"), TOTAL)
+
+
+def make_page(latency, shadow):
+    driver = FakeDriver(latency=latency)
+    form = driver.dom.add_frame(FRAME)
+    if shadow:
+        form = form.add_shadow((By.CSS_SELECTOR, "card-form"))
+    form.add(PAY, tag="button", text="Pay")
+    form.add(TOTAL, tag="span", text="42.00")
+    page = BasePage(driver)
+    page.logger.setLevel(logging.CRITICAL)
+    driver.reset_commands()
+    return driver, page
+
+
+def run_manual(actions, latency):
+    driver, page = make_page(latency, shadow=False)
+    start = time.perf_counter()
+    for i in range(actions):
+        driver.switch_to.default_content()
+        driver.switch_to.frame(driver.find_element(*FRAME))
+        if i % 2:
+            page.get_text(TOTAL)
+        else:
+            page.click(PAY)
+        driver.switch_to.default_content()
+    return time.perf_counter() - start, driver.command_count, page.frames
+
+
+def run_composite(actions, latency, shadow):
+    driver, page = make_page(latency, shadow)
+    pay, total = (PAY_BUTTON, PAY_TOTAL) if shadow else (PLAIN_PAY, PLAIN_TOTAL)
+    start = time.perf_counter()
+    for i in range(actions):
+        if i % 2:
+            page.get_text(total)
+        else:
+            page.click(pay)
+    return time.perf_counter() - start, driver.command_count, page.frames
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--actions", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.002, help="har bir WebDriver buyrug'i kechikishi (soniya)")
+    args = parser.parse_args(argv)
+
+    compile_locator.cache_clear()
+    for label, runner in (("qo'lda switch", lambda: run_manual(args.actions, args.latency)),
+                          ("kompozit", lambda: run_composite(args.actions, args.latency, shadow=False)),
+                          ("kompozit+shadow", lambda: run_composite(args.actions, args.latency, shadow=True))):
+        elapsed, commands, frames = runner()
+        print(f"{label:>16}: {elapsed * 1000 / args.actions:6.2f}ms/amal, {commands / args.actions:5.2f} buyruq/amal, "
+              f"frame switch {frames.switches}, o'tkazib yuborildi {frames.skipped}")
+    info = compile_locator.cache_info()
+    print(f"Kompilyatsiya keshi: {info.hits} hit, {info.misses} miss")
+
+
+if __name__ == "__main__":
+    main()
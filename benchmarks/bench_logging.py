@@ -0,0 +1,87 @@
+"""
+BasePage log tizimi narxi: bitta click uchun sync va async (QueueListener) rejimlar.
+
+Ishga tushirish:
+    python -m benchmarks.bench_logging
+"""
+import contextlib
+import logging
+import os
+import tempfile
+import time
+
+from selenium.webdriver.common.by import By
+
+from base_functions.base_page import BasePage
+from benchmarks.fake_driver import FakeDriver
+from utils.logger import configure_logging, flush_logs
+
+BUTTON = (By.ID, "submit")
+ROUNDS = 500
+
+
+def run(async_mode, buffered, level):
+    driver = FakeDriver()
+    driver.dom.add(BUTTON, tag="button", text="Submit")
+
+    page = BasePage(driver)
+    page.logger = configure_logging("bench_logging", async_mode=async_mode, buffered=buffered)
+    page.logger.setLevel(level)
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        page.click(BUTTON)
+    elapsed = time.perf_counter() - start
+    flush_logs("bench_logging")
+    return elapsed / ROUNDS * 1e6
+
+
+def run_raw(async_mode, buffered, lazy):
+    """Faqat log chaqiruvining chaqiruvchi threaddagi narxi (fon thread kutilmaydi)"""
+    logger = configure_logging("bench_logging_raw", async_mode=async_mode, buffered=buffered)
+    page_name, locator = "LoginPage", BUTTON
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS * 10):
+        if lazy:
+            logger.info("⏺ %s: Click: %s", page_name, locator)
+        else:
+            logger.info(f"⏺ {page_name}: Click: {locator}")
+    elapsed = time.perf_counter() - start
+    flush_logs("bench_logging_raw")
+    return elapsed / (ROUNDS * 10) * 1e6
+
+
+def main():
+    modes = (
+        ("sync", False, False),
+        ("sync+buffer", False, True),
+        ("async", True, False),
+        ("async+buffer", True, True),
+    )
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir, open(os.devnull, "w") as devnull:
+        cwd = os.getcwd()
+        os.chdir(tmp_dir)
+        try:
+            with contextlib.redirect_stderr(devnull):
+                for name, async_mode, buffered in modes:
+                    for level in (logging.DEBUG, logging.WARNING):
+                        results.append((name, logging.getLevelName(level), run(async_mode, buffered, level)))
+                raw_results = [
+                    (name, lazy, run_raw(async_mode, buffered, lazy))
+                    for name, async_mode, buffered in modes
+                    for lazy in (False, True)
+                ]
+        finally:
+            os.chdir(cwd)
+
+    for name, level, us in results:
+        print(f"{name:>13} {level:>8}: {us:8.1f} us/click")
+    print()
+    for name, lazy, us in raw_results:
+        print(f"{name:>13} {'lazy' if lazy else 'f-string':>8}: {us:8.1f} us/log chaqiruvi")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+BasePage konstruktori narxi (logger reyestri va test nomini aniqlash).
+Chuqur stack (pytest ga o'xshash) ichidan o'lchanadi.
+
+Ishga tushirish:
+    python -m benchmarks.bench_page_init
+"""
+import time
+
+from base_functions.base_page import BasePage
+from benchmarks.fake_driver import FakeDriver
+from utils.logger import reset_current_test, set_current_test
+
+ROUNDS = 2000
+STACK_DEPTH = 60
+
+
+def _deep(depth, func):
+    if depth == 0:
+        return func()
+    return _deep(depth - 1, func)
+
+
+def run(driver):
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        BasePage(driver)
+    return (time.perf_counter() - start) / ROUNDS * 1e6
+
+
+def main():
+    driver = FakeDriver()
+    print(f"stack bo'ylab qidiruv: {_deep(STACK_DEPTH, lambda: run(driver)):8.1f} us/page")
+
+    token = set_current_test("test_bench_page_init")
+    try:
+        print(f"contextvar (pytest hook): {_deep(STACK_DEPTH, lambda: run(driver)):8.1f} us/page")
+    finally:
+        reset_current_test(token)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+get_driver sahifa yuklash rejimlari taqqoslovi (haqiqiy headless Chrome kerak).
+Mahalliy statik server sahifa, sekin "reklama" skriptlari, shriftlar va rasmlarni
+sun'iy kechikish bilan beradi; har bir rejimda sahifa ochilib, forma tugmasi topilguncha vaqt o'lchanadi.
+
+Ishga tushirish:
+    python -m benchmarks.bench_page_load
+    python -m benchmarks.bench_page_load --rounds 5
+"""
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from selenium.webdriver.common.by import By
+
+from utils.driver import get_driver, open_url
+
+# path prefiksi -> (kechikish soniya, content-type)
+RESOURCES = {
+    "/ads/": (1.5, "application/javascript"),
+    "/analytics/": (1.0, "application/javascript"),
+    "/fonts/": (0.8, "font/woff2"),
+    "/img/": (0.3, "image/svg+xml"),
+}
+BENCH_BLOCKLIST = ["*/ads/*", "*/analytics/*", "*.woff2"]
+
+PAGE = """<!doctype html>
+<html><head>
+<style>@font-face {{font-family: F; src: url(/fonts/f.woff2);}} body {{font-family: F;}}</style>
+<script src="/ads/a.js"></script>
+<script async src="/analytics/t.js"></script>
+</head><body>
+<form><input name="first_name"><button id="submit" type="button">Submit</button></form>
+{images}
+<script>var s = document.createElement('script'); s.src = '/ads/late.js'; document.body.appendChild(s);</script>
+</body></html>
+"""
+SVG = b'<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"><rect width="10" height="10"/></svg>'
+
+MODES = [
+    ("normal", dict(page_load="normal", network_idle=False)),
+    ("eager", dict(page_load="eager", network_idle=False)),
+    ("eager+idle", dict(page_load="eager", network_idle=True)),
+    ("eager+idle+block", dict(page_load="eager", network_idle=True, blocklist=BENCH_BLOCKLIST)),
+    ("eager+block+noimg", dict(page_load="eager", network_idle=True, blocklist=BENCH_BLOCKLIST,
+                               disable_images=True)),
+    ("none+idle+block+noimg", dict(page_load="none", network_idle=True, blocklist=BENCH_BLOCKLIST,
+                                   disable_images=True)),
+]
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        for prefix, (delay, content_type) in RESOURCES.items():
+            if self.path.startswith(prefix):
+                time.sleep(delay)
+                body = SVG if prefix == "/img/" else b"/* */"
+                break
+        else:
+            content_type = "text/html; charset=utf-8"
+            images = "".join(f'<img src="/img/{i}.svg">' for i in range(20))
+            body = PAGE.format(images=images).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/"
+
+
+def measure(url, options, rounds):
+    network_idle = options.pop("network_idle")
+    driver = get_driver("about:blank", headless=True, network_idle=False, **options)
+    try:
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            open_url(driver, url, network_idle=network_idle)
+            driver.find_element(By.ID, "submit")
+            timings.append(time.perf_counter() - start)
+            driver.get("about:blank")
+        return sum(timings) / len(timings)
+    finally:
+        driver.quit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    server, url = start_server()
+    try:
+        for label, options in MODES:
+            print(f"{label:>22}: {measure(url, dict(options), args.rounds):6.2f}s / sahifa")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
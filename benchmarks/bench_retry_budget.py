@@ -0,0 +1,71 @@
+"""
+Retry byudjeti va xato tasniflagichi benchmarki (brauzersiz).
+
+Stsenariylar:
+* flaky - tugma har safar stale bo'ladi (transient): barcha urinishlar va kutishlar byudjet bilan cheklanadi
+* missing - tugma yo'q (deterministik): qayta urinishsiz darhol xato
+
+Ishga tushirish:
+    python -m benchmarks.bench_retry_budget
+    python -m benchmarks.bench_retry_budget --actions 20 --budget 1.5
+"""
+import argparse
+import logging
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+
+from base_functions.base_page import BasePage
+from benchmarks.fake_driver import FakeDriver
+from utils.exeption import ElementInteractionError
+from utils.retry import RetryBudget, RetryPolicy, budget_report, reset_retry_budgets
+
+BUTTON = (By.ID, "submit")
+MISSING = (By.ID, "missing")
+# Benchmark tez tugashi uchun qisqartirilgan backoff
+POLICY = RetryPolicy("bench", first_delay=0.05, base_delay=0.1, max_delay=0.4, jitter=0)
+
+
+def run(scenario, actions, budget_seconds):
+    reset_retry_budgets()
+    driver = FakeDriver()
+    driver.dom.add(BUTTON, tag="button", text="Submit")
+    page = BasePage(driver)
+    page.logger.setLevel(logging.CRITICAL)
+    page.retry_policy = POLICY
+    page.default_timeout = 0.2
+    page.retry_budget.seconds = budget_seconds
+
+    if scenario == "flaky":
+        driver.executor.inject_stale(Command.CLICK_ELEMENT, times=10 ** 6)
+        driver.executor.inject_error(Command.W3C_EXECUTE_SCRIPT, "stale element reference", times=10 ** 6)
+    locator = MISSING if scenario == "missing" else BUTTON
+
+    failures = 0
+    start = time.perf_counter()
+    for _ in range(actions):
+        try:
+            page.click(locator)
+        except ElementInteractionError:
+            failures += 1
+    elapsed = time.perf_counter() - start
+    return elapsed, failures, budget_report().get(page.test_id, {})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--actions", type=int, default=10)
+    parser.add_argument("--budget", type=float, default=1.0, help="test retry byudjeti (soniya)")
+    args = parser.parse_args(argv)
+
+    for scenario in ("flaky", "missing"):
+        for label, budget_seconds in (("cheksiz", float("inf")), (f"{args.budget}s", args.budget)):
+            elapsed, failures, report = run(scenario, args.actions, budget_seconds)
+            print(f"{scenario:>8} byudjet {label:>8}: {elapsed:6.2f}s, {failures}/{args.actions} xato, "
+                  f"retry {report.get('spent', 0):.2f}s, tejaldi ~{report.get('saved', 0):.2f}s "
+                  f"(fail fast {report.get('fail_fast', 0)}, byudjet {report.get('exhausted', 0)})")
+
+
+if __name__ == "__main__":
+    main()
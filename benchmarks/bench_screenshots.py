@@ -0,0 +1,93 @@
+"""
+Screenshot narxi test threadida: eski sinxron save_screenshot va ScreenshotService.
+ScreenshotService test threadida faqat PNG ni oladi va sha1 ni hisoblaydi; decode, perceptual hash,
+siqish (WebP, Pillow kerak) va yozish worker larda.
+Shuningdek retry "portlashi"dagi takror kadrlar va disk kvotasi tekshiriladi.
+
+Ishga tushirish:
+    python -m benchmarks.bench_screenshots
+"""
+import base64
+import io
+import os
+import tempfile
+import time
+
+from benchmarks.fake_driver import FakeDriver
+from utils.screenshots import Image, ScreenshotService
+
+ROUNDS = 50
+FRAME_BYTES = 2 * 1024 * 1024
+
+
+def _frame(seed):
+    # Haqiqiy full-HD PNG hajmiga yaqin, har seed uchun boshqa kadr
+    return base64.b64encode(os.urandom(16) + bytes([seed % 256]) * FRAME_BYTES).decode()
+
+
+def _dir_size(path):
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+def bench_sync(driver, directory):
+    elapsed = 0.0
+    for i in range(ROUNDS):
+        driver.dom.screenshot = _frame(i)
+        start = time.perf_counter()
+        driver.save_screenshot(os.path.join(directory, f"sync_{i}.png"))
+        elapsed += time.perf_counter() - start
+    return elapsed / ROUNDS * 1000
+
+
+def _image_frame(seed):
+    image = Image.effect_noise((1920, 1080), 20 + seed)
+    output = io.BytesIO()
+    image.save(output, "PNG")
+    return base64.b64encode(output.getvalue()).decode()
+
+
+def bench_service(driver, directory, frame=_frame, image_format="png"):
+    service = ScreenshotService(directory=directory, quota_bytes=0, image_format=image_format, similarity=0)
+    elapsed = 0.0
+    for i in range(ROUNDS):
+        driver.dom.screenshot = frame(i)
+        start = time.perf_counter()
+        service.capture(driver, f"async_{i}", key="bench")
+        elapsed += time.perf_counter() - start
+    service.close()
+    return elapsed / ROUNDS * 1000
+
+
+def main():
+    driver = FakeDriver()
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{'sync save_screenshot':>24}: {bench_sync(driver, directory):8.2f} ms/kadr (test threadida)")
+        print(f"{'ScreenshotService':>24}: {bench_service(driver, directory):8.2f} ms/kadr (test threadida)")
+        if Image is None:
+            print(f"{'ScreenshotService webp':>24}: Pillow o'rnatilmagan, o'lchanmadi")
+        else:
+            print(f"{'ScreenshotService webp':>24}: "
+                  f"{bench_service(driver, directory, _image_frame, 'webp'):8.2f} ms/kadr (test threadida)")
+
+    with tempfile.TemporaryDirectory() as directory:
+        service = ScreenshotService(directory=directory, quota_bytes=0)
+        driver.dom.screenshot = _frame(1)
+        for i in range(10):
+            service.capture(driver, f"retry_{i}", key="bench")
+        service.close()
+        print(f"{'retry portlashi':>24}: 10 kadr -> {len(os.listdir(directory))} fayl "
+              f"({service.stats['duplicates']} takror)")
+
+    with tempfile.TemporaryDirectory() as directory:
+        quota = 5 * FRAME_BYTES
+        service = ScreenshotService(directory=directory, quota_bytes=quota)
+        for i in range(20):
+            driver.dom.screenshot = _frame(i)
+            service.capture(driver, f"quota_{i}", key="bench")
+        service.close()
+        print(f"{'kvota 10MB':>24}: 20 kadr -> {len(os.listdir(directory))} fayl, "
+              f"{_dir_size(directory) / 1024 / 1024:.1f}MB ({service.stats['evicted']} o'chirildi)")
+
+
+if __name__ == "__main__":
+    main()
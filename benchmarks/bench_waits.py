@@ -0,0 +1,48 @@
+"""
+Kechikib paydo bo'ladigan element uchun kutish: WebDriverWait polling (0.5s) va
+event-driven kutish (BasePage.event_waits, bitta execute_async_script).
+
+Ishga tushirish:
+    python -m benchmarks.bench_waits
+"""
+import logging
+import threading
+import time
+
+from selenium.webdriver.common.by import By
+
+from base_functions.base_page import BasePage
+from benchmarks.fake_driver import FakeDriver
+
+BUTTON = (By.ID, "submit")
+ROUNDS = 10
+APPEAR_AFTER = 0.05
+
+
+def run(event_waits):
+    driver = FakeDriver()
+    page = BasePage(driver)
+    page.event_waits = event_waits
+    page.logger.setLevel(logging.CRITICAL)
+
+    elapsed = 0.0
+    driver.reset_commands()
+    for _ in range(ROUNDS):
+        driver.dom.remove(BUTTON)
+        timer = threading.Timer(APPEAR_AFTER, lambda: driver.dom.add(BUTTON, tag="button"))
+        start = time.perf_counter()
+        timer.start()
+        page.wait_for_element(BUTTON, wait_type="clickable", timeout=5)
+        elapsed += time.perf_counter() - start
+    return elapsed / ROUNDS * 1000, driver.command_count / ROUNDS
+
+
+def main():
+    print(f"Element {APPEAR_AFTER * 1000:.0f}ms dan keyin paydo bo'ladi")
+    for label, event_waits in (("WebDriverWait", False), ("event_waits", True)):
+        ms, commands = run(event_waits)
+        print(f"{label:>14}: {ms:7.1f} ms/kutish  {commands:5.1f} buyruq/kutish")
+
+
+if __name__ == "__main__":
+    main()
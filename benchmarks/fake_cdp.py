@@ -0,0 +1,206 @@
+"""
+Brauzersiz soxta CDP (DevTools) websocket serveri - AsyncBasePage benchmarklari uchun.
+Har bir target (tab) o'z FakeDOM modeliga ega; buyruqlar sun'iy kechikish bilan
+(asyncio.sleep - event loop bloklanmaydi) bajariladi va sanaladi.
+"""
+import asyncio
+import itertools
+import json
+from collections import Counter
+
+from base_functions.js_scripts import (
+    CDP_WAIT_FN, CDP_CLICK_POINT_FN, CDP_JS_CLICK_FN,
+    CDP_FOCUS_CLEAR_FN, CDP_TEXT_FN, CDP_VALUE_FN, CDP_SET_VALUE_FN)
+from benchmarks.fake_driver import FakeDOM
+from utils.cdp import WebSocketStream
+
+WAIT_PREFIX = f"({CDP_WAIT_FN})("
+
+
+class _Target:
+    def __init__(self, target_id, context_id):
+        self.target_id = target_id
+        self.context_id = context_id
+        self.dom = FakeDOM()
+        self.focused = None
+        self.points = {}
+        self.announced = 0
+
+
+class FakeCDPServer:
+    """
+    async with FakeCDPServer(latency=0.005) as server:
+        connection = await CDPConnection.connect(server.ws_url)
+    server.on_target(callback) - yangi tab DOM ini to'ldirish uchun: callback(dom)
+    """
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.commands = Counter()
+        self.targets = {}
+        self.sessions = {}
+        self.objects = {}
+        self._ids = itertools.count(1)
+        self._target_factory = None
+        self._server = None
+
+    def on_target(self, callback):
+        self._target_factory = callback
+
+    @property
+    def ws_url(self):
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"ws://{host}:{port}/devtools/browser/fake"
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc):
+        self._server.close()
+        await self._server.wait_closed()
+
+    # ------------------------------------------------------------------------
+
+    async def _handle(self, reader, writer):
+        stream = await WebSocketStream.accept(reader, writer)
+
+        def send(message):
+            if not stream.closed:
+                stream.send_nowait(json.dumps(message))
+
+        tasks = set()
+        try:
+            while True:
+                message = await stream.receive()
+                if message is None:
+                    break
+                # Har bir buyruq alohida: sekin kutish boshqa sessiyalarni to'xtatmaydi
+                task = asyncio.ensure_future(self._execute(json.loads(message), send))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+    async def _execute(self, message, send):
+        method, params = message["method"], message.get("params", {})
+        session_id = message.get("sessionId")
+        self.commands[method] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        target = self.targets.get(self.sessions.get(session_id))
+        reply = {"id": message["id"]}
+        if session_id:
+            reply["sessionId"] = session_id
+        try:
+            reply["result"] = await self._dispatch(method, params, target, session_id, send)
+        except KeyError as e:
+            reply["error"] = {"code": -32000, "message": f"Topilmadi: {e}"}
+        send(reply)
+
+        if target is not None and len(target.dom.alerts) > target.announced:
+            target.announced = len(target.dom.alerts)
+            send({"method": "Page.javascriptDialogOpening", "sessionId": session_id,
+                  "params": {"message": target.dom.alerts[-1], "type": "alert"}})
+
+    def _object(self, element):
+        self.objects[element.id] = element
+        return {"type": "object", "subtype": "node", "objectId": element.id}
+
+    async def _wait(self, target, by, value, wait_type, timeout_ms):
+        loop = asyncio.get_running_loop()
+        end = loop.time() + timeout_ms / 1000
+        while True:
+            elements = target.dom.find_all(by, value)
+            element = elements[0] if elements else None
+            ready = element is not None and (
+                wait_type == "presence"
+                or (element.displayed and (wait_type == "visibility" or element.enabled)))
+            if ready:
+                return self._object(element)
+            if loop.time() >= end:
+                return {"type": "object", "subtype": "null", "value": None}
+            await asyncio.sleep(0.01)
+
+    async def _dispatch(self, method, params, target, session_id, send):
+        if method == "Target.createBrowserContext":
+            return {"browserContextId": f"context-{next(self._ids)}"}
+        if method == "Target.createTarget":
+            target_id = f"target-{next(self._ids)}"
+            self.targets[target_id] = _Target(target_id, params.get("browserContextId"))
+            if self._target_factory:
+                self._target_factory(self.targets[target_id].dom)
+            return {"targetId": target_id}
+        if method == "Target.attachToTarget":
+            session = f"session-{next(self._ids)}"
+            self.sessions[session] = params["targetId"]
+            return {"sessionId": session}
+        if method == "Target.closeTarget":
+            self.targets.pop(params["targetId"], None)
+            return {"success": True}
+
+        if method == "Page.navigate":
+            target.dom.url = params["url"]
+            send({"method": "Page.loadEventFired", "sessionId": session_id, "params": {"timestamp": 0}})
+            return {"frameId": target.target_id}
+        if method == "Page.handleJavaScriptDialog":
+            target.dom.alerts.pop(0)
+            target.announced -= 1
+            send({"method": "Page.javascriptDialogClosed", "sessionId": session_id,
+                  "params": {"result": params["accept"], "userInput": ""}})
+            return {}
+
+        if method == "Runtime.evaluate":
+            expression = params["expression"]
+            if expression.startswith(WAIT_PREFIX):
+                args = json.loads(f"[{expression[len(WAIT_PREFIX):-1]}]")
+                return {"result": await self._wait(target, *args)}
+            return {"exceptionDetails": {"text": "Soxta server bu ifodani bilmaydi"}, "result": {}}
+
+        if method == "Runtime.callFunctionOn":
+            element = self.objects[params["objectId"]]
+            args = [argument.get("value") for argument in params.get("arguments", [])]
+            return {"result": {"type": "object", "value": self._call(target, element, params["functionDeclaration"], args)}}
+
+        if method == "Input.dispatchMouseEvent":
+            if params["type"] == "mouseReleased":
+                element = target.points[(params["x"], params["y"])]
+                element.clicks += 1
+                if element.on_click:
+                    element.on_click(element)
+            return {}
+        if method == "Input.insertText":
+            target.focused.value += params["text"]
+            return {}
+
+        # Page.enable, Runtime.enable, Network.enable va h.k.
+        return {}
+
+    @staticmethod
+    def _call(target, element, function, args):
+        if function == CDP_CLICK_POINT_FN:
+            point = (float(len(target.points)), 10.0)
+            target.points[point] = element
+            return {"x": point[0], "y": point[1], "obscured": element.obscured}
+        if function == CDP_JS_CLICK_FN:
+            element.clicks += 1
+            if element.on_click:
+                element.on_click(element)
+            return None
+        if function == CDP_FOCUS_CLEAR_FN:
+            target.focused = element
+            element.value = ""
+            return None
+        if function == CDP_TEXT_FN:
+            return element.text.strip()
+        if function == CDP_VALUE_FN:
+            return element.value
+        if function == CDP_SET_VALUE_FN:
+            element.value = args[0]
+            return None
+        raise KeyError("functionDeclaration")
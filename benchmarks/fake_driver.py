@@ -0,0 +1,699 @@
+"""
+Brauzersiz, jarayon ichidagi soxta WebDriver.
+
+Haqiqiy selenium Remote WebDriver ishlatiladi, faqat command_executor soxta:
+har bir WebDriver buyrug'i (HTTP round trip) FakeCommandExecutor orqali o'tadi va sanaladi.
+Imkoniyatlar:
+* skript bilan boshqariladigan DOM modeli (FakeDOM, FakeElement, on_click callbacklar)
+* buyruq bo'yicha sun'iy kechikish (latency)
+* stale element va xatolik (timeout va h.k.) in'ektsiyasi
+* iframe (FakeDOM.add_frame) va shadow root (FakeDOM.add_shadow) lar
+"""
+import itertools
+import json
+import time
+from collections import Counter, defaultdict
+
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.locator_converter import LocatorConverter
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from base_functions.js_scripts import (
+    SMART_CLICK_JS, OPTIONS_SNAPSHOT_JS, SELECT_OPTION_JS,
+    RESOLVE_FIELDS_JS, SET_FIELDS_JS, READ_FIELDS_JS,
+    VISIBLE_FLAGS_JS, READ_ELEMENTS_JS, WAIT_FOR_JS)
+from utils.driver import DOCUMENT_ID_JS, NETWORK_TRACKER_JS
+from utils.locators import FIND_ONE_JS, SHADOW_PATH
+from utils.session_cache import STORAGE_SNAPSHOT_JS
+
+# W3C element identifikatori kaliti
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+# 1x1 PNG (screenshot buyrug'i uchun, base64)
+PNG_1X1 = ("iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA"
+           "60e6kgAAAABJRU5ErkJggg==")
+
+_ids = itertools.count(1)
+_converter = LocatorConverter()
+
+
+class FakeElement:
+    """DOM dagi bitta element modeli"""
+
+    def __init__(self, tag="div", text="", attrs=None, displayed=True, enabled=True,
+                 selected=False, obscured=False, value="", children=None, on_click=None,
+                 document=None, shadow_root=None):
+        self.id = f"fake-{next(_ids)}"
+        self.tag = tag
+        self.text = text
+        self.attrs = dict(attrs or {})
+        self.displayed = displayed
+        self.enabled = enabled
+        self.selected = selected
+        self.obscured = obscured
+        self.value = value
+        self.children = list(children or [])
+        self.on_click = on_click
+        # iframe ichidagi hujjat va shadow root (FakeDOM)
+        self.document = document
+        self.shadow_root = shadow_root
+        self.attached = True
+        self.clicks = 0
+
+    def __repr__(self):
+        return f"<FakeElement {self.tag} {self.id}>"
+
+
+class FakeDOM:
+    """Locator -> elementlar xaritasi ko'rinishidagi oddiy DOM modeli"""
+
+    def __init__(self):
+        self.elements = {}
+        self.locators = {}
+        self.alerts = []
+        self.url = "about:blank"
+        # Screenshot buyrug'i qaytaradigan rasm (base64)
+        self.screenshot = PNG_1X1
+        self.cookies = []
+        self.local_storage = {}
+        self.session_storage = {}
+        # Tab tarixi (Page.getNavigationHistory) va origin -> sessionStorage (tab ichida)
+        self.history = []
+        self.session_storages = {}
+        # Hujjat holati: DOCUMENT_ID_JS belgisi va fetch/XHR hisoblagichi o'rnatilganmi
+        self.document_id = None
+        self.network_tracker = False
+
+    @staticmethod
+    def _key(by, value):
+        return _converter.convert(by, value)
+
+    def add(self, locator, element=None, **kwargs):
+        """Locator ostida element qo'shadi va uni qaytaradi"""
+        element = element or FakeElement(**kwargs)
+        self._register(element)
+        self.locators.setdefault(self._key(*locator), []).append(element)
+        return element
+
+    def add_frame(self, locator):
+        """<iframe> qo'shish; uning ichki hujjatini (FakeDOM) qaytaradi"""
+        return self.add(locator, tag="iframe", document=FakeDOM()).document
+
+    def add_shadow(self, locator):
+        """Shadow host qo'shish; uning shadow root ini qaytaradi (elementlar hujjat bilan umumiy)"""
+        root = FakeDOM()
+        root.elements = self.elements
+        return self.add(locator, tag="div", shadow_root=root).shadow_root
+
+    def add_select(self, locator, options, selected=None):
+        """<select> va uning <option> larini qo'shish; option bosilganda select qiymati o'zgaradi"""
+        select = FakeElement(tag="select", value=selected or "")
+
+        def choose(option):
+            for child in select.children:
+                child.selected = child is option
+            select.value = option.text
+
+        select.children = [
+            FakeElement(tag="option", text=text, attrs={"value": text}, selected=text == selected, on_click=choose)
+            for text in options
+        ]
+        return self.add(locator, select)
+
+    def _register(self, element):
+        self.elements[element.id] = element
+        element.attached = True
+        for child in element.children:
+            self._register(child)
+
+    def remove(self, locator):
+        """Locator elementlarini DOM dan olib tashlash (eski handle lar stale bo'ladi)"""
+        for element in self.locators.pop(self._key(*locator), []):
+            self._detach(element)
+
+    def _detach(self, element):
+        element.attached = False
+        for child in element.children:
+            self._detach(child)
+
+    def replace(self, locator, **kwargs):
+        """Elementni yangisi bilan almashtirish (sahifa qayta render qilgandek)"""
+        self.remove(locator)
+        return self.add(locator, **kwargs)
+
+    def find_all(self, by, value):
+        if by == SHADOW_PATH:
+            # Brauzerdagi FIND_ELEMENT_JS kabi: host lar shadow root lari orqali
+            steps = json.loads(value)
+            scope = self
+            for step_by, step_value in steps[:-1]:
+                hosts = scope.find_all(step_by, step_value)
+                if not hosts or hosts[0].shadow_root is None:
+                    return []
+                scope = hosts[0].shadow_root
+            return scope.find_all(*steps[-1])
+        return list(self.locators.get(self._key(by, value), []))
+
+    @staticmethod
+    def find_children(parent, by, value):
+        if by == "tag name":
+            return [child for child in parent.children if child.tag == value]
+        return []
+
+
+class FakeCommandExecutor:
+    """WebDriver buyruqlarini DOM modeli ustida bajaradi va sanaydi"""
+
+    def __init__(self, dom=None, latency=0.0):
+        # Oyna (tab) handle -> DOM; browser context lar: context id -> handle lar
+        self.windows = {"window-1": dom or FakeDOM()}
+        self.current_window = "window-1"
+        # Brauzer darajasida: cookie lar barcha tablar uchun umumiy, localStorage - origin bo'yicha
+        self.cookie_jar = self.windows["window-1"].cookies
+        self.origin_storage = {}
+        self.contexts = {}
+        self._window_ids = itertools.count(2)
+        # Yangi oyna DOM ini to'ldirish uchun: window_factory(dom)
+        self.window_factory = None
+        # Joriy oynada kirilgan iframe lar hujjatlari (SWITCH_TO_FRAME)
+        self.frames = []
+        # W3C sukut bo'yicha timeoutlar (ms)
+        self.timeouts = {"implicit": 0, "pageLoad": 300000, "script": 30000}
+        self.commands = Counter()
+        # Har bir buyruq uchun kechikish (soniya); latencies[command] umumiy qiymatdan ustun
+        self.latency = latency
+        self.latencies = {}
+        # command -> [(error, message)]: navbatdagi chaqiruvlar shu xatolar bilan tugaydi
+        self._faults = defaultdict(list)
+        self._new_document_scripts = {}
+        # Aniq mos keladigan skriptlar birinchi turadi
+        self.scripts = [
+            (lambda script: script == SMART_CLICK_JS, self._smart_click_state),
+            (lambda script: script == DOCUMENT_ID_JS, self._document_id),
+            (lambda script: script == NETWORK_TRACKER_JS, self._install_network_tracker),
+            (lambda script: script == OPTIONS_SNAPSHOT_JS, self._options_snapshot),
+            (lambda script: script == SELECT_OPTION_JS, self._select_option),
+            (lambda script: script == RESOLVE_FIELDS_JS, self._resolve_fields),
+            (lambda script: script == SET_FIELDS_JS, self._set_fields),
+            (lambda script: script == READ_FIELDS_JS, self._read_fields),
+            (lambda script: script == VISIBLE_FLAGS_JS, lambda elements: [el.displayed for el in elements]),
+            (lambda script: script == READ_ELEMENTS_JS, self._read_elements),
+            (lambda script: script == WAIT_FOR_JS, self._wait_for),
+            (lambda script: script == FIND_ONE_JS, lambda by, value: (self.dom.find_all(by, value) or [None])[0]),
+            (lambda script: script == STORAGE_SNAPSHOT_JS, self._storage_snapshot),
+            (lambda script: script.lstrip().startswith("(function (origin, local, session)"), self._storage_restore),
+            (lambda script: script.startswith("/* isDisplayed */"), lambda el: el.displayed),
+            (lambda script: script.startswith("/* getAttribute */"), self._get_attribute),
+            (lambda script: "scrollIntoView" in script, lambda el: None),
+            (lambda script: script == "arguments[0].click();", self._js_click),
+            (lambda script: script == "return arguments[0].value;", lambda el: el.value),
+            (lambda script: script == "arguments[0].value = '';", self._js_clear),
+            (lambda script: script == "document.body.click();", lambda: None),
+            (lambda script: "localStorage.clear()" in script, lambda: None),
+        ]
+
+    # ------------------------------------------------------------------------
+
+    @property
+    def dom(self):
+        return self.frames[-1] if self.frames else self.windows[self.current_window]
+
+    @property
+    def total(self):
+        return sum(self.commands.values())
+
+    def reset(self):
+        self.commands.clear()
+
+    def close(self):
+        pass
+
+    def add_script(self, matches, handler, first=True):
+        """Yangi skript ishlovchisini qo'shish: matches(script) -> bool, handler(*args)"""
+        if first:
+            self.scripts.insert(0, (matches, handler))
+        else:
+            self.scripts.append((matches, handler))
+
+    def inject_error(self, command, error="timeout", times=1, message="In'ektsiya qilingan xato"):
+        """Keyingi `times` ta `command` chaqiruvi W3C xatosi bilan tugaydi (masalan 'timeout')"""
+        self._faults[command].extend([(error, message)] * times)
+
+    def inject_stale(self, command=Command.CLICK_ELEMENT, times=1):
+        self.inject_error(command, "stale element reference", times, "Element DOM dan ajratilgan")
+
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def _ok(value=None):
+        return {"status": 0, "value": value}
+
+    @staticmethod
+    def _error(error, message=""):
+        return {"status": error, "value": {"error": error, "message": message}}
+
+    def _wrap(self, value):
+        if isinstance(value, FakeElement):
+            return {ELEMENT_KEY: value.id}
+        if isinstance(value, dict):
+            return {key: self._wrap(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self._wrap(item) for item in value]
+        return value
+
+    def _unwrap(self, value):
+        if isinstance(value, dict) and ELEMENT_KEY in value:
+            return self._attached(self.dom.elements[value[ELEMENT_KEY]])
+        if isinstance(value, dict):
+            return {key: self._unwrap(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._unwrap(item) for item in value]
+        return value
+
+    @staticmethod
+    def _attached(element):
+        if not element.attached:
+            raise _CommandError("stale element reference", f"{element} DOM dan ajratilgan")
+        return element
+
+    def _element(self, params):
+        return self._attached(self.dom.elements[params["id"]])
+
+    # ------------------------------------------------------------------------
+
+    def _click(self, element):
+        if element.obscured:
+            raise _CommandError("element click intercepted", "Element boshqa element bilan yopilgan")
+        if not element.displayed or not element.enabled:
+            raise _CommandError("element not interactable", "Element bilan ishlab bo'lmaydi")
+        self._activate(element)
+
+    @classmethod
+    def _js_click(cls, element):
+        # JS click occlusion va ko'rinishni tekshirmaydi
+        cls._activate(element)
+
+    @staticmethod
+    def _activate(element):
+        element.clicks += 1
+        if element.tag == "input" and element.attrs.get("type") == "checkbox":
+            element.selected = not element.selected
+        elif element.tag == "input" and element.attrs.get("type") == "radio":
+            element.selected = True
+        if element.on_click:
+            element.on_click(element)
+
+    @staticmethod
+    def _js_clear(element):
+        element.value = ""
+
+    @staticmethod
+    def _get_attribute(element, name):
+        if name == "value":
+            return element.value
+        return element.attrs.get(name)
+
+    def _smart_click_state(self, by, value):
+        elements = self.dom.find_all(by, value)
+        if not elements:
+            return {"state": "missing"}
+        element = elements[0]
+        if not element.displayed:
+            return {"state": "hidden", "element": element}
+        if not element.enabled:
+            return {"state": "disabled", "element": element}
+        if element.obscured:
+            return {"state": "obscured", "element": element, "obscured_by": "div"}
+        return {"state": "ready", "element": element}
+
+    @staticmethod
+    def _options_snapshot(select):
+        if select.tag != "select":
+            return None
+        options = [child for child in select.children if child.tag == "option"]
+        selected = next((i for i, option in enumerate(options) if option.selected), -1)
+        return {
+            "value": select.value,
+            "selectedIndex": selected,
+            "options": [
+                {"index": i, "text": option.text.strip(), "value": option.attrs.get("value", option.text),
+                 "disabled": not option.enabled}
+                for i, option in enumerate(options)
+            ],
+        }
+
+    @staticmethod
+    def _select_option(select, index):
+        options = [child for child in select.children if child.tag == "option"]
+        for i, option in enumerate(options):
+            option.selected = i == index
+        select.value = options[index].attrs.get("value", options[index].text)
+        return select.value
+
+    def _resolve_fields(self, locators):
+        result = []
+        for by, value in locators:
+            elements = self.dom.find_all(by, value)
+            if not elements:
+                result.append(None)
+                continue
+            element = elements[0]
+            kind = element.attrs.get("type", "text") if element.tag == "input" else element.tag
+            if kind not in ("checkbox", "radio", "file", "select"):
+                kind = "text" if element.tag in ("input", "textarea") else "other"
+            options = None
+            if kind == "select":
+                options = self._options_snapshot(element)["options"]
+            result.append({"element": element, "kind": kind, "options": options,
+                           "readonly": not element.enabled or "readonly" in element.attrs})
+        return result
+
+    def _set_fields(self, fields):
+        for element, kind, value in fields:
+            # data-reject-script - JS bilan o'rnatilgan qiymatni qabul qilmaydigan (controlled) input
+            if "data-reject-script" in element.attrs:
+                continue
+            if kind in ("checkbox", "radio"):
+                if element.selected != value:
+                    self._js_click(element)
+            elif kind == "select":
+                self._select_option(element, value)
+            else:
+                element.value = value
+
+    def _read_fields(self, elements):
+        states = []
+        for element in elements:
+            selected = None
+            if element.tag == "select":
+                selected = self._options_snapshot(element)["selectedIndex"]
+            states.append({"value": element.value, "checked": element.selected, "selectedIndex": selected})
+        return states
+
+    def _read_elements(self, by, value, names, offset, limit, visible_only):
+        elements = self.dom.find_all(by, value)
+        rows = []
+        for index in range(offset, min(len(elements), offset + limit)):
+            element = elements[index]
+            if visible_only and not element.displayed:
+                continue
+            rows.append({
+                "index": index,
+                "text": element.text.strip() if element.displayed else "",
+                "visible": element.displayed,
+                "attrs": {name: self._get_attribute(element, name) for name in names},
+            })
+        return {"total": len(elements), "rows": rows}
+
+    def _wait_check(self, by, value, wait_type, target):
+        if wait_type == "element_invisibility":
+            return not target.displayed
+        elements = self.dom.find_all(by, value)
+        if wait_type == "presence_all":
+            return elements or None
+        element = elements[0] if elements else None
+        if wait_type == "invisibility":
+            return element is None or not element.displayed
+        if element is None or (wait_type != "presence" and not element.displayed):
+            return None
+        if wait_type == "clickable" and not element.enabled:
+            return None
+        return element
+
+    def _wait_for(self, by, value, wait_type, timeout_ms, target=None):
+        # Brauzerdagi MutationObserver o'rniga: executor ichida DOM modelini kuzatish
+        end_time = time.monotonic() + timeout_ms / 1000
+        while True:
+            result = self._wait_check(by, value, wait_type, target)
+            if result or time.monotonic() >= end_time:
+                return result or None
+            time.sleep(min(0.005, max(end_time - time.monotonic(), 0)))
+
+    def _origin(self, url=None):
+        url = self.dom.url if url is None else url
+        parts = url.split("/")
+        return "/".join(parts[:3]) if "://" in url else "null"
+
+    def _navigate(self, url):
+        """Hujjat almashadi: localStorage origin niki, sessionStorage tab va origin niki bo'ladi"""
+        dom = self.dom
+        dom.url = url
+        dom.history.append(url)
+        dom.document_id = None
+        dom.network_tracker = False
+        origin = self._origin(url)
+        if origin != "null":
+            dom.local_storage = self.origin_storage.setdefault(origin, {})
+            dom.session_storage = dom.session_storages.setdefault(origin, {})
+
+    def _document_id(self):
+        if self.dom.document_id is None:
+            self.dom.document_id = str(next(_ids))
+        return self.dom.document_id
+
+    def _install_network_tracker(self):
+        self.dom.network_tracker = True
+
+    def _frame_tree(self, dom, frame_id="main"):
+        children = [self._frame_tree(element.document, element.id)
+                    for element in dom.elements.values() if element.document is not None]
+        return {"frame": {"id": frame_id, "url": dom.url}, "childFrames": children}
+
+    def _storage_snapshot(self):
+        return {"origin": self._origin(), "local": dict(self.dom.local_storage),
+                "session": dict(self.dom.session_storage)}
+
+    def _storage_restore(self):
+        # Soxta DOM JS ni bajarmaydi: skriptdagi JSON qiymatlarni o'qiymiz
+        script = self._last_script
+        origin, local, session = json.loads("[" + script[script.rindex("})(") + 3:script.rindex(");")] + "]")
+        if origin == self._origin():
+            self.dom.local_storage.update(local)
+            self.dom.session_storage.update(session)
+
+    def _cdp(self, cmd, params):
+        """Chrome DevTools buyruqlarining kichik qismi (cookie va yangi hujjat skriptlari)"""
+        if cmd == "Network.getAllCookies":
+            return {"cookies": list(self.dom.cookies)}
+        if cmd == "Network.setCookies":
+            self.dom.cookies.extend(params["cookies"])
+            return {}
+        if cmd == "Network.clearBrowserCookies":
+            self.dom.cookies.clear()
+            return {}
+        if cmd == "Network.clearBrowserCache":
+            return {}
+        if cmd == "Storage.clearDataForOrigin":
+            # Chrome kabi: faqat aniq origin ("*" kabi wildcard yo'q); sessionStorage ga tegilmaydi
+            origin = params["origin"]
+            if "://" not in origin:
+                raise _CommandError("unknown error", f"unhandled inspector error: Invalid origin: {origin}")
+            self.origin_storage.get(origin.rstrip("/"), {}).clear()
+            return {}
+        if cmd == "Page.getNavigationHistory":
+            entries = [{"id": index, "url": url, "title": ""} for index, url in enumerate(self.dom.history)]
+            return {"currentIndex": len(entries) - 1, "entries": entries}
+        if cmd == "Page.getFrameTree":
+            return {"frameTree": self._frame_tree(self.dom)}
+        if cmd == "Page.addScriptToEvaluateOnNewDocument":
+            identifier = str(len(self._new_document_scripts) + 1)
+            self._new_document_scripts[identifier] = params["source"]
+            return {"identifier": identifier}
+        if cmd == "Page.removeScriptToEvaluateOnNewDocument":
+            self._new_document_scripts.pop(params["identifier"], None)
+            return {}
+        if cmd == "Target.createBrowserContext":
+            context_id = f"context-{next(_ids)}"
+            self.contexts[context_id] = []
+            return {"browserContextId": context_id}
+        if cmd == "Target.createTarget":
+            handle = self._new_window()
+            if params.get("browserContextId"):
+                self.contexts[params["browserContextId"]].append(handle)
+            return {"targetId": handle}
+        if cmd == "Target.getTargets":
+            owners = {handle: context_id for context_id, handles in self.contexts.items() for handle in handles}
+            return {"targetInfos": [{"targetId": handle, "type": "page", "browserContextId": owners.get(handle, "default")}
+                                    for handle in self.windows]}
+        if cmd == "Target.disposeBrowserContext":
+            for handle in self.contexts.pop(params["browserContextId"]):
+                self.windows.pop(handle, None)
+            return {}
+        raise _CommandError("unknown command", f"Soxta driver bu CDP buyrug'ini bilmaydi: {cmd}")
+
+    def _new_window(self):
+        handle = f"window-{next(self._window_ids)}"
+        self.windows[handle] = FakeDOM()
+        self.windows[handle].cookies = self.cookie_jar
+        if self.window_factory:
+            self.window_factory(self.windows[handle])
+        return handle
+
+    def _execute_script(self, script, args):
+        self._last_script = script
+        for matches, handler in self.scripts:
+            if matches(script):
+                return handler(*args)
+        raise _CommandError("javascript error", f"Soxta driver bu skriptni bilmaydi: {script[:60]}")
+
+    def _alert(self):
+        if not self.dom.alerts:
+            raise _CommandError("no such alert", "Alert ochiq emas")
+        return self.dom.alerts
+
+    # ------------------------------------------------------------------------
+
+    def execute(self, command, params):
+        self.commands[command] += 1
+        delay = self.latencies.get(command, self.latency)
+        if delay:
+            time.sleep(delay)
+        try:
+            if self._faults.get(command):
+                raise _CommandError(*self._faults[command].pop(0))
+            return self._ok(self._wrap(self._dispatch(command, params or {})))
+        except _CommandError as e:
+            return self._error(e.error, e.message)
+
+    def _dispatch(self, command, params):
+        if command == Command.NEW_SESSION:
+            return {"sessionId": "fake-session", "capabilities": {"browserName": "chrome"}}
+
+        if command in (Command.FIND_ELEMENT, Command.FIND_ELEMENTS):
+            elements = self.dom.find_all(params["using"], params["value"])
+            if command == Command.FIND_ELEMENTS:
+                return elements
+            if not elements:
+                raise _CommandError("no such element", f"Element topilmadi: {params['value']}")
+            return elements[0]
+
+        if command in (Command.FIND_CHILD_ELEMENT, Command.FIND_CHILD_ELEMENTS):
+            elements = self.dom.find_children(self._element(params), params["using"], params["value"])
+            if command == Command.FIND_CHILD_ELEMENTS:
+                return elements
+            if not elements:
+                raise _CommandError("no such element", f"Element topilmadi: {params['value']}")
+            return elements[0]
+
+        if command in (Command.W3C_EXECUTE_SCRIPT, Command.W3C_EXECUTE_SCRIPT_ASYNC):
+            return self._execute_script(params["script"], self._unwrap(params.get("args", [])))
+
+        if command == Command.CLICK_ELEMENT:
+            return self._click(self._element(params))
+        if command == Command.CLEAR_ELEMENT:
+            self._element(params).value = ""
+            return None
+        if command == Command.SEND_KEYS_TO_ELEMENT:
+            element = self._element(params)
+            element.value += params.get("text", "")
+            return None
+        if command == Command.GET_ELEMENT_TEXT:
+            return self._element(params).text
+        if command == Command.GET_ELEMENT_TAG_NAME:
+            return self._element(params).tag
+        if command == Command.IS_ELEMENT_ENABLED:
+            return self._element(params).enabled
+        if command == Command.IS_ELEMENT_SELECTED:
+            return self._element(params).selected
+        if command == Command.GET_ELEMENT_PROPERTY:
+            return self._get_attribute(self._element(params), params["name"])
+
+        if command == Command.W3C_GET_ALERT_TEXT:
+            return self._alert()[0]
+        if command in (Command.W3C_ACCEPT_ALERT, Command.W3C_DISMISS_ALERT):
+            self._alert().pop(0)
+            return None
+
+        if command == Command.GET:
+            self.frames = []
+            self._navigate(params["url"])
+            # Page.addScriptToEvaluateOnNewDocument skriptlari yangi hujjatda bajariladi
+            for script in self._new_document_scripts.values():
+                self._execute_script(script, [])
+            return None
+        if command == "executeCdpCommand":
+            return self._cdp(params["cmd"], params.get("params", {}))
+        if command == Command.GET_ALL_COOKIES:
+            return list(self.dom.cookies)
+        if command == Command.ADD_COOKIE:
+            self.dom.cookies.append(params["cookie"])
+            return None
+        if command == Command.GET_CURRENT_URL:
+            return self.dom.url
+        if command == Command.SCREENSHOT:
+            return self.dom.screenshot
+
+        if command == Command.W3C_GET_WINDOW_HANDLES:
+            return list(self.windows)
+        if command == Command.W3C_GET_CURRENT_WINDOW_HANDLE:
+            if self.current_window not in self.windows:
+                raise _CommandError("no such window", "Joriy oyna yopilgan")
+            return self.current_window
+        if command == Command.SWITCH_TO_WINDOW:
+            if params["handle"] not in self.windows:
+                raise _CommandError("no such window", f"Oyna topilmadi: {params['handle']}")
+            self.current_window = params["handle"]
+            self.frames = []
+            return None
+        if command == Command.SWITCH_TO_FRAME:
+            if params["id"] is None:
+                self.frames = []
+                return None
+            frame = self._unwrap(params["id"])
+            if not isinstance(frame, FakeElement) or frame.document is None:
+                raise _CommandError("no such frame", f"Frame topilmadi: {params['id']}")
+            self.frames.append(frame.document)
+            return None
+        if command == Command.SWITCH_TO_PARENT_FRAME:
+            if self.frames:
+                self.frames.pop()
+            return None
+        if command == Command.NEW_WINDOW:
+            return {"handle": self._new_window(), "type": "window"}
+        if command == Command.CLOSE:
+            self.windows.pop(self.current_window, None)
+            self.frames = []
+            return list(self.windows)
+
+        if command == Command.GET_TIMEOUTS:
+            return dict(self.timeouts)
+        if command == Command.SET_TIMEOUTS:
+            self.timeouts.update((key, params[key]) for key in self.timeouts if key in params)
+            return None
+
+        # Qolgan buyruqlar (cookies...) jim bajariladi
+        return None
+
+
+class _CommandError(Exception):
+    def __init__(self, error, message=""):
+        self.error = error
+        self.message = message
+        super().__init__(message)
+
+
+class FakeDriver(WebDriver):
+    """Soxta executor ustida ishlaydigan haqiqiy selenium WebDriver"""
+
+    def __init__(self, dom=None, latency=0.0):
+        self.executor = FakeCommandExecutor(dom, latency=latency)
+        super().__init__(command_executor=self.executor, options=Options())
+        # Mahalliy chromedriver kabi: fayl yo'llari upload qilinmasdan send_keys bilan yuboriladi
+        self._is_remote = False
+        self.executor.reset()
+
+    @property
+    def dom(self):
+        return self.executor.dom
+
+    @property
+    def commands(self):
+        return self.executor.commands
+
+    @property
+    def command_count(self):
+        return self.executor.total
+
+    def reset_commands(self):
+        self.executor.reset()
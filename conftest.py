@@ -0,0 +1,156 @@
+import os
+
+import pytest
+
+# Selenium ni yuklaydigan modullar (utils.driver, utils.driver_pool, utils.browser_contexts,
+# utils.session_cache) fixture lar ichida import qilinadi - test yig'ish (collection) ularsiz tezroq
+from utils.click_strategies import save_click_strategies
+from utils.events import flush_events
+from utils.logger import flush_logs, release_logger, set_current_test, reset_current_test
+from utils.profiler import profiler
+from utils.retry import budget_report, finish_retry_budget, sleep_report
+from utils.screenshots import flush_screenshots
+
+
+def pytest_addoption(parser):
+    parser.addoption("--basepage-profile", action="store_true", default=False,
+                     help="BasePage amallarini profillash va sessiya oxirida hisobot chiqarish")
+
+
+def pytest_configure(config):
+    if config.getoption("--basepage-profile"):
+        profiler.enable()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """
+    Test nomini contextvar ga yozish: BasePage uni stack ni aylanib chiqmasdan oladi.
+    Test (fixture teardown lari bilan) tugagach uning loggeri yopiladi - fayl va thread lar to'planmaydi.
+    """
+    test_name = getattr(item, "originalname", None) or item.name
+    token = set_current_test(test_name, item.nodeid)
+    yield
+    reset_current_test(token)
+    release_logger(test_name)
+
+
+def pytest_runtest_teardown(item):
+    """Test oxirida navbat va buferdagi loglar va screenshotlarni faylga yozish, retry byudjetini yopish"""
+    flush_logs()
+    flush_events()
+    flush_screenshots(key=getattr(item, "originalname", None) or item.name)
+    finish_retry_budget(item.nodeid)
+
+
+def pytest_sessionfinish(session):
+    """O'rganilgan click usullarini diskka yozish (xdist worker lari ham)"""
+    stats = save_click_strategies()
+    if stats:
+        session.config._click_strategy_stats = stats
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Sessiya oxirida retry kutish vaqtlari, retry byudjeti va profiler hisobotini chiqarish"""
+    report = sleep_report()
+    if report:
+        terminalreporter.section("Retry kutish vaqti (policy bo'yicha)")
+        for test_name, policies in sorted(report.items()):
+            details = ", ".join(f"{name}: {seconds:.2f}s" for name, seconds in sorted(policies.items()))
+            terminalreporter.write_line(f"{test_name}: {sum(policies.values()):.2f}s ({details})")
+
+    budgets = budget_report()
+    if budgets:
+        terminalreporter.section("Retry byudjeti")
+        for test_name, budget in sorted(budgets.items()):
+            terminalreporter.write_line(
+                f"{test_name}: sarflandi {budget['spent']:.2f}s, tejaldi ~{budget['saved']:.2f}s "
+                f"(fail fast: {budget['fail_fast']}, byudjet tugadi: {budget['exhausted']})")
+        total_saved = sum(budget["saved"] for budget in budgets.values())
+        terminalreporter.write_line(f"Jami tejalgan vaqt: ~{total_saved:.2f}s")
+
+    click_stats = getattr(terminalreporter.config, "_click_strategy_stats", None)
+    if click_stats and click_stats["learned_hits"]:
+        terminalreporter.section("O'rganilgan click usullari")
+        terminalreporter.write_line(
+            f"qisqa yo'l: {click_stats['learned_hits']}, revalidatsiya: {click_stats['revalidations']}, "
+            f"qaytishlar: {click_stats['fallbacks']}, tejaldi ~{click_stats['saved_seconds']:.2f}s")
+
+    if profiler.enabled:
+        profile_report = profiler.report()
+        if profile_report:
+            terminalreporter.section("BasePage profiler")
+            terminalreporter.write_line(profile_report)
+
+
+@pytest.fixture(scope="session")
+def driver_pool():
+    """Har bir xdist worker uchun oldindan ishga tushirilgan brauzerlar havzasi"""
+    from utils.driver_pool import DriverPool
+
+    pool = DriverPool(
+        size=int(os.getenv("DRIVER_POOL_SIZE", "1")),
+        url=os.getenv("DRIVER_POOL_URL", "about:blank"),
+        max_uses=int(os.getenv("DRIVER_POOL_MAX_USES", "50")),
+        max_memory_mb=int(os.getenv("DRIVER_POOL_MAX_MEMORY_MB", "1024")),
+    )
+    pool.warm_up()
+    yield pool
+    pool.close_all()
+
+
+@pytest.fixture(scope="session")
+def browser_contexts():
+    """
+    Worker uchun bitta Chrome jarayoni. Context lar test darajasida: driver fixture har bir testga
+    yangi context ochadi va test tugashi bilan yopadi (yopilgan context driveri ishlatilmaydi).
+    Worker ichida testlar ketma-ket ishlaydi - foyda parallellikda emas, brauzerni qayta ishga tushirmaslik
+    va xotirada. Bir test ichida bir nechta context ni threadlarda parallel ishlatish mumkin:
+    browser_contexts.new_driver() (buyruqlar _FairLock navbatida almashinadi).
+    """
+    from utils.browser_contexts import BrowserContexts
+    from utils.driver import get_driver
+
+    contexts = BrowserContexts(get_driver("about:blank", headless=True))
+    yield contexts
+    contexts.close_all()
+
+
+@pytest.fixture
+def driver(request):
+    """
+    Havzadan olingan, holati tozalangan brauzer.
+    BROWSER_CONTEXTS=1 - alohida brauzer o'rniga umumiy brauzerdagi yangi browser context
+    """
+    if os.getenv("BROWSER_CONTEXTS", "").strip().lower() in ("1", "true", "yes", "on"):
+        with request.getfixturevalue("browser_contexts").context() as context_driver:
+            yield context_driver
+        return
+
+    # Havzada bo'sh brauzer kutish chegarasi: brauzer ishga tushmasa test abadiy osilib qolmaydi
+    acquire_timeout = float(os.getenv("DRIVER_POOL_ACQUIRE_TIMEOUT", "300"))
+    with request.getfixturevalue("driver_pool").driver(timeout=acquire_timeout) as pooled_driver:
+        yield pooled_driver
+
+
+@pytest.fixture(scope="session")
+def session_cache():
+    """
+    Nomlangan setup holatlari keshi (workerlar orasida fayl orqali umumiy):
+        session_cache.ensure(driver, "login", setup=login_flow)
+    """
+    from utils.session_cache import SessionCache
+
+    return SessionCache()
+
+
+@pytest.fixture
+def pages(driver):
+    """
+    pages/ dagi sahifalar shu test driveri bilan, birinchi murojaatda import qilinadi:
+        def test_login(pages):
+            pages.LoginPage.login(...)
+    """
+    from pages import registry
+
+    return registry.bind(driver)
@@ -0,0 +1,21 @@
+"""
+Page object lar paketi. Klasslar nomi bo'yicha dangasa (lazy) yuklanadi:
+    from pages import LoginPage          # faqat login_page.py import qilinadi
+    from pages import registry
+    registry.create("LoginPage", driver)
+"""
+import os
+
+from utils.page_registry import PageRegistry
+
+registry = PageRegistry(__name__, os.path.dirname(__file__))
+
+
+def __getattr__(name):
+    if name in registry:
+        return registry.get(name)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(registry.names()))
@@ -0,0 +1,143 @@
+import asyncio
+import time
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from base_functions.async_base_page import AsyncBasePage
+from benchmarks.fake_cdp import WAIT_PREFIX, FakeCDPServer
+from utils.cdp import CDPConnection
+from utils.exeption import ElementInteractionError, ElementStaleError
+from utils.retry import DETERMINISTIC, RetryBudget, classify_failure
+
+NAME = (By.NAME, "first_name")
+SUBMIT = (By.ID, "submit")
+
+
+class MaskedInputServer(FakeCDPServer):
+    """Input.insertText oxirgi belgini yo'qotadi (input mask kabi)"""
+
+    async def _dispatch(self, method, params, target, session_id, send):
+        if method == "Input.insertText":
+            target.focused.value += params["text"][:-1]
+            return {}
+        return await super()._dispatch(method, params, target, session_id, send)
+
+
+class InvalidSelectorServer(FakeCDPServer):
+    """Brauzer kabi: querySelector noto'g'ri selector da SyntaxError tashlaydi"""
+
+    async def _dispatch(self, method, params, target, session_id, send):
+        if method == "Runtime.evaluate" and params["expression"].startswith(WAIT_PREFIX + '"css selector", "div["'):
+            return {"result": {}, "exceptionDetails": {"text": "Uncaught (in promise)", "exception": {
+                "description": "SyntaxError: Failed to execute 'querySelector' on 'Document': 'div[' is not a valid selector."}}}
+        return await super()._dispatch(method, params, target, session_id, send)
+
+
+def run(scenario, server_class=FakeCDPServer):
+    async def main():
+        async with server_class() as server:
+            elements = {}
+
+            def build(dom):
+                elements["dom"] = dom
+                elements["name"] = dom.add(NAME, tag="input")
+                elements["submit"] = dom.add(SUBMIT, tag="button", text="Submit")
+            server.on_target(build)
+            connection = await CDPConnection.connect(server.ws_url)
+            session = await connection.new_session(url="http://localhost/form")
+            try:
+                return await scenario(AsyncBasePage(session), elements)
+            finally:
+                await session.close()
+                await connection.close()
+    return asyncio.run(main())
+
+
+def test_input_check_reapplies_value():
+    async def scenario(page, elements):
+        assert await page.input_text(NAME, "Bexruz", check=True) is True
+        return elements["name"].value
+    assert run(scenario, MaskedInputServer) == "Bexruz"
+
+
+def test_obscured_click_falls_back_to_js_click():
+    async def scenario(page, elements):
+        elements["submit"].obscured = True
+        assert await page.click(SUBMIT, retries=2, retry_delay=0.01)
+        return elements["submit"].clicks
+    assert run(scenario) == 1
+
+
+def _always_stale(page):
+    async def call_on(object_id, function, locator=None, args=()):
+        raise ElementStaleError("Element DOM da yangilandi", locator)
+    page._call_on = call_on
+
+
+def test_no_sleep_after_last_attempt():
+    async def scenario(page, elements):
+        _always_stale(page)
+        started = time.monotonic()
+        with pytest.raises(ElementInteractionError):
+            await page.click(SUBMIT, retries=2, retry_delay=0.3)
+        return time.monotonic() - started
+    assert run(scenario) < 0.5
+
+
+def test_exhausted_budget_stops_retries():
+    async def scenario(page, elements):
+        _always_stale(page)
+        page.retry_budget = RetryBudget(seconds=0)
+        started = time.monotonic()
+        with pytest.raises(ElementStaleError):
+            await page.get_text(SUBMIT, retries=3, retry_delay=0.3)
+        return time.monotonic() - started, page.retry_budget.exhausted_stops
+    elapsed, stops = run(scenario)
+    assert elapsed < 0.25 and stops == 1
+
+
+def test_retry_sleep_is_capped_by_action_deadline():
+    async def scenario(page, elements):
+        _always_stale(page)
+        page.action_timeout = 0.2
+        started = time.monotonic()
+        with pytest.raises(ElementStaleError):
+            await page.input_text(NAME, "x", retries=5, retry_delay=1)
+        return time.monotonic() - started
+    assert run(scenario) < 0.6
+
+
+def test_invalid_selector_is_not_retried():
+    async def scenario(page, elements):
+        with pytest.raises(ElementInteractionError) as error:
+            await page.click((By.CSS_SELECTOR, "div["), retries=3, retry_delay=0.3)
+        return error.value
+    started = time.monotonic()
+    error = run(scenario, InvalidSelectorServer)
+    assert classify_failure(error) == DETERMINISTIC
+    assert time.monotonic() - started < 0.3
+
+
+def test_handle_alert_ignores_stale_dialog_event():
+    async def scenario(page, elements):
+        # Oldingi amaldan qolgan, allaqachon yopilgan dialog hodisasi
+        page._dialogs.put_nowait({"message": "eski", "type": "alert"})
+        elements["submit"].on_click = lambda element: elements["dom"].alerts.append("yangi")
+        messages = []
+        page.logger.info = lambda msg, *args: messages.append(msg % args)
+        await page.click(SUBMIT)
+        assert await page.handle_alert(timeout=2) is True
+        return messages
+
+    messages = run(scenario)
+    assert "Alert matni: 'yangi'" in " ".join(messages)
+    assert "eski" not in " ".join(messages)
+
+
+def test_dialog_closed_event_drops_pending_dialog():
+    async def scenario(page, elements):
+        page._dialogs.put_nowait({"message": "eski", "type": "alert"})
+        page.session.connection._dispatch("Page.javascriptDialogClosed", {"result": True}, page.session.session_id)
+        return page._dialogs.qsize()
+    assert run(scenario) == 0
@@ -0,0 +1,101 @@
+import threading
+
+import pytest
+from selenium.common.exceptions import InvalidSelectorException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+
+from base_functions.base_page import BasePage
+from base_functions.js_scripts import SMART_CLICK_JS, WAIT_FOR_JS
+from benchmarks.fake_driver import FakeDriver
+from utils.exeption import ElementInteractionError
+from utils.retry import DETERMINISTIC, classify_failure
+
+BUTTON = (By.ID, "submit")
+
+
+def test_second_alert_gets_fresh_deadline():
+    driver = FakeDriver()
+    page = BasePage(driver)
+    # Birinchi alert deadline ning ko'p qismini yeydi; keyingisi undan keyin chiqadi
+    timers = [threading.Timer(1.2, driver.dom.alerts.append, ["birinchi"]),
+              threading.Timer(2.4, driver.dom.alerts.append, ["ikkinchi"])]
+    for timer in timers:
+        timer.start()
+    assert page.handle_alert(second_alert=True, timeout=2) is True
+    for timer in timers:
+        timer.join()
+    # Ikkinchi alert ham qabul qilingan
+    assert driver.dom.alerts == []
+
+
+def _smart_page(driver):
+    page = BasePage(driver)
+    page.smart_click_timeout = 0.3
+    page.smart_click_poll = 0.05
+    return page
+
+
+def test_smart_click_uses_single_script_and_native_click():
+    driver = FakeDriver()
+    button = driver.dom.add(BUTTON, tag="button")
+    page = _smart_page(driver)
+    driver.reset_commands()
+    assert page.click(BUTTON, smart=True) is True
+    assert button.clicks == 1
+    assert driver.executor.commands[Command.W3C_EXECUTE_SCRIPT] == 1
+    assert driver.executor.commands[Command.CLICK_ELEMENT] == 1
+    assert driver.executor.commands[Command.FIND_ELEMENTS] + driver.executor.commands[Command.FIND_ELEMENT] == 0
+
+
+def test_smart_click_waits_for_overlay_to_go_away():
+    driver = FakeDriver()
+    button = driver.dom.add(BUTTON, tag="button", obscured=True)
+    timer = threading.Timer(0.1, setattr, [button, "obscured", False])
+    timer.start()
+    assert _smart_page(driver)._smart_click(BUTTON) is True
+    timer.join()
+    assert button.clicks == 1
+
+
+def test_occluded_smart_click_falls_back_to_js_click():
+    driver = FakeDriver()
+    button = driver.dom.add(BUTTON, tag="button", obscured=True)
+    page = _smart_page(driver)
+    assert page.click(BUTTON, smart=True, retry_delay=0) is True
+    # Smart click kutib, keyin native (intercepted) va JS click zanjiri
+    assert button.clicks == 1
+    assert driver.executor.commands[Command.CLICK_ELEMENT] == 2
+
+
+def test_smart_click_on_detached_element_is_retried():
+    driver = FakeDriver()
+    old = driver.dom.add(BUTTON, tag="button")
+    rendered = []
+
+    def rerender(by, value):
+        # Skript element qaytargandan keyin sahifa uni qayta chizadi
+        result = driver.executor._smart_click_state(by, value)
+        if not rendered:
+            rendered.append(driver.dom.replace(BUTTON, tag="button"))
+        return result
+
+    driver.executor.scripts.insert(0, (lambda script: script == SMART_CLICK_JS, rerender))
+    assert _smart_page(driver).click(BUTTON, smart=True, retry_delay=0) is True
+    assert old.clicks == 0
+    assert rendered[0].clicks == 1
+
+
+def test_invalid_selector_in_wait_script_fails_fast():
+    driver = FakeDriver()
+    error = "SyntaxError: Failed to execute 'querySelector' on 'Document': 'div[' is not a valid selector."
+    driver.executor.scripts.insert(0, (lambda script: script == WAIT_FOR_JS, lambda *args: {"error": error}))
+    page = BasePage(driver)
+    page.event_waits = True
+    page.take_screenshot = lambda name=None: None
+    driver.reset_commands()
+    with pytest.raises(ElementInteractionError) as raised:
+        page.click((By.CSS_SELECTOR, "div["), retries=3, retry_delay=0.3)
+    assert isinstance(raised.value.original_error, InvalidSelectorException)
+    assert classify_failure(raised.value) == DETERMINISTIC
+    assert driver.executor.commands[Command.W3C_EXECUTE_SCRIPT_ASYNC] == 1
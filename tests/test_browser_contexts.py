@@ -0,0 +1,90 @@
+import threading
+import time
+
+import pytest
+from selenium.common.exceptions import NoSuchWindowException
+from selenium.webdriver.remote.command import Command
+
+from benchmarks.fake_driver import FakeDriver
+from utils.browser_contexts import BrowserContexts, _FairLock
+
+
+def test_contexts_run_commands_in_their_own_window():
+    base = FakeDriver()
+    contexts = BrowserContexts(base)
+    first = contexts.new_driver("https://a.example/")
+    second = contexts.new_driver("https://b.example/")
+    assert first.context_id != second.context_id
+
+    base.reset_commands()
+    assert first.current_url == "https://a.example/"
+    assert second.current_url == "https://b.example/"
+    assert first.current_url == "https://a.example/"
+    assert base.executor.commands[Command.SWITCH_TO_WINDOW] == 3
+    # Oyna o'zgarmasa qayta almashtirilmaydi
+    first.get("https://a.example/next")
+    assert base.executor.commands[Command.SWITCH_TO_WINDOW] == 3
+
+
+def test_close_disposes_context_and_its_windows():
+    base = FakeDriver()
+    contexts = BrowserContexts(base)
+    with contexts.context("https://a.example/") as driver:
+        handle, context_id = driver.context_handle, driver.context_id
+        assert handle in base.executor.windows
+    assert handle not in base.executor.windows
+    assert context_id not in base.executor.contexts
+    assert contexts.drivers == []
+    assert base.current_window_handle == contexts.home_handle
+
+
+def test_closed_context_driver_is_invalidated():
+    base = FakeDriver()
+    contexts = BrowserContexts(base)
+    other = contexts.new_driver("https://b.example/")
+    with contexts.context("https://a.example/") as driver:
+        pass
+    assert driver.context_handle is None and driver.context_id is None
+    base.reset_commands()
+    with pytest.raises(NoSuchWindowException):
+        driver.get("https://a.example/again")
+    # Hech qanday buyruq (boshqa context oynasiga ham) yuborilmadi
+    assert base.executor.commands == {}
+    driver.quit()
+    assert other.current_url == "https://b.example/"
+
+
+def test_without_cdp_falls_back_to_windows():
+    base = FakeDriver()
+    base.executor.inject_error("executeCdpCommand", "unknown command")
+    contexts = BrowserContexts(base)
+    driver = contexts.new_driver("https://a.example/")
+    handle = driver.context_handle
+    assert contexts.isolation == "window" and driver.context_id is None
+    assert driver.window_handles == [contexts.home_handle, handle]
+    contexts.close(driver)
+    assert handle not in base.executor.windows
+
+
+def test_fair_lock_is_fifo_and_reentrant():
+    lock = _FairLock()
+    order = []
+
+    def worker(name):
+        with lock:
+            order.append(name)
+
+    with lock:
+        with lock:
+            threads = []
+            for name in "abc":
+                thread = threading.Thread(target=worker, args=(name,))
+                thread.start()
+                threads.append(thread)
+                # Navbatga shu tartibda tushsin
+                while lock.waiting < len(threads):
+                    time.sleep(0.001)
+        assert order == []
+    for thread in threads:
+        thread.join()
+    assert order == ["a", "b", "c"]
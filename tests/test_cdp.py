@@ -0,0 +1,42 @@
+import asyncio
+
+from wsproto import ConnectionType, WSConnection
+from wsproto.events import AcceptConnection, Message, Ping, Pong, Request
+
+from utils.cdp import WebSocketStream
+
+
+def test_fragmented_message_and_ping_are_handled():
+    async def main():
+        pongs = []
+
+        async def handler(reader, writer):
+            ws = WSConnection(ConnectionType.SERVER)
+            ws.receive_data(await reader.read(65536))
+            assert any(isinstance(event, Request) for event in ws.events())
+            writer.write(ws.send(AcceptConnection()))
+            writer.write(ws.send(Ping(payload=b"tirik")))
+            writer.write(ws.send(Message(data='{"id": 1, ', message_finished=False)))
+            writer.write(ws.send(Message(data='"result": {}}', message_finished=True)))
+            while not pongs:
+                data = await reader.read(65536)
+                if not data:
+                    break
+                ws.receive_data(data)
+                pongs.extend(event.payload for event in ws.events() if isinstance(event, Pong))
+            writer.close()
+
+        server = await asyncio.start_server(handler, "127.0.0.1", 0)
+        host, port = server.sockets[0].getsockname()[:2]
+        stream = await WebSocketStream.connect(f"ws://{host}:{port}/devtools/browser/x")
+        message = await stream.receive()
+        # Ulanish server tomonidan yopiladi
+        assert await stream.receive() is None
+        await stream.close()
+        server.close()
+        await server.wait_closed()
+        return message, pongs
+
+    message, pongs = asyncio.run(main())
+    assert message == '{"id": 1, "result": {}}'
+    assert pongs == [b"tirik"]
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from selenium.webdriver.common.by import By
+
+from base_functions.base_page import BasePage
+from benchmarks.fake_driver import FakeDriver
+from utils.click_strategies import ClickStrategyStore
+
+BUTTON = (By.ID, "submit")
+
+
+def test_learned_js_shortcut_and_revalidation():
+    store = ClickStrategyStore("strategies.json", revalidate_every=3)
+    assert store.lookup("LoginPage", BUTTON) is None
+    store.record("LoginPage", BUTTON, "js", 1.0)
+    assert [store.lookup("LoginPage", BUTTON) for _ in range(3)] == ["js", "js", None]
+    assert store.stats["revalidations"] == 1
+
+
+def test_native_success_forgets_locator():
+    store = ClickStrategyStore("strategies.json")
+    store.record("LoginPage", BUTTON, "js", 1.0)
+    store.record("LoginPage", BUTTON, "native", 0.1)
+    assert store.lookup("LoginPage", BUTTON) is None
+
+
+def test_saved_seconds_use_chain_cost():
+    store = ClickStrategyStore("strategies.json")
+    store.record("LoginPage", BUTTON, "js", 1.0)
+    store.record("LoginPage", BUTTON, "js", 2.0)
+    assert store.chain_cost("LoginPage", BUTTON) == pytest.approx(1.3)
+    assert store.record_learned("LoginPage", BUTTON, 0.3) == pytest.approx(1.0)
+
+
+def test_save_merges_entries_of_other_processes():
+    first = ClickStrategyStore("strategies.json")
+    second = ClickStrategyStore("strategies.json")
+    first.record("A", BUTTON, "js", 1.0)
+    second.record("B", BUTTON, "js", 1.0)
+    first.save()
+    second.save()
+    with open("strategies.json", encoding="utf-8") as f:
+        assert sorted(json.load(f)) == ["A|id|submit", "B|id|submit"]
+    assert ClickStrategyStore("strategies.json").lookup("A", BUTTON) == "js"
+
+
+def test_page_learns_js_click_for_obscured_button():
+    driver = FakeDriver()
+    button = driver.dom.add(BUTTON, tag="button", text="Submit", obscured=True)
+    page = BasePage(driver)
+    page.click_strategies = ClickStrategyStore("strategies.json")
+    page.click(BUTTON, retry_delay=0.01)
+    driver.reset_commands()
+    page.click(BUTTON, retry_delay=0.01)
+    assert button.clicks == 2
+    assert page.click_strategies.stats["learned_hits"] == 1
+    assert "clickElement" not in driver.executor.commands
@@ -0,0 +1,77 @@
+import os
+import stat
+
+import pytest
+
+from utils import driver_cache
+from utils.driver_cache import get_chrome_version, resolve_driver_path
+
+
+class FakeManager:
+    """webdriver_manager.ChromeDriverManager o'rnida: tarmoqsiz "yuklab olish" ni sanaydi"""
+
+    installs = 0
+
+    def install(self):
+        FakeManager.installs += 1
+        path = os.path.abspath(f"downloaded-{FakeManager.installs}")
+        with open(path, "w") as f:
+            f.write("driver")
+        os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR)
+        return path
+
+
+@pytest.fixture(autouse=True)
+def manager(monkeypatch):
+    FakeManager.installs = 0
+    monkeypatch.setattr("webdriver_manager.chrome.ChromeDriverManager", FakeManager)
+    monkeypatch.delenv("CHROMEDRIVER_PATH", raising=False)
+    monkeypatch.delenv("DRIVER_OFFLINE", raising=False)
+    monkeypatch.setenv("PATH", "")
+    get_chrome_version.cache_clear()
+    yield
+    get_chrome_version.cache_clear()
+
+
+def _version(monkeypatch, version):
+    monkeypatch.setattr(driver_cache, "get_chrome_version", lambda: version)
+
+
+def test_downloaded_driver_is_cached_by_major_version(monkeypatch):
+    _version(monkeypatch, "126.0.6478.126")
+    first = resolve_driver_path(cache_dir="cache")
+    assert first == os.path.join("cache", "126", driver_cache._driver_filename())
+    _version(monkeypatch, "126.0.6478.182")
+    assert resolve_driver_path(cache_dir="cache") == first
+    assert resolve_driver_path(cache_dir="cache", offline=True) == first
+    assert FakeManager.installs == 1
+
+
+def test_unknown_version_skips_cache(monkeypatch):
+    _version(monkeypatch, None)
+    assert resolve_driver_path(cache_dir="cache").endswith("downloaded-1")
+    assert resolve_driver_path(cache_dir="cache").endswith("downloaded-2")
+    assert not os.path.exists("cache") or os.listdir("cache") == []
+
+
+def test_unknown_version_offline_needs_driver_on_path(monkeypatch, tmp_path):
+    _version(monkeypatch, None)
+    with pytest.raises(FileNotFoundError, match="aniqlanmadi"):
+        resolve_driver_path(cache_dir="cache", offline=True)
+
+    system_driver = tmp_path / driver_cache._driver_filename()
+    system_driver.write_text("driver")
+    system_driver.chmod(0o755)
+    monkeypatch.setenv("PATH", str(tmp_path))
+    assert resolve_driver_path(cache_dir="cache", offline=True) == str(system_driver)
+    assert FakeManager.installs == 0
+
+
+def test_env_path_wins(monkeypatch):
+    monkeypatch.setenv("CHROME_VERSION", "126.0.6478.126")
+    assert get_chrome_version() == "126.0.6478.126"
+    with open("custom-driver", "w") as f:
+        f.write("driver")
+    monkeypatch.setenv("CHROMEDRIVER_PATH", "custom-driver")
+    assert resolve_driver_path(cache_dir="cache") == "custom-driver"
+    assert FakeManager.installs == 0
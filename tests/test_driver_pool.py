@@ -0,0 +1,144 @@
+import threading
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from benchmarks.fake_driver import FakeDriver
+from utils.driver_pool import DriverPool
+
+
+class FlakyFactory:
+    """Birinchi failures ta chaqiruvda brauzer ishga tushmaydi"""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.created = []
+
+    def __call__(self):
+        if self.failures:
+            self.failures -= 1
+            raise WebDriverException("chrome ishga tushmadi")
+        driver = FakeDriver()
+        self.created.append(driver)
+        return driver
+
+
+def test_acquire_reuses_released_driver():
+    pool = DriverPool(size=1, max_memory_mb=0, factory=FlakyFactory())
+    with pool.driver() as first:
+        pass
+    with pool.driver() as second:
+        pass
+    assert first is second
+    assert pool.stats()["created"] == 1
+
+
+def test_failed_create_frees_slot():
+    factory = FlakyFactory(failures=1)
+    pool = DriverPool(size=1, max_memory_mb=0, factory=factory)
+    with pytest.raises(WebDriverException):
+        pool.acquire(timeout=0.1)
+    assert pool.stats()["in_use"] == 0
+    driver = pool.acquire(timeout=0.1)
+    assert driver is factory.created[0]
+
+
+def test_acquire_timeout_raises():
+    pool = DriverPool(size=1, max_memory_mb=0, factory=FlakyFactory())
+    pool.acquire()
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.05)
+
+
+def test_warm_up_keeps_started_drivers_when_one_fails():
+    factory = FlakyFactory(failures=1)
+    pool = DriverPool(size=3, max_memory_mb=0, factory=factory)
+    with pytest.raises(WebDriverException):
+        pool.warm_up()
+    stats = pool.stats()
+    assert stats["idle"] == 2
+    assert stats["in_use"] == 0
+
+
+def test_release_discards_driver_when_reset_fails_with_any_error(monkeypatch):
+    factory = FlakyFactory()
+    pool = DriverPool(size=1, max_memory_mb=0, factory=factory)
+    driver = pool.acquire()
+    monkeypatch.setattr(pool, "reset_state", lambda _: (_ for _ in ()).throw(RuntimeError("kutilmagan")))
+    pool.release(driver)
+    assert pool.recycled == 1
+    stats = pool.stats()
+    assert (stats["created"], stats["idle"], stats["in_use"]) == (2, 1, 0)
+
+
+def test_release_rolls_back_when_recreate_fails():
+    factory = FlakyFactory()
+    pool = DriverPool(size=1, max_uses=1, max_memory_mb=0, factory=factory)
+    driver = pool.acquire()
+    factory.failures = 1
+    pool.release(driver)
+    assert pool.stats()["idle"] == 0
+    assert pool.stats()["in_use"] == 0
+    # Joy bo'sh - keyingi acquire yangi brauzer yaratadi
+    assert pool.acquire(timeout=0.1) is factory.created[-1]
+
+
+def test_reset_state_clears_storage_of_all_origins():
+    factory = FlakyFactory()
+    pool = DriverPool(size=1, max_memory_mb=0, factory=factory)
+    driver = pool.acquire()
+    driver.get("https://a.example/")
+    driver.dom.local_storage["token"] = "a"
+    driver.switch_to.new_window("tab")
+    driver.get("https://b.example/")
+    driver.dom.local_storage["token"] = "b"
+    driver.dom.cookies.append({"name": "sid", "value": "1"})
+
+    pool.release(driver)
+
+    assert pool.acquire() is driver
+    assert pool.recycled == 0
+    assert len(driver.window_handles) == 1
+    assert set(driver.executor.origin_storage) == {"https://a.example", "https://b.example"}
+    assert all(not storage for storage in driver.executor.origin_storage.values())
+    assert driver.dom.cookies == []
+
+
+def test_cookie_and_storage_do_not_leak_into_next_test():
+    pool = DriverPool(size=1, max_memory_mb=0, factory=FlakyFactory())
+    with pool.driver() as first:
+        first.get("https://a.example/login")
+        first.add_cookie({"name": "sid", "value": "secret"})
+        first.dom.local_storage["token"] = "secret"
+        first.dom.session_storage["step"] = "2"
+
+    with pool.driver() as second:
+        assert second is first
+        assert second.get_cookies() == []
+        second.get("https://a.example/login")
+        assert second.dom.local_storage == {}
+        assert second.dom.session_storage == {}
+    assert pool.recycled == 0
+
+
+def test_driver_without_cdp_is_recycled():
+    factory = FlakyFactory()
+    pool = DriverPool(size=1, max_memory_mb=0, factory=factory)
+    driver = pool.acquire()
+    driver.executor.inject_error("executeCdpCommand", "unknown command")
+    pool.release(driver)
+    assert pool.recycled == 1
+    assert pool.acquire() is not driver
+
+
+def test_concurrent_acquire_never_exceeds_size():
+    pool = DriverPool(size=2, max_memory_mb=0, factory=FlakyFactory())
+    drivers = []
+    threads = [threading.Thread(target=lambda: drivers.append(pool.acquire(timeout=1))) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(driver) for driver in drivers}) == 2
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.05)
@@ -0,0 +1,69 @@
+import pytest
+from selenium.common.exceptions import JavascriptException
+from selenium.webdriver.remote.command import Command
+
+from benchmarks.fake_driver import FakeDriver
+from utils.driver import DOCUMENT_ID_JS, NETWORK_IDLE_JS, ensure_script_timeout, open_url, wait_for_network_idle
+
+ASYNC_SCRIPT = Command.W3C_EXECUTE_SCRIPT_ASYNC
+
+
+@pytest.fixture
+def driver():
+    driver = FakeDriver()
+    driver.executor.scripts.insert(0, (lambda script: script == NETWORK_IDLE_JS, lambda *args: True))
+    return driver
+
+
+def test_script_timeout_is_read_from_session_once(driver):
+    driver.executor.timeouts["script"] = 60000
+    driver.reset_commands()
+    ensure_script_timeout(driver, 35)
+    ensure_script_timeout(driver, 40)
+    assert driver.executor.commands[Command.GET_TIMEOUTS] == 1
+    assert driver.executor.commands[Command.SET_TIMEOUTS] == 0
+
+
+def test_script_timeout_is_only_raised(driver):
+    ensure_script_timeout(driver, 35)
+    ensure_script_timeout(driver, 10)
+    assert driver.executor.timeouts["script"] == 35000
+
+
+def test_lowered_script_timeout_is_restored_after_script_timeout(driver):
+    ensure_script_timeout(driver, 35)
+    # Boshqa kod timeoutni kamaytirdi - eslab qolingan qiymat eskirgan
+    driver.set_script_timeout(1)
+    driver.executor.inject_error(ASYNC_SCRIPT, "script timeout")
+    assert wait_for_network_idle(driver, timeout=30) is True
+    assert driver.executor.timeouts["script"] == 35000
+
+
+def test_network_idle_retries_after_unload(driver):
+    driver.executor.inject_error(ASYNC_SCRIPT, "javascript error", message="document unloaded while waiting for result")
+    assert wait_for_network_idle(driver, timeout=5) is True
+    assert driver.executor.commands[ASYNC_SCRIPT] == 2
+
+
+def test_network_idle_raises_other_script_errors(driver):
+    driver.executor.inject_error(ASYNC_SCRIPT, "javascript error", message="ReferenceError: foo is not defined")
+    with pytest.raises(JavascriptException):
+        wait_for_network_idle(driver, timeout=5)
+    assert driver.executor.commands[ASYNC_SCRIPT] == 1
+
+
+def test_open_url_waits_on_new_document_with_tracker(driver):
+    calls = []
+    driver.executor.scripts.insert(0, (lambda script: script == NETWORK_IDLE_JS,
+                                       lambda *args: calls.append((args, driver.dom.document_id,
+                                                                   driver.dom.network_tracker)) or True))
+    driver.get("https://a.example/")
+    old_document = driver.execute_script(DOCUMENT_ID_JS)
+
+    open_url(driver, "https://b.example/", network_idle=True, timeout=5)
+    open_url(driver, "https://c.example/", network_idle=True, timeout=5)
+
+    (args, document_id, tracker), _ = calls
+    assert args[2:] == ("https://b.example/", old_document)
+    assert document_id is None and tracker
+    assert driver.executor.commands["executeCdpCommand"] == 1
@@ -0,0 +1,88 @@
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+
+from base_functions.base_page import BasePage
+from benchmarks.fake_driver import FakeDriver
+from utils.element_cache import ElementCache
+
+BUTTON = (By.ID, "save")
+
+
+def test_lru_eviction_and_stats():
+    cache = ElementCache(maxsize=2)
+    cache.put(("id", "a"), "A")
+    cache.put(("id", "b"), "B")
+    assert cache.get(("id", "a")) == "A"
+    cache.put(("id", "c"), "C")
+    assert ("id", "b") not in cache
+    assert cache.get(("id", "b")) is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 1, "size": 2, "hit_rate": 0.5}
+
+
+def test_invalidate_and_none_is_not_cached():
+    cache = ElementCache()
+    cache.put(["id", "a"], None)
+    assert len(cache) == 0
+    cache.put(["id", "a"], "A")
+    cache.invalidate(("id", "a"))
+    assert cache.get(("id", "a")) is None
+
+
+def test_url_change_clears_cache_with_interval():
+    urls = ["http://a", "http://b"]
+    calls = []
+
+    def get_url():
+        calls.append(1)
+        return urls[0]
+
+    cache = ElementCache(url_check_interval=60)
+    cache.check_url(get_url)
+    cache.put(("id", "a"), "A")
+    urls[0] = "http://b"
+    # Interval ichida URL so'ralmaydi
+    cache.check_url(get_url)
+    assert len(calls) == 1 and len(cache) == 1
+
+    cache.url_check_interval = 0
+    cache.check_url(get_url)
+    assert len(cache) == 0
+
+
+def page_with_cache():
+    driver = FakeDriver()
+    driver.dom.add(BUTTON, tag="button", text="Save")
+    page = BasePage(driver)
+    page.enable_element_cache()
+    return driver, page
+
+
+def test_page_reuses_cached_element():
+    driver, page = page_with_cache()
+    first = page.wait_for_element(BUTTON)
+    driver.reset_commands()
+    assert page.wait_for_element(BUTTON) is first
+    assert page.element_cache.stats()["hits"] == 1
+    # Faqat tirikligini tekshiruvchi bitta buyruq, qidiruv yo'q
+    assert driver.command_count == 1
+    assert driver.executor.commands[Command.IS_ELEMENT_ENABLED] == 1
+
+
+def test_presence_refinds_detached_cached_element():
+    driver, page = page_with_cache()
+    old = page.wait_for_element(BUTTON)
+    new = driver.dom.replace(BUTTON, tag="button", text="Save")
+    element = page.wait_for_element(BUTTON)
+    assert element is not old
+    assert element.id == new.id
+    # Yangi handle keshga qaytadan yozilgan
+    assert page.element_cache.get(BUTTON) is element
+
+
+def test_page_refinds_replaced_element():
+    driver, page = page_with_cache()
+    page.click(BUTTON)
+    old = driver.dom.find_all(*BUTTON)[0]
+    new = driver.dom.replace(BUTTON, tag="button", text="Save")
+    page.click(BUTTON)
+    assert old.clicks == 1 and new.clicks == 1
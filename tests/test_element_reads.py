@@ -0,0 +1,64 @@
+import pytest
+from selenium.webdriver.common.by import By
+
+from base_functions.base_page import BasePage
+from base_functions.js_scripts import READ_ELEMENTS_JS
+from benchmarks.fake_driver import FakeDriver
+from utils.exeption import ElementNotFoundError
+
+ROWS = (By.CSS_SELECTOR, "tr")
+
+
+def _table(count, hidden=()):
+    driver = FakeDriver()
+    for i in range(count):
+        driver.dom.add(ROWS, tag="tr", text=f" row {i} ", attrs={"data-id": str(i), "class": "row"},
+                       displayed=i not in hidden)
+    return driver
+
+
+def _chunks(driver):
+    calls = []
+    read = driver.executor._read_elements
+    driver.executor.scripts.insert(0, (lambda script: script == READ_ELEMENTS_JS,
+                                       lambda *args: calls.append(args[3:5]) or read(*args)))
+    return calls
+
+
+@pytest.mark.parametrize("count, chunk_size, offsets", [
+    (5, 2, [(0, 2), (2, 2), (4, 2)]),
+    (4, 2, [(0, 2), (2, 2)]),
+    (1, 500, [(0, 500)]),
+])
+def test_iter_elements_chunk_boundaries(count, chunk_size, offsets):
+    driver = _table(count)
+    calls = _chunks(driver)
+    rows = list(BasePage(driver).iter_elements(ROWS, chunk_size=chunk_size))
+    assert [row["index"] for row in rows] == list(range(count))
+    assert calls == offsets
+
+
+def test_hidden_rows_keep_their_index_across_chunks():
+    driver = _table(5, hidden={1, 2})
+    rows = list(BasePage(driver).iter_elements(ROWS, chunk_size=2, visible_only=True))
+    assert [row["index"] for row in rows] == [0, 3, 4]
+
+
+def test_get_texts_skips_hidden_rows():
+    driver = _table(3, hidden={1})
+    page = BasePage(driver)
+    assert page.get_texts(ROWS, chunk_size=2) == ["row 0", "row 2"]
+    assert page.get_texts(ROWS, visible_only=False) == ["row 0", "", "row 2"]
+
+
+def test_get_attributes_single_name_and_list():
+    driver = _table(3)
+    page = BasePage(driver)
+    assert page.get_attributes(ROWS, "data-id", chunk_size=2) == ["0", "1", "2"]
+    assert page.get_attributes(ROWS, ["data-id", "class"])[1] == {"data-id": "1", "class": "row"}
+
+
+def test_missing_rows_raise_after_timeout():
+    page = BasePage(FakeDriver())
+    with pytest.raises(ElementNotFoundError):
+        page.get_texts(ROWS, timeout=0.2)
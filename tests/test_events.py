@@ -0,0 +1,68 @@
+import glob
+import os
+import time
+
+from selenium.webdriver.common.by import By
+
+from base_functions.base_page import BasePage
+from benchmarks.fake_driver import FakeDriver
+from utils import events
+from utils.events import EventSink, aggregate_events, iter_events
+
+
+def emit_many(sink, count):
+    for index in range(count):
+        sink.emit({"page": "LoginPage", "method": "click", "locator": str(index), "duration_ms": 1.0,
+                   "outcome": "ok" if index % 2 else "error", "attempts": 1})
+
+
+def test_size_rotation_compresses_segments():
+    sink = EventSink(directory="events", max_bytes=300, max_age=0)
+    emit_many(sink, 10)
+    sink.close()
+    assert glob.glob(os.path.join("events", "*.jsonl.gz"))
+    assert sorted(int(event["locator"]) for event in iter_events("events")) == list(range(10))
+
+
+def test_backup_count_prunes_old_segments():
+    sink = EventSink(directory="events", max_bytes=150, max_age=0, backup_count=2, compress=False)
+    emit_many(sink, 12)
+    sink.close()
+    segments = glob.glob(os.path.join("events", f"{sink.prefix}_*.jsonl"))
+    assert len(segments) == 2
+    assert os.path.exists(sink.path)
+
+
+def test_age_rotation():
+    sink = EventSink(directory="events", max_bytes=0, max_age=0.05, compress=False)
+    emit_many(sink, 1)
+    time.sleep(0.06)
+    emit_many(sink, 1)
+    sink.close()
+    assert len(glob.glob(os.path.join("events", "*.jsonl"))) == 2
+
+
+def test_aggregate_skips_broken_lines():
+    sink = EventSink(directory="events")
+    emit_many(sink, 4)
+    sink.close()
+    with open(sink.path, "a", encoding="utf-8") as f:
+        f.write('{"page": "Login')
+    stats = aggregate_events("events", key=("page", "method"))
+    assert stats[("LoginPage", "click")] == {"count": 4, "failures": 2, "total_ms": 4.0, "max_ms": 1.0,
+                                             "attempts": 4}
+
+
+def test_event_log_is_opt_in(monkeypatch):
+    monkeypatch.setattr(events, "_sink", None)
+    monkeypatch.delenv("EVENT_LOG", raising=False)
+    assert events.get_event_sink() is None
+
+    monkeypatch.setenv("EVENT_LOG", "1")
+    monkeypatch.setenv("EVENT_LOG_DIR", "events")
+    driver = FakeDriver()
+    driver.dom.add((By.ID, "save"), tag="button")
+    BasePage(driver).click((By.ID, "save"))
+    events.get_event_sink().close()
+    [event] = list(iter_events("events"))
+    assert (event["page"], event["method"], event["outcome"]) == ("BasePage", "click", "ok")
@@ -0,0 +1,65 @@
+import os
+import threading
+import time
+
+import pytest
+
+from utils.file_lock import FileLock
+
+
+def test_second_lock_waits_and_times_out():
+    with FileLock("a.lock"):
+        with pytest.raises(TimeoutError):
+            FileLock("a.lock", timeout=0.1).acquire()
+    assert not os.path.exists("a.lock")
+
+
+def test_lock_serializes_threads():
+    active, overlaps = [], []
+
+    def worker():
+        with FileLock("b.lock", timeout=5, poll=0.01):
+            active.append(1)
+            overlaps.append(len(active))
+            time.sleep(0.02)
+            active.pop()
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert overlaps == [1, 1, 1, 1]
+
+
+def test_abandoned_lock_is_removed():
+    with open("c.lock", "w") as f:
+        f.write("12345:dead")
+    old = time.time() - 60
+    os.utime("c.lock", (old, old))
+    with FileLock("c.lock", timeout=1, stale_after=10):
+        with open("c.lock") as f:
+            assert f.read() != "12345:dead"
+
+
+def test_held_lock_is_refreshed_and_not_stolen():
+    holder = FileLock("d.lock", stale_after=0.3)
+    holder.acquire()
+    try:
+        time.sleep(0.5)
+        # Egasi tirik: mtime yangilanib turadi, qulf eskirgan hisoblanmaydi
+        with pytest.raises(TimeoutError):
+            FileLock("d.lock", timeout=0.2, stale_after=0.3).acquire()
+    finally:
+        holder.release()
+    assert not os.path.exists("d.lock")
+
+
+def test_release_keeps_lock_taken_over_by_other_owner():
+    lock = FileLock("e.lock", stale_after=0)
+    lock.acquire()
+    with open("e.lock", "w") as f:
+        f.write("other:owner")
+    lock.release()
+    with open("e.lock") as f:
+        assert f.read() == "other:owner"
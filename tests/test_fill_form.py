@@ -0,0 +1,69 @@
+import pytest
+from selenium.webdriver.common.by import By
+
+from base_functions.base_page import BasePage
+from base_functions.js_scripts import SET_FIELDS_JS
+from benchmarks.fake_driver import FakeDriver
+from utils.exeption import ElementNotFoundError
+
+NAME = (By.ID, "name")
+AGREE = (By.ID, "agree")
+CITY = (By.ID, "city")
+AVATAR = (By.ID, "avatar")
+PHONE = (By.ID, "phone")
+
+
+@pytest.fixture
+def driver():
+    driver = FakeDriver()
+    driver.dom.add(NAME, tag="input")
+    driver.dom.add(AGREE, tag="input", attrs={"type": "checkbox"})
+    driver.dom.add_select(CITY, ["Toshkent", "Samarqand"])
+    driver.dom.add(AVATAR, tag="input", attrs={"type": "file"})
+    driver.dom.add(PHONE, tag="input", attrs={"data-reject-script": ""})
+    return driver
+
+
+def test_fields_are_set_in_given_order(driver, tmp_path):
+    avatar = tmp_path / "a.png"
+    avatar.write_bytes(b"png")
+    scripted = []
+    set_fields = driver.executor._set_fields
+    driver.executor.scripts.insert(0, (lambda script: script == SET_FIELDS_JS,
+                                       lambda fields: scripted.extend(element for element, _, _ in fields)
+                                       or set_fields(fields)))
+    page = BasePage(driver)
+    fields = {CITY: "Samarqand", NAME: "Ali", AVATAR: str(avatar), AGREE: True, PHONE: "+998"}
+    assert page.fill_form(fields) is True
+
+    dom = driver.dom
+    assert scripted == [dom.find_all(*CITY)[0], dom.find_all(*NAME)[0], dom.find_all(*AGREE)[0],
+                        dom.find_all(*PHONE)[0]]
+    assert dom.find_all(*CITY)[0].value == "Samarqand"
+    assert dom.find_all(*NAME)[0].value == "Ali"
+    assert dom.find_all(*AGREE)[0].selected is True
+    # file input va JS qiymatni qabul qilmagan input send_keys bilan
+    assert dom.find_all(*AVATAR)[0].value == str(avatar)
+    assert dom.find_all(*PHONE)[0].value == "+998"
+
+
+def test_missing_field_raises_element_not_found(driver):
+    page = BasePage(driver)
+    page.default_timeout = 0.2
+    screenshots = []
+    page.take_screenshot = screenshots.append
+    missing = (By.ID, "surname")
+    with pytest.raises(ElementNotFoundError) as error:
+        page.fill_form({NAME: "Ali", missing: "Valiyev"})
+    assert error.value.locator == missing
+    assert screenshots == ["basepage_fill_form_error"]
+    # Xatoga qadar hech bir maydon o'zgartirilmaydi
+    assert driver.dom.find_all(*NAME)[0].value == ""
+
+
+def test_unknown_select_option_raises(driver):
+    page = BasePage(driver)
+    page.take_screenshot = lambda name: None
+    with pytest.raises(ElementNotFoundError) as error:
+        page.fill_form({CITY: "Buxoro"})
+    assert error.value.locator == CITY
@@ -0,0 +1,155 @@
+"""
+Brauzer skriptlari semantikasi: node ostida, minimal DOM modeli bilan (node bo'lmasa o'tkazib yuboriladi).
+"""
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from base_functions.js_scripts import FIND_ELEMENT_JS, HIT_TEST_JS, IS_VISIBLE_JS
+from utils.driver import NETWORK_IDLE_JS, NETWORK_TRACKER_JS
+
+pytestmark = pytest.mark.skipif(shutil.which("node") is None, reason="node o'rnatilmagan")
+
+DOM_STUB = r"""
+var styles = new Map();
+var document = {documentElement: {}};
+var window = {getComputedStyle: function (e) { return styles.get(e); }};
+var CSS = {escape: function (v) { return v.replace(/(["\\])/g, '\\$1'); }};
+function el(tag, style, rect, parent, extra) {
+    var e = Object.assign({
+        tagName: tag.toUpperCase(), isConnected: true, parentElement: parent || null, parentNode: parent || null,
+        getBoundingClientRect: function () {
+            return {left: rect[0], top: rect[1], width: rect[2], height: rect[3],
+                    right: rect[0] + rect[2], bottom: rect[1] + rect[3]};
+        },
+        matches: function (selector) { return selector === ':disabled' && !!this.inDisabledFieldset; },
+        getRootNode: function () { return this.root || document; }
+    }, extra || {});
+    styles.set(e, Object.assign({display: 'block', visibility: 'visible', opacity: '1', position: 'static',
+                                 overflowX: 'visible', overflowY: 'visible'}, style || {}));
+    return e;
+}
+"""
+
+
+def run_js(body):
+    script = DOM_STUB + FIND_ELEMENT_JS + IS_VISIBLE_JS + HIT_TEST_JS + body
+    output = subprocess.run(["node", "-e", script], capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+
+def is_visible(setup):
+    return run_js(setup + "\nconsole.log(JSON.stringify(__isVisible(target)));")
+
+
+def test_visible_element():
+    assert is_visible("var target = el('div', {}, [0, 0, 10, 10]);")
+
+
+def test_hidden_by_overflow_of_ancestor():
+    assert not is_visible("""
+        var box = el('div', {overflowX: 'hidden', overflowY: 'hidden'}, [0, 0, 100, 100]);
+        var target = el('div', {}, [150, 0, 10, 10], box);""")
+
+
+def test_overflow_auto_counts_as_visible():
+    assert is_visible("""
+        var box = el('div', {overflowX: 'auto', overflowY: 'auto'}, [0, 0, 100, 100]);
+        var target = el('div', {}, [150, 0, 10, 10], box);""")
+
+
+def test_absolute_element_escapes_static_ancestor():
+    assert is_visible("""
+        var page = el('div', {position: 'relative'}, [0, 0, 500, 500]);
+        var box = el('div', {overflowX: 'hidden', overflowY: 'hidden'}, [0, 0, 100, 100], page);
+        var target = el('div', {position: 'absolute'}, [150, 0, 10, 10], box);""")
+
+
+def test_absolute_element_clipped_by_positioned_ancestor():
+    assert not is_visible("""
+        var box = el('div', {position: 'relative', overflowX: 'hidden', overflowY: 'hidden'}, [0, 0, 100, 100]);
+        var target = el('div', {position: 'absolute'}, [150, 0, 10, 10], box);""")
+
+
+def test_fixed_element_is_not_clipped():
+    assert is_visible("""
+        var box = el('div', {position: 'relative', overflowX: 'hidden', overflowY: 'hidden'}, [0, 0, 100, 100]);
+        var target = el('div', {position: 'fixed'}, [150, 0, 10, 10], box);""")
+
+
+def test_zero_opacity_and_size_are_hidden():
+    assert not is_visible("var target = el('div', {opacity: '0'}, [0, 0, 10, 10]);")
+    assert not is_visible("var target = el('div', {}, [0, 0, 0, 10]);")
+
+
+def test_disabled_fieldset_disables_control():
+    assert run_js("""
+        var target = el('input', {}, [0, 0, 10, 10], null, {disabled: false, inDisabledFieldset: true});
+        console.log(JSON.stringify([__isDisabled(target), __isDisabled(el('input', {}, [0, 0, 1, 1]))]));
+    """) == [True, False]
+
+
+@pytest.mark.parametrize("by, value, selector", [
+    ("id", 'a"b', '[id="a\\"b"]'),
+    ("name", "c\\d", '[name="c\\\\d"]'),
+])
+def test_id_and_name_values_are_escaped(by, value, selector):
+    assert run_js(f"""
+        var seen = [];
+        var root = {{querySelectorAll: function (s) {{ seen.push(s); return []; }}}};
+        __findAll({json.dumps(by)}, {json.dumps(value)}, root);
+        console.log(JSON.stringify(seen[0]));
+    """) == selector
+
+
+def test_hit_test_inside_shadow_root():
+    assert run_js("""
+        var host = el('div', {}, [0, 0, 100, 100]);
+        var shadow = {host: host, parentNode: null};
+        var target = el('button', {}, [0, 0, 50, 20], null, {parentNode: shadow, root: shadow});
+        var icon = el('span', {}, [0, 0, 10, 10], null, {parentNode: target});
+        document.elementFromPoint = function () { return host; };
+        shadow.elementFromPoint = function () { return icon; };
+        var overlay = el('div', {}, [0, 0, 100, 100]);
+        var covered = __obscuredBy(target, 25, 10);
+        shadow.elementFromPoint = function () { return overlay; };
+        console.log(JSON.stringify([covered, __obscuredBy(target, 25, 10).tagName]));
+    """) == [None, "DIV"]
+
+
+IDLE_STUB = r"""
+var window = globalThis, t0 = performance.now();
+var document = {readyState: 'complete', URL: 'https://a.example/'};
+globalThis.PerformanceObserver = function () { this.observe = function () {}; this.disconnect = function () {}; };
+window.fetch = function () { return new Promise(function (resolve) { setTimeout(resolve, 200); }); };
+function idle() {
+"""
+
+
+def wait_idle(setup, *args):
+    script = (IDLE_STUB + NETWORK_IDLE_JS + "}\n" + NETWORK_TRACKER_JS + setup
+              + f"\nidle.apply(null, {json.dumps(list(args))}.concat([function (result) {{"
+                "console.log(JSON.stringify([result, performance.now() - t0])); }]));")
+    output = subprocess.run(["node", "-e", script], capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+
+def test_network_idle_waits_for_request_in_flight():
+    result, elapsed = wait_idle("fetch('/api');", 50, 2000, "https://a.example/", None)
+    assert result is True
+    assert elapsed >= 250
+
+
+def test_network_idle_timer_starts_on_new_document():
+    result, elapsed = wait_idle("""
+        window.__documentId = 'old';
+        setTimeout(function () { delete window.__documentId; }, 150);""", 50, 2000, "https://a.example/", "old")
+    assert result is True
+    assert elapsed >= 200
+
+
+def test_network_idle_times_out_on_old_document():
+    result, _ = wait_idle("window.__documentId = 'old';", 50, 200, "https://a.example/", "old")
+    assert result is False
@@ -0,0 +1,46 @@
+import pytest
+
+from utils.launch_profiles import LaunchProfile, get_profile
+
+
+def test_later_profile_overrides_same_flag_and_prefs():
+    first = LaunchProfile("a", ["--window-size=800,600", "--mute-audio"], prefs={"x": 1, "y": 1})
+    second = LaunchProfile("b", ["--window-size=1920,1080"], prefs={"y": 2})
+    merged = first + second
+    assert merged.name == "a+b"
+    assert merged.arguments == ["--window-size=1920,1080", "--mute-audio"]
+    assert merged.prefs == {"x": 1, "y": 2}
+    # Qo'shish asl profillarni o'zgartirmaydi
+    assert first.arguments == ["--window-size=800,600", "--mute-audio"]
+
+
+def test_feature_lists_are_merged_without_duplicates():
+    first = LaunchProfile("a", ["--disable-features=Translate,MediaRouter"])
+    second = LaunchProfile("b", ["--disable-features=MediaRouter,AutofillServerCommunication"])
+    assert (first + second).arguments == ["--disable-features=Translate,MediaRouter,AutofillServerCommunication"]
+
+
+def test_get_profile_combines_names_in_order():
+    profile = get_profile("throughput+no_images, no_sandbox")
+    assert profile.name == "throughput+no_images+no_sandbox"
+    assert "--blink-settings=imagesEnabled=false" in profile.arguments
+    assert profile.arguments[-1] == "--no-sandbox"
+    assert profile.prefs == {"profile.managed_default_content_settings.images": 2}
+    options = profile.to_options()
+    assert "--headless=new" in options.arguments
+    assert options.experimental_options["prefs"] == profile.prefs
+
+
+def test_get_profile_precedence(monkeypatch):
+    monkeypatch.setenv("DRIVER_PROFILE", "throughput")
+    assert get_profile().name == "throughput"
+    assert get_profile("local").name == "local"
+    monkeypatch.delenv("DRIVER_PROFILE")
+    assert get_profile().name == "local"
+    custom = LaunchProfile("custom")
+    assert get_profile(custom) is custom
+
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError, match="turbo"):
+        get_profile("throughput+turbo")
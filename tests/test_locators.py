@@ -0,0 +1,68 @@
+import json
+
+import pytest
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+
+from base_functions.base_page import BasePage
+from benchmarks.fake_driver import FakeDriver
+from utils.locators import SHADOW_PATH, compile_locator, composite, plan_for
+
+FRAME = (By.CSS_SELECTOR, "iframe#payment")
+PAY = (By.CSS_SELECTOR, "button.pay")
+
+
+def test_compile_frames_and_shadow_path():
+    plan = compile_locator("frame=iframe#outer >> frame=iframe#inner >> shadow=card-form >> css selector=button.pay")
+    assert plan.frames == (("css selector", "iframe#outer"), ("css selector", "iframe#inner"))
+    assert plan.target[0] == SHADOW_PATH
+    assert json.loads(plan.target[1]) == [["css selector", "card-form"], ["css selector", "button.pay"]]
+
+
+def test_frame_inside_shadow_root_and_default_css_step():
+    plan = compile_locator("shadow=app-shell >> frame=iframe >> #total")
+    assert plan.frames == ((SHADOW_PATH, json.dumps([["css selector", "app-shell"], ["css selector", "iframe"]])),)
+    assert plan.target == ("css selector", "#total")
+
+
+def test_compile_is_cached_and_plain_locator_has_no_frames():
+    value = composite(("frame", "iframe#payment"), PAY)[1]
+    assert compile_locator(value) is compile_locator(value)
+    assert plan_for((By.ID, "x")).frames == ()
+
+
+def test_invalid_composite():
+    with pytest.raises(ValueError):
+        composite(("frames", "iframe"), PAY)
+    with pytest.raises(ValueError):
+        compile_locator("frame=iframe#payment")
+
+
+def make_page(shadow):
+    driver = FakeDriver()
+    document = driver.dom.add_frame(FRAME)
+    if shadow:
+        document = document.add_shadow((By.CSS_SELECTOR, "card-form"))
+    button = document.add(PAY, tag="button", text="Pay")
+    return driver, BasePage(driver), button
+
+
+def test_frame_is_entered_once_for_repeated_actions():
+    driver, page, button = make_page(shadow=True)
+    locator = composite(("frame", "iframe#payment"), ("shadow", "card-form"), PAY)
+    for _ in range(3):
+        page.click(locator)
+    assert button.clicks == 3
+    # default_content + frame bir marta, keyingi amallarda switch yo'q
+    assert page.frames.switches == 2
+    assert driver.executor.commands[Command.SWITCH_TO_FRAME] == 2
+
+
+def test_manual_switch_makes_path_unknown():
+    driver, page, button = make_page(shadow=False)
+    locator = composite(("frame", "iframe#payment"), PAY)
+    page.click(locator)
+    driver.switch_to.default_content()
+    assert page.frames.path is None
+    page.click(locator)
+    assert button.clicks == 2
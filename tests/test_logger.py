@@ -0,0 +1,68 @@
+import logging
+import os
+import threading
+
+import pytest
+
+from utils import logger as logger_module
+from utils.logger import get_logger, get_test_id, get_test_name, release_logger, reset_current_test, set_current_test
+
+
+def _file_handlers(logger):
+    handlers = []
+    for handler in logger.handlers:
+        handlers.append(getattr(handler, "target", None) or handler)
+    return [handler for handler in handlers if isinstance(handler, logging.FileHandler)]
+
+
+def test_get_logger_is_cached_per_test_name():
+    first = get_logger("test_cached")
+    assert get_logger("test_cached") is first
+    release_logger("test_cached")
+
+
+@pytest.mark.parametrize("buffered", ["0", "1"])
+def test_release_closes_file_handlers(monkeypatch, buffered):
+    monkeypatch.setenv("LOG_BUFFERED", buffered)
+    logger = get_logger("test_release_sync")
+    logger.info("yozuv")
+    files = _file_handlers(logger)
+    assert files
+
+    release_logger("test_release_sync")
+
+    assert logger.handlers == []
+    assert all(handler.stream is None for handler in files)
+    with open(os.path.join("logs", os.listdir("logs")[0]), encoding="utf-8") as f:
+        assert "yozuv" in f.read()
+
+
+def test_release_stops_async_listener(monkeypatch):
+    monkeypatch.setenv("LOG_ASYNC", "1")
+    before = threading.active_count()
+    get_logger("test_release_async").info("yozuv")
+    assert threading.active_count() == before + 1
+
+    release_logger("test_release_async")
+
+    assert threading.active_count() == before
+    assert "test_release_async" not in logger_module._listeners
+
+
+def test_registry_is_bounded(monkeypatch):
+    monkeypatch.setattr(logger_module, "MAX_OPEN_LOGGERS", 3)
+    loggers = [get_logger(f"test_bounded_{i}") for i in range(5)]
+    names = {name for name, _ in logger_module._registry}
+    assert {"test_bounded_0", "test_bounded_1"}.isdisjoint(names)
+    assert loggers[0].handlers == []
+    for i in range(5):
+        release_logger(f"test_bounded_{i}")
+
+
+def test_current_test_contextvar():
+    token = set_current_test("test_login", "tests/test_x.py::test_login[a]")
+    try:
+        assert get_test_name() == "test_login"
+        assert get_test_id() == "tests/test_x.py::test_login[a]"
+    finally:
+        reset_current_test(token)
@@ -0,0 +1,67 @@
+import sys
+
+import pytest
+
+from benchmarks.fake_driver import FakeDriver
+from utils.page_registry import PageRegistry
+
+PAGE = '''from selenium.webdriver.common.by import By
+
+from base_functions.base_page import BasePage
+
+
+class {name}(BasePage):
+    BUTTON = (By.ID, "{name}")
+
+
+class {name}Helper:
+    pass
+'''
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    """Vaqtinchalik sahifalar paketi: ichki papka bilan"""
+    root = tmp_path / "demo_pages"
+    (root / "admin").mkdir(parents=True)
+    (root / "__init__.py").write_text("")
+    (root / "admin" / "__init__.py").write_text("")
+    (root / "login_page.py").write_text(PAGE.format(name="LoginPage"))
+    (root / "admin" / "users_page.py").write_text(PAGE.format(name="UsersPage"))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield root
+    for module in [name for name in sys.modules if name.startswith("demo_pages")]:
+        del sys.modules[module]
+
+
+def test_discovery_does_not_import(package):
+    registry = PageRegistry("demo_pages", str(package))
+    assert registry.names() == ["LoginPage", "UsersPage"]
+    assert registry.modules["UsersPage"] == "demo_pages.admin.users_page"
+    assert "demo_pages.login_page" not in sys.modules
+    assert registry.loaded() == []
+
+
+def test_get_imports_only_requested_module(package):
+    registry = PageRegistry("demo_pages", str(package))
+    assert registry.locator("LoginPage.BUTTON") == ("id", "LoginPage")
+    assert "demo_pages.login_page" in sys.modules
+    assert "demo_pages.admin.users_page" not in sys.modules
+    assert registry.loaded() == ["LoginPage"]
+
+
+def test_unknown_and_duplicate_names(package):
+    registry = PageRegistry("demo_pages", str(package))
+    with pytest.raises(LookupError):
+        registry.get("MissingPage")
+    (package / "admin" / "login_page.py").write_text(PAGE.format(name="LoginPage"))
+    with pytest.raises(ValueError):
+        PageRegistry("demo_pages", str(package)).names()
+
+
+def test_bound_pages_are_created_once(package):
+    bound = PageRegistry("demo_pages", str(package)).bind(FakeDriver())
+    assert bound.LoginPage is bound.LoginPage
+    assert "UsersPage" in dir(bound)
+    with pytest.raises(AttributeError):
+        bound.MissingPage
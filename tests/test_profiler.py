@@ -0,0 +1,79 @@
+from selenium.webdriver.common.by import By
+
+from base_functions.base_page import BasePage
+from benchmarks.fake_driver import FakeDriver
+from utils.profiler import Profiler, command_count, install_command_counter, percentile, profiler
+
+BUTTON = (By.ID, "save")
+
+
+def test_command_counter_is_installed_once():
+    driver = FakeDriver()
+    assert command_count(driver) == 0
+    install_command_counter(driver)
+    install_command_counter(driver)
+    driver.current_url
+    driver.current_url
+    # Ikkinchi o'rnatish execute ni qayta o'ramaydi - buyruqlar ikki marta sanalmaydi
+    assert command_count(driver) == 2
+
+
+def test_percentile_interpolates():
+    assert percentile([], 50) == 0.0
+    assert percentile([7.0], 99) == 7.0
+    assert percentile([1, 2, 3, 4, 5], 50) == 3
+    assert percentile([1, 2, 3, 4], 90) == 3.7
+    assert percentile([1, 2, 3, 4], 100) == 4
+
+
+def test_disabled_profiler_records_nothing():
+    stats = Profiler()
+    stats.record("Page", "click", "loc", 1.0, 3, 0, 0.0, False, True)
+    assert stats.locator_stats() == {} and stats.page_stats() == {}
+    assert stats.report() == ""
+
+
+def test_report_orders_hot_locators_by_total_time():
+    stats = Profiler(enabled=True)
+    stats.record("LoginPage", "click", "fast", 0.01, 1, 0, 0.0, False, True)
+    stats.record("LoginPage", "click", "slow", 0.5, 4, 2, 0.3, True, True)
+    stats.record("LoginPage", "click", "slow", 0.7, 4, 0, 0.0, False, True)
+    stats.record("LoginPage", "_wait_until", "slow", 0.2, 1, 0, 0.0, False, False)
+    stats.record("CartPage", "click", "medium", 0.3, 2, 0, 0.0, False, True)
+
+    slow = stats.locator_stats()[("LoginPage", "click", "slow")]
+    assert slow["count"] == 2 and slow["commands"] == 8
+    assert slow["retries"] == 2 and slow["failures"] == 1
+    assert abs(slow["total"] - 1.2) < 1e-9 and slow["max"] == 0.7
+    # Ichki (top_level=False) chaqiruv sahifa jamiga qo'shilmaydi
+    assert stats.page_stats()["LoginPage"]["count"] == 3
+
+    lines = stats.report(top=2).splitlines()
+    pages = lines[2:4]
+    assert pages[0].endswith("LoginPage") and pages[1].endswith("CartPage")
+    locators = lines[lines.index("Eng sekin locatorlar:") + 2:]
+    assert [line.split("  ")[-1] for line in locators] == [
+        "LoginPage.click slow", "CartPage.click medium"]
+
+
+def test_click_is_profiled_with_its_commands(monkeypatch):
+    monkeypatch.setattr(profiler, "enabled", True)
+    profiler.reset()
+    driver = FakeDriver()
+    driver.dom.add(BUTTON, tag="button")
+    page = BasePage(driver)
+    before = command_count(driver)
+    try:
+        assert page.click(BUTTON) is True
+        stats = profiler.locator_stats()
+    finally:
+        profiler.reset()
+
+    click = stats[("BasePage", "click", str(BUTTON))]
+    assert click["count"] == 1 and click["failures"] == 0
+    # Click ichidagi barcha WebDriver buyruqlari shu amalga yozilgan
+    assert click["commands"] == command_count(driver) - before > 0
+    # Ichki kutish ham alohida yozilgan, lekin uning buyruqlari click dan oshmaydi
+    nested = [summary for (page_name, method, locator), summary in stats.items()
+              if method != "click" and locator == str(BUTTON)]
+    assert nested and all(summary["commands"] <= click["commands"] for summary in nested)
@@ -0,0 +1,119 @@
+import logging
+
+import pytest
+from selenium.common.exceptions import (
+    ElementClickInterceptedException, NoSuchElementException,
+    StaleElementReferenceException, TimeoutException)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+
+from base_functions.base_page import BasePage
+from benchmarks.fake_driver import FakeDriver
+from utils.exeption import ElementInteractionError, ElementNotFoundError, ElementStaleError
+from utils.logger import reset_current_test, set_current_test
+from utils.retry import (
+    DETERMINISTIC, TRANSIENT, RetryBudget, RetryPolicy,
+    budget_report, classify_failure, finish_retry_budget, reset_retry_budgets, retry_budget)
+
+BUTTON = (By.ID, "submit")
+FAST_POLICY = RetryPolicy("test", first_delay=0.01, base_delay=0.02, max_delay=0.05, jitter=0)
+
+
+@pytest.fixture(autouse=True)
+def clean_budgets():
+    reset_retry_budgets()
+    yield
+    reset_retry_budgets()
+
+
+@pytest.mark.parametrize("error, expected", [
+    (StaleElementReferenceException(), TRANSIENT),
+    (ElementClickInterceptedException(), TRANSIENT),
+    (ElementStaleError(), TRANSIENT),
+    (TimeoutException(), DETERMINISTIC),
+    (NoSuchElementException(), DETERMINISTIC),
+    (ElementNotFoundError(), DETERMINISTIC),
+    (ValueError("noma'lum"), DETERMINISTIC),
+    (ElementInteractionError("o'ralgan", original_error=StaleElementReferenceException()), TRANSIENT),
+    (ElementInteractionError("o'ralgan", original_error=TimeoutException()), DETERMINISTIC),
+])
+def test_classify_failure(error, expected):
+    assert classify_failure(error) == expected
+
+
+def test_policy_delay_grows_and_is_capped():
+    policy = RetryPolicy("p", first_delay=0.1, base_delay=0.5, max_delay=1.0, jitter=0)
+    assert [policy.delay(attempt) for attempt in range(4)] == [0.1, 0.5, 1.0, 1.0]
+
+
+def test_budget_charge_and_exhaustion():
+    budget = RetryBudget(seconds=1.0)
+    budget.charge(0.4)
+    assert budget.remaining == pytest.approx(0.6)
+    budget.charge(0.7)
+    assert budget.exhausted
+    assert budget.remaining == 0.0
+
+
+def test_budgets_are_separate_per_node_id():
+    first = retry_budget("tests/test_x.py::test_login[a]")
+    second = retry_budget("tests/test_x.py::test_login[b]")
+    assert first is not second
+    assert retry_budget("tests/test_x.py::test_login[a]") is first
+
+
+def test_finished_budget_is_dropped_but_reported():
+    test_id = "tests/test_x.py::test_login[a]"
+    budget = retry_budget(test_id)
+    budget.charge(2.0)
+    finish_retry_budget(test_id)
+
+    assert retry_budget(test_id) is not budget
+    assert budget_report()[test_id]["spent"] == pytest.approx(2.0)
+
+
+def test_page_uses_budget_of_current_node_id():
+    token = set_current_test("test_login", "tests/test_x.py::test_login[b]")
+    try:
+        page = BasePage(FakeDriver())
+    finally:
+        reset_current_test(token)
+    assert page.test_id == "tests/test_x.py::test_login[b]"
+    assert page.retry_budget is retry_budget("tests/test_x.py::test_login[b]")
+
+
+def test_pages_outside_pytest_do_not_share_budget(monkeypatch):
+    monkeypatch.delenv("PYTEST_CURRENT_TEST", raising=False)
+    token = set_current_test("test_script")
+    try:
+        first, second = BasePage(FakeDriver()), BasePage(FakeDriver())
+    finally:
+        reset_current_test(token)
+    assert first.retry_budget is not second.retry_budget
+
+
+def make_page():
+    driver = FakeDriver()
+    driver.dom.add(BUTTON, tag="button")
+    page = BasePage(driver)
+    page.logger.setLevel(logging.CRITICAL)
+    page.retry_policy = FAST_POLICY
+    page.default_timeout = 0.2
+    return driver, page
+
+
+def test_deterministic_failure_is_not_retried():
+    driver, page = make_page()
+    with pytest.raises(ElementInteractionError):
+        page.click((By.ID, "missing"))
+    assert page.retry_budget.fail_fast == 1
+
+
+def test_exhausted_budget_stops_transient_retries():
+    driver, page = make_page()
+    page.retry_budget.seconds = 0.0
+    driver.executor.inject_stale(Command.CLICK_ELEMENT, times=10 ** 6)
+    driver.executor.inject_error(Command.W3C_EXECUTE_SCRIPT, "stale element reference", times=10 ** 6)
+    with pytest.raises(ElementInteractionError):
+        page.click(BUTTON)
+    assert page.retry_budget.exhausted_stops == 1
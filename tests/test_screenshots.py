@@ -0,0 +1,110 @@
+import base64
+import os
+import threading
+import time
+
+from base_functions.base_page import BasePage
+from benchmarks.fake_driver import FakeDriver
+from utils.screenshots import ScreenshotService
+
+
+def _frame(seed):
+    return base64.b64encode(bytes([seed]) * 64).decode()
+
+
+def test_duplicate_frame_returns_none():
+    driver = FakeDriver()
+    service = ScreenshotService(directory="shots")
+    driver.dom.screenshot = _frame(1)
+    first = service.capture(driver, "a", key="t")
+    assert service.capture(driver, "b", key="t") is None
+    driver.dom.screenshot = _frame(2)
+    second = service.capture(driver, "c", key="t")
+    service.close()
+    assert sorted(os.listdir("shots")) == ["a.png", "c.png"]
+    assert os.path.exists(first) and os.path.exists(second)
+    assert service.stats["duplicates"] == 1
+
+
+def test_same_frame_in_other_test_is_kept():
+    driver = FakeDriver()
+    service = ScreenshotService(directory="shots")
+    driver.dom.screenshot = _frame(1)
+    assert service.capture(driver, "a", key="t1") is not None
+    assert service.capture(driver, "b", key="t2") is not None
+    service.forget("t1")
+    assert service.capture(driver, "c", key="t1") is not None
+    service.close()
+
+
+def test_quota_evicts_oldest_files():
+    driver = FakeDriver()
+    service = ScreenshotService(directory="shots", quota_bytes=150)
+    for seed in range(4):
+        driver.dom.screenshot = _frame(seed)
+        service.capture(driver, f"f{seed}", key="t")
+    service.close()
+    assert sorted(os.listdir("shots")) == ["f2.png", "f3.png"]
+    assert service.stats["evicted"] == 2
+
+
+def test_take_screenshot_logs_dropped_frame(monkeypatch):
+    monkeypatch.setattr("base_functions.base_page.get_screenshot_service",
+                        lambda: service)
+    service = ScreenshotService(directory="shots")
+    driver = FakeDriver()
+    driver.dom.screenshot = _frame(3)
+    page = BasePage(driver)
+    assert page.take_screenshot("one").endswith("_one.png")
+    messages = []
+    monkeypatch.setattr(page.logger, "info", lambda msg, *args: messages.append(msg % args))
+    assert page.take_screenshot("two") is None
+    service.close()
+    assert "saqlanmadi" in messages[-1]
+
+
+def test_capture_only_fetches_png_in_test_thread(monkeypatch):
+    driver = FakeDriver()
+    service = ScreenshotService(directory="shots")
+    release = threading.Event()
+    threads = []
+    original_write = service._write
+
+    def slow_write(data, path):
+        threads.append(threading.current_thread().name)
+        release.wait(5)
+        original_write(data, path)
+
+    monkeypatch.setattr(service, "_write", slow_write)
+    monkeypatch.setattr(service, "_open", lambda png: threads.append(threading.current_thread().name))
+    driver.dom.screenshot = _frame(4)
+    path = service.capture(driver, "slow", key="t")
+
+    assert path == os.path.join("shots", "slow.png")
+    assert not os.path.exists(path)
+    release.set()
+    service.close()
+    assert os.path.exists(path)
+    assert threads and all(name.startswith("screenshot") for name in threads)
+
+
+def test_frames_of_one_key_are_processed_in_order():
+    driver = FakeDriver()
+    service = ScreenshotService(directory="shots", workers=4)
+    order = []
+    original_process = service._process
+
+    def process(png, path, key, previous):
+        if previous is None:
+            time.sleep(0.05)
+        result = original_process(png, path, key, previous)
+        order.append(path)
+        return result
+
+    service._process = process
+    paths = []
+    for seed in range(4):
+        driver.dom.screenshot = _frame(seed)
+        paths.append(service.capture(driver, f"f{seed}", key="t"))
+    service.close()
+    assert order == paths
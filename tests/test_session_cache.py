@@ -0,0 +1,66 @@
+import os
+import stat
+import sys
+
+import pytest
+
+from benchmarks.fake_driver import FakeDriver
+from utils.session_cache import SessionCache
+
+
+def logged_in_driver():
+    driver = FakeDriver()
+    driver.get("http://localhost/app")
+    driver.dom.cookies.append({"name": "sid", "value": "secret", "domain": "localhost", "path": "/"})
+    driver.dom.local_storage["token"] = "abc"
+    return driver
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX huquqlari")
+def test_entry_is_private():
+    cache = SessionCache(directory="sessions")
+    cache.capture(logged_in_driver(), "admin")
+    assert stat.S_IMODE(os.stat("sessions").st_mode) == 0o700
+    assert stat.S_IMODE(os.stat(os.path.join("sessions", "admin.json")).st_mode) == 0o600
+
+
+def test_restore_roundtrip():
+    cache = SessionCache(directory="sessions")
+    cache.capture(logged_in_driver(), "admin")
+
+    fresh = FakeDriver()
+    assert cache.restore(fresh, "admin") is True
+    assert fresh.current_url == "http://localhost/app"
+    assert [cookie["name"] for cookie in fresh.dom.cookies] == ["sid"]
+    assert fresh.dom.local_storage == {"token": "abc"}
+
+
+def test_expired_or_missing_entry_is_not_restored():
+    cache = SessionCache(directory="sessions", ttl=1e-9)
+    cache.capture(logged_in_driver(), "admin")
+    assert cache.restore(FakeDriver(), "admin") is False
+    assert cache.load("admin", ttl=0) is not None
+    assert cache.restore(FakeDriver(), "missing") is False
+
+
+def test_ensure_runs_setup_once():
+    cache = SessionCache(directory="sessions")
+    calls = []
+
+    def setup(driver):
+        calls.append(driver)
+        driver.get("http://localhost/app")
+        driver.dom.local_storage["token"] = "abc"
+
+    assert cache.ensure(FakeDriver(), "admin", setup) == "created"
+    second = FakeDriver()
+    assert cache.ensure(second, "admin", setup) == "restored"
+    assert len(calls) == 1 and second.dom.local_storage == {"token": "abc"}
+
+
+def test_failed_validation_recreates_entry():
+    cache = SessionCache(directory="sessions")
+    cache.ensure(FakeDriver(), "admin", lambda driver: driver.get("http://localhost/app"))
+    result = cache.ensure(FakeDriver(), "admin", lambda driver: driver.get("http://localhost/app"),
+                          validate=lambda driver: False)
+    assert result == "created"
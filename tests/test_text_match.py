@@ -0,0 +1,84 @@
+import logging
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from base_functions.base_page import BasePage
+from benchmarks.fake_driver import FakeDriver
+from utils.exeption import ElementNotFoundError
+from utils.text_match import find_best_match, normalize_text
+
+COUNTRIES = [
+    {"index": 0, "text": "Country 11", "value": "c11"},
+    {"index": 1, "text": "Oʻzbekiston", "value": "uz"},
+    {"index": 2, "text": "Disabled", "value": "off", "disabled": True},
+]
+SELECT = (By.ID, "country")
+
+
+def test_normalize_text():
+    assert normalize_text("  O‘zbekiston \n Respublikasi ") == "o'zbekiston respublikasi"
+    assert normalize_text("Café") == "cafe"
+
+
+@pytest.mark.parametrize("wanted, index, match_type", [
+    ("Country 11", 0, "exact"),
+    ("o'zbekiston", 1, "normalized"),
+    ("uz", 1, "value"),
+])
+def test_match_order(wanted, index, match_type):
+    option, kind = find_best_match(COUNTRIES, wanted)
+    assert (option["index"], kind) == (index, match_type)
+
+
+def test_fuzzy_is_opt_in():
+    assert find_best_match(COUNTRIES, "Country 1") == (None, None)
+    option, kind = find_best_match(COUNTRIES, "Country 1", fuzzy=True)
+    assert (option["index"], kind) == (0, "fuzzy")
+
+
+def test_disabled_items_are_ignored():
+    assert find_best_match(COUNTRIES, "Disabled") == (None, None)
+    assert find_best_match(COUNTRIES, "off") == (None, None)
+
+
+def make_page():
+    driver = FakeDriver()
+    select = driver.dom.add_select(SELECT, ["Country 1", "Country 11", "Closed"])
+    select.children[2].enabled = False
+    page = BasePage(driver)
+    page.logger.setLevel(logging.CRITICAL)
+    page.default_timeout = 0.2
+    return select, page
+
+
+def test_click_options_selects_exact_option():
+    select, page = make_page()
+    assert page.click_options(SELECT, "Country 11")
+    assert select.value == "Country 11"
+
+
+def test_click_options_does_not_guess_by_default():
+    select, page = make_page()
+    with pytest.raises(ElementNotFoundError):
+        page.click_options(SELECT, "Country 111", screenshot=False)
+    assert select.value == ""
+
+
+def test_click_options_skips_disabled_option():
+    select, page = make_page()
+    with pytest.raises(ElementNotFoundError):
+        page.click_options(SELECT, "Closed", screenshot=False)
+
+
+def test_fill_form_fuzzy_logs_warning(caplog):
+    select, page = make_page()
+    page.logger.setLevel(logging.DEBUG)
+    page.logger.propagate = True
+    try:
+        with caplog.at_level(logging.WARNING, logger=page.logger.name):
+            page.fill_form({SELECT: "Country 111"}, fuzzy=True)
+    finally:
+        page.logger.propagate = False
+    assert select.value == "Country 11"
+    assert any("taxminiy" in record.getMessage() for record in caplog.records)
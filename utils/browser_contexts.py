@@ -0,0 +1,233 @@
+"""
+Bitta Chrome jarayonida ko'plab izolyatsiyalangan testlar.
+Har bir test o'z browser context ida (CDP Target.createBrowserContext - cookie, storage, cache alohida)
+yoki CDP bo'lmasa alohida oynada ishlaydi. Test odatdagi WebDriver obyektini oladi:
+har bir buyruqdan oldin kerakli oynaga avtomatik o'tiladi, shuning uchun BasePage va testlar
+o'zgarmaydi. Bitta WebDriver sessiyasi buyruqlarni ketma-ket bajaradi - buyruqlar umumiy qulf ostida.
+"""
+import os
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+from selenium.common.exceptions import NoSuchWindowException, WebDriverException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.mobile import Mobile
+from selenium.webdriver.remote.switch_to import SwitchTo
+
+from utils.logger import get_logger
+
+ISOLATION_MODES = ("context", "window")
+
+# Oynaga bog'liq bo'lmagan buyruqlar - oldindan oyna almashtirilmaydi
+WINDOWLESS_COMMANDS = {
+    Command.NEW_SESSION, Command.QUIT, Command.W3C_GET_WINDOW_HANDLES,
+    Command.SET_TIMEOUTS, Command.GET_TIMEOUTS, Command.SWITCH_TO_WINDOW,
+}
+# Driver nusxasiga ko'chirilmaydigan atributlar (asl driver execute ining o'ramlari)
+_DRIVER_HOOKS = ("execute", "_command_count", "_frame_path")
+
+_context_classes = {}
+
+
+def _handle_id(handle):
+    """Eski chromedriver handle lari "CDwindow-" prefiksli, CDP targetId esa prefikssiz"""
+    return handle[len("CDwindow-"):] if handle.startswith("CDwindow-") else handle
+
+
+class _FairLock:
+    """
+    Navbat (FIFO) bo'yicha qayta kiriladigan qulf. threading.RLock adolatsiz: kutishni bo'laklab
+    bajarayotgan thread qulfni darhol qayta olib, boshqa context larni ushlab turadi.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._queue = deque()
+        self._owner = None
+        self._depth = 0
+
+    def __enter__(self):
+        me = threading.get_ident()
+        with self._condition:
+            if self._owner == me:
+                self._depth += 1
+                return self
+            self._queue.append(me)
+            while self._owner is not None or self._queue[0] != me:
+                self._condition.wait()
+            self._queue.popleft()
+            self._owner, self._depth = me, 1
+        return self
+
+    @property
+    def waiting(self):
+        """Qulfni kutayotgan threadlar soni"""
+        return len(self._queue)
+
+    def __exit__(self, *exc):
+        with self._condition:
+            self._depth -= 1
+            if not self._depth:
+                self._owner = None
+                self._condition.notify_all()
+
+
+class _ContextDriverMixin:
+    """Umumiy sessiyadagi bitta context: buyruqlar qulf ostida, o'z oynasida bajariladi"""
+
+    def execute(self, driver_command, params=None):
+        browser = self._browser
+        if self.context_handle is None:
+            raise NoSuchWindowException("Browser context yopilgan, bu driver endi ishlatilmaydi")
+        with browser.lock:
+            if driver_command not in WINDOWLESS_COMMANDS and browser.current_handle != self.context_handle:
+                super().execute(Command.SWITCH_TO_WINDOW, {"handle": self.context_handle})
+                browser.current_handle = self.context_handle
+                if "_frame_path" in vars(self):
+                    # Oyna almashganda brauzer yuqori hujjatga qaytadi (utils.locators.FrameTracker)
+                    self._frame_path = ()
+
+            response = super().execute(driver_command, params)
+
+            if driver_command == Command.SWITCH_TO_WINDOW:
+                # Test o'zi popup ga o'tdi - context endi shu oynada
+                self.context_handle = browser.current_handle = params["handle"]
+            elif driver_command == Command.CLOSE:
+                browser.current_handle = None
+            return response
+
+    @property
+    def wait_slice(self):
+        """BasePage._wait_until uchun: boshqa context lar navbatda bo'lsa kutish juda qisqa bo'laklanadi"""
+        browser = self._browser
+        return browser.contended_wait_slice if browser.lock.waiting else browser.wait_slice
+
+    @property
+    def window_handles(self):
+        """Faqat shu context ga tegishli oynalar"""
+        handles = super().window_handles
+        if not self.context_id:
+            return handles
+        targets = self.execute_cdp_cmd("Target.getTargets", {})["targetInfos"]
+        owned = {target["targetId"] for target in targets if target.get("browserContextId") == self.context_id}
+        return [handle for handle in handles if _handle_id(handle) in owned]
+
+    def quit(self):
+        """Brauzer emas, faqat shu context yopiladi"""
+        self._browser.close(self)
+
+
+class BrowserContexts:
+    """
+    contexts = BrowserContexts(get_driver("about:blank", profile="throughput"))
+    with contexts.context("https://...") as driver:
+        page = SomePage(driver)
+    * isolation - "context" (CDP, to'liq izolyatsiya) yoki "window" (faqat oyna, cookie umumiy); env BROWSER_ISOLATION
+    * wait_slice - bitta async kutish skriptining eng uzun vaqti (soniya): uzun kutishlar bo'laklanadi,
+      shunda boshqa context lar buyruqlari ham navbat oladi
+    * contended_wait_slice - boshqa context lar navbatda turganda bo'lak uzunligi (soniya)
+    Asl driver ni context lar ishlayotganda to'g'ridan-to'g'ri ishlatmang.
+    """
+
+    def __init__(self, driver, isolation=None, wait_slice=0.25, contended_wait_slice=0.001):
+        self.driver = driver
+        self.isolation = (isolation or os.getenv("BROWSER_ISOLATION", "context")).strip().lower()
+        if self.isolation not in ISOLATION_MODES:
+            raise ValueError(f"Notogri isolation: '{self.isolation}'. Faqat {', '.join(ISOLATION_MODES)}")
+        self.wait_slice = wait_slice
+        self.contended_wait_slice = contended_wait_slice
+        self.lock = _FairLock()
+        # Asl driver oynasi: context yaratish/yopish buyruqlari shu yerdan yuboriladi
+        self.home_handle = self.current_handle = driver.current_window_handle
+        self.drivers = []
+        self.logger = get_logger(f"browser_contexts_{os.getenv('PYTEST_XDIST_WORKER', 'master')}")
+
+    # ------------------------------------------------------------------------------
+
+    def _go_home(self):
+        if self.current_handle != self.home_handle:
+            self.driver.execute(Command.SWITCH_TO_WINDOW, {"handle": self.home_handle})
+            self.current_handle = self.home_handle
+
+    def _context_driver(self, handle, context_id):
+        """Asl driver sessiyasini ulashadigan, lekin o'z oynasiga bog'langan driver nusxasi"""
+        base_class = type(self.driver)
+        if base_class not in _context_classes:
+            _context_classes[base_class] = type(f"Context{base_class.__name__}", (_ContextDriverMixin, base_class), {})
+
+        context_driver = object.__new__(_context_classes[base_class])
+        # Asl driver ustiga o'rnatilgan execute o'ramlari (buyruq hisoblagichi, frame kuzatuvi) ko'chirilmaydi
+        context_driver.__dict__.update({key: value for key, value in self.driver.__dict__.items()
+                                        if key not in _DRIVER_HOOKS})
+        context_driver._switch_to = SwitchTo(context_driver)
+        context_driver._mobile = Mobile(context_driver)
+        context_driver._browser = self
+        context_driver.context_handle = handle
+        context_driver.context_id = context_id
+        return context_driver
+
+    def _create_context(self):
+        """CDP browser context va undagi tab: (handle, context_id). CDP bo'lmasa None"""
+        try:
+            context_id = self.driver.execute_cdp_cmd("Target.createBrowserContext", {})["browserContextId"]
+        except (AttributeError, WebDriverException) as e:
+            self.logger.warning(f"❗ Browser context yaratilmadi, oynaga o'tiladi: {str(e)}")
+            self.isolation = "window"
+            return None
+        target = self.driver.execute_cdp_cmd("Target.createTarget", {"url": "about:blank",
+                                                                      "browserContextId": context_id})
+        return target["targetId"], context_id
+
+    def new_driver(self, url=None):
+        """Yangi izolyatsiyalangan context va unga bog'langan driver"""
+        with self.lock:
+            self._go_home()
+            created = self._create_context() if self.isolation == "context" else None
+            if created:
+                handle, context_id = created
+            else:
+                handle, context_id = self.driver.execute(Command.NEW_WINDOW, {"type": "window"})["value"]["handle"], None
+            context_driver = self._context_driver(handle, context_id)
+            self.drivers.append(context_driver)
+
+        self.logger.info("⏺ Yangi %s ochildi (%s ta faol)", self.isolation, len(self.drivers))
+        if url:
+            context_driver.get(url)
+        return context_driver
+
+    def close(self, context_driver):
+        """Context ni (barcha oynalari bilan) yopish"""
+        with self.lock:
+            if context_driver not in self.drivers:
+                return
+            self.drivers.remove(context_driver)
+            handle, context_id = context_driver.context_handle, context_driver.context_id
+            # Handle bekor qilinadi: yopilgan context driveri boshqa oynaga buyruq yubormaydi
+            context_driver.context_handle = context_driver.context_id = None
+            try:
+                self._go_home()
+                if context_id:
+                    self.driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context_id})
+                else:
+                    self.driver.execute(Command.SWITCH_TO_WINDOW, {"handle": handle})
+                    self.current_handle = handle
+                    self.driver.execute(Command.CLOSE)
+                    self._go_home()
+            except WebDriverException as e:
+                self.logger.warning(f"❗ Context yopishda xatolik: {str(e)}")
+                self.current_handle = None
+
+    @contextmanager
+    def context(self, url=None):
+        context_driver = self.new_driver(url)
+        try:
+            yield context_driver
+        finally:
+            self.close(context_driver)
+
+    def close_all(self, quit_browser=True):
+        for context_driver in list(self.drivers):
+            self.close(context_driver)
+        if quit_browser:
+            self.driver.quit()
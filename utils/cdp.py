@@ -0,0 +1,352 @@
+"""
+asyncio ustidagi minimal Chrome DevTools Protocol (CDP) mijozi.
+Bitta websocket ulanishi (CDPConnection) orqali ko'plab target/session lar
+bir event loop da parallel boshqariladi (flatten rejim, har bir xabarda sessionId).
+Websocket protokoli (handshake, bo'lingan xabarlar, ping/pong, close) - wsproto (requirements.txt),
+o'qish/yozish asyncio stream lari orqali.
+"""
+import asyncio
+import itertools
+import json
+import urllib.request
+from collections import defaultdict
+from urllib.parse import urlparse
+
+from wsproto import ConnectionType, WSConnection
+from wsproto.connection import ConnectionState
+from wsproto.events import (
+    AcceptConnection, BytesMessage, CloseConnection, Message, Ping, RejectConnection, Request, TextMessage)
+from wsproto.utilities import LocalProtocolError, RemoteProtocolError
+
+READ_CHUNK = 2 ** 16
+
+
+class CDPError(Exception):
+    """CDP buyrug'i xato bilan qaytdi yoki ulanish uzildi"""
+
+    def __init__(self, message, method=None, code=None):
+        self.method = method
+        self.code = code
+        super().__init__(f"{method}: {message}" if method else message)
+
+
+# =====================================================================================
+# Websocket (wsproto)
+
+class WebSocketStream:
+    """
+    wsproto ulanishi + asyncio stream: to'liq matnli xabarlarni o'qish/yozish.
+    Bo'lingan xabarlar yig'iladi, ping ga pong va close ga javob avtomatik yuboriladi.
+    Mijoz (connect) va server (accept, soxta CDP server uchun) tomonlari uchun bitta klass.
+    """
+
+    def __init__(self, reader, writer, connection):
+        self._reader = reader
+        self._writer = writer
+        self._ws = connection
+        self._events = self._ws.events()
+        self._parts = []
+        self._eof = False
+        self.closed = False
+
+    @classmethod
+    async def connect(cls, url, timeout=30):
+        url = urlparse(url)
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(url.hostname, url.port or 80), timeout)
+        stream = cls(reader, writer, WSConnection(ConnectionType.CLIENT))
+        path = url.path + (f"?{url.query}" if url.query else "")
+        writer.write(stream._ws.send(Request(host=url.netloc, target=path)))
+        event = await asyncio.wait_for(stream._next_event(), timeout)
+        if not isinstance(event, AcceptConnection):
+            writer.close()
+            status = getattr(event, "status_code", None)
+            raise CDPError(f"Websocket ulanmadi: {status or event}")
+        return stream
+
+    @classmethod
+    async def accept(cls, reader, writer):
+        stream = cls(reader, writer, WSConnection(ConnectionType.SERVER))
+        event = await stream._next_event()
+        if not isinstance(event, Request):
+            writer.close()
+            raise CDPError(f"Websocket so'rovi kutilgandi: {event}")
+        writer.write(stream._ws.send(AcceptConnection()))
+        return stream
+
+    async def _next_event(self):
+        """Navbatdagi wsproto hodisasi; ulanish uzilsa None"""
+        while True:
+            try:
+                for event in self._events:
+                    return event
+            except RemoteProtocolError as e:
+                raise ConnectionError(f"Websocket protokol xatosi: {e}")
+            if self._eof:
+                return None
+            data = await self._reader.read(READ_CHUNK)
+            self._eof = not data
+            self._ws.receive_data(data or None)
+            self._events = self._ws.events()
+
+    async def receive(self):
+        """To'liq matnli xabar; ulanish yopilsa None"""
+        while True:
+            event = await self._next_event()
+            if event is None or isinstance(event, CloseConnection):
+                # Server yopishni boshladi - javob (ulanish shunchaki uzilgan bo'lsa javob yo'q)
+                if self._ws.state is ConnectionState.REMOTE_CLOSING:
+                    self._write(self._ws.send(event.response()))
+                self.closed = True
+                return None
+            if isinstance(event, Ping):
+                self._write(self._ws.send(event.response()))
+            elif isinstance(event, (TextMessage, BytesMessage)):
+                self._parts.append(event.data)
+                if event.message_finished:
+                    parts, self._parts = self._parts, []
+                    return "".join(parts) if isinstance(event, TextMessage) else b"".join(parts).decode("utf-8")
+            elif isinstance(event, RejectConnection):
+                self.closed = True
+                return None
+
+    def _write(self, data):
+        try:
+            self._writer.write(data)
+        except (ConnectionError, RuntimeError):
+            self.closed = True
+
+    def send_nowait(self, text):
+        """Xabarni bufferga yozish (drain siz)"""
+        try:
+            data = self._ws.send(Message(data=text))
+        except LocalProtocolError as e:
+            raise ConnectionError(f"Websocket yopilgan: {e}")
+        self._write(data)
+
+    async def send(self, text):
+        self.send_nowait(text)
+        await self._writer.drain()
+
+    async def close(self):
+        self.closed = True
+        if self._ws.state is ConnectionState.OPEN:
+            try:
+                self._writer.write(self._ws.send(CloseConnection(code=1000)))
+                await self._writer.drain()
+            except (ConnectionError, RuntimeError):
+                pass
+        self._writer.close()
+
+
+# =====================================================================================
+
+def cdp_websocket_url(driver):
+    """Selenium ChromeDriver sessiyasidan brauzer darajasidagi CDP websocket manzili"""
+    address = driver.capabilities.get("goog:chromeOptions", {}).get("debuggerAddress")
+    if not address:
+        raise CDPError("Brauzer debuggerAddress bermadi (Chrome emas yoki remote sessiya)")
+    with urllib.request.urlopen(f"http://{address}/json/version", timeout=10) as response:
+        return json.load(response)["webSocketDebuggerUrl"]
+
+
+class CDPConnection:
+    """
+    Brauzerga bitta websocket ulanishi. send() javobni kutadi, hodisalar on() orqali tinglanadi.
+    Bir nechta CDPSession (tab/browser context) shu ulanishni bo'lishadi.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._listeners = defaultdict(list)
+        self._write_lock = asyncio.Lock()
+        self._reader_task = asyncio.ensure_future(self._read_loop())
+        self.closed = False
+
+    @classmethod
+    async def connect(cls, ws_url, timeout=30):
+        return cls(await WebSocketStream.connect(ws_url, timeout))
+
+    async def _read_loop(self):
+        error = CDPError("CDP ulanishi yopildi")
+        try:
+            while True:
+                message = await self._stream.receive()
+                if message is None:
+                    break
+                data = json.loads(message)
+                if "id" in data:
+                    future, method = self._pending.pop(data["id"], (None, None))
+                    if future is None or future.done():
+                        continue
+                    if "error" in data:
+                        future.set_exception(CDPError(data["error"].get("message"), method,
+                                                      data["error"].get("code")))
+                    else:
+                        future.set_result(data.get("result", {}))
+                else:
+                    self._dispatch(data.get("method"), data.get("params", {}), data.get("sessionId"))
+        except (asyncio.IncompleteReadError, ConnectionError) as e:
+            error = CDPError(f"CDP ulanishi uzildi: {e}")
+        finally:
+            self.closed = True
+            for future, _ in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._pending.clear()
+
+    def _dispatch(self, method, params, session_id):
+        keys = ((method, session_id), (method, None)) if session_id else ((method, None),)
+        for key in keys:
+            for callback in list(self._listeners.get(key, ())):
+                callback(params, session_id)
+
+    def on(self, method, callback, session_id=None):
+        """callback(params, session_id); session_id=None - barcha sessiyalar hodisalari"""
+        self._listeners[(method, session_id)].append(callback)
+
+    def off(self, method, callback, session_id=None):
+        listeners = self._listeners.get((method, session_id), [])
+        if callback in listeners:
+            listeners.remove(callback)
+
+    async def send(self, method, params=None, session_id=None, timeout=None):
+        if self.closed:
+            raise CDPError("CDP ulanishi yopilgan", method)
+        message_id = next(self._ids)
+        message = {"id": message_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message_id] = (future, method)
+        try:
+            async with self._write_lock:
+                await self._stream.send(json.dumps(message))
+        except ConnectionError as e:
+            self._pending.pop(message_id, None)
+            raise CDPError(f"CDP ulanishi uzildi: {e}", method)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(message_id, None)
+
+    async def new_session(self, url=None, new_context=True):
+        """
+        Yangi tab ochib unga ulanish. new_context=True - alohida browser context
+        (cookie/storage boshqa sessiyalardan ajratilgan, incognito kabi)
+        """
+        context_id = None
+        if new_context:
+            context_id = (await self.send("Target.createBrowserContext", {"disposeOnDetach": True}))["browserContextId"]
+        params = {"url": "about:blank"}
+        if context_id:
+            params["browserContextId"] = context_id
+        target_id = (await self.send("Target.createTarget", params))["targetId"]
+        session_id = (await self.send("Target.attachToTarget", {"targetId": target_id, "flatten": True}))["sessionId"]
+
+        session = CDPSession(self, session_id, target_id, context_id)
+        await session.send("Page.enable")
+        await session.send("Runtime.enable")
+        if url:
+            await session.navigate(url)
+        return session
+
+    async def close(self):
+        await self._stream.close()
+        self._reader_task.cancel()
+        try:
+            await self._reader_task
+        except (asyncio.CancelledError, CDPError):
+            pass
+
+
+class CDPSession:
+    """Bitta target (tab) bilan ishlash: buyruqlar va hodisalar shu sessiyaga bog'langan"""
+
+    def __init__(self, connection, session_id, target_id, context_id=None):
+        self.connection = connection
+        self.session_id = session_id
+        self.target_id = target_id
+        self.context_id = context_id
+
+    async def send(self, method, params=None, timeout=None):
+        return await self.connection.send(method, params, session_id=self.session_id, timeout=timeout)
+
+    def on(self, method, callback):
+        self.connection.on(method, callback, session_id=self.session_id)
+
+    def off(self, method, callback):
+        self.connection.off(method, callback, session_id=self.session_id)
+
+    async def wait_for_event(self, method, timeout=None, predicate=None, trigger=None):
+        """
+        Hodisani kutish (params qaytadi). trigger - hodisani yuzaga keltiruvchi coroutine,
+        tinglovchi o'rnatilgandan keyin ishga tushadi (poyga bo'lmasligi uchun)
+        """
+        future = asyncio.get_running_loop().create_future()
+
+        def callback(params, _session_id):
+            if not future.done() and (predicate is None or predicate(params)):
+                future.set_result(params)
+
+        self.on(method, callback)
+        try:
+            if trigger is not None:
+                await trigger
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self.off(method, callback)
+
+    async def navigate(self, url, timeout=60):
+        """Sahifaga o'tish va load hodisasini kutish"""
+        await self.wait_for_event("Page.loadEventFired", timeout=timeout,
+                                  trigger=self.send("Page.navigate", {"url": url}))
+
+    async def wait_for_network_idle(self, idle_time=0.5, timeout=30, max_inflight=0):
+        """
+        Tarmoq tinchlanishini kutish: idle_time davomida ochiq so'rovlar max_inflight dan oshmasa.
+        Network.* hodisalari tinglanadi (polling yo'q). Vaqt tugasa asyncio.TimeoutError.
+        """
+        inflight = set()
+        activity = asyncio.Event()
+
+        def started(params, _session_id):
+            inflight.add(params["requestId"])
+            activity.set()
+
+        def finished(params, _session_id):
+            inflight.discard(params["requestId"])
+            activity.set()
+
+        events = (("Network.requestWillBeSent", started), ("Network.loadingFinished", finished),
+                  ("Network.loadingFailed", finished))
+        for method, callback in events:
+            self.on(method, callback)
+
+        async def idle():
+            while True:
+                activity.clear()
+                if len(inflight) > max_inflight:
+                    await activity.wait()
+                    continue
+                try:
+                    await asyncio.wait_for(activity.wait(), idle_time)
+                except asyncio.TimeoutError:
+                    return
+
+        try:
+            await self.send("Network.enable")
+            await asyncio.wait_for(idle(), timeout)
+        finally:
+            for method, callback in events:
+                self.off(method, callback)
+
+    async def close(self):
+        try:
+            await self.connection.send("Target.closeTarget", {"targetId": self.target_id})
+            if self.context_id:
+                await self.connection.send("Target.disposeBrowserContext", {"browserContextId": self.context_id})
+        except CDPError:
+            pass
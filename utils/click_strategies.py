@@ -0,0 +1,154 @@
+"""
+O'rganilgan click usullari: (page klassi, locator) uchun oxirgi ishlagan usul diskda saqlanadi.
+Oddiy click hech qachon ishlamaydigan locatorlar keyingi safar to'g'ridan-to'g'ri JS click bilan bosiladi
+(ikki retry kutishi va qayta kutishlarsiz). Har revalidate_every-chi foydalanishda to'liq zanjir
+qayta sinaladi - sahifa tuzatilgan bo'lsa usul yana "native" ga qaytadi.
+Fayl jarayonlar orasida umumiy: saqlashda FileLock ostida diskdagi yozuvlar bilan birlashtiriladi.
+"""
+import json
+import os
+import threading
+import time
+
+from utils.file_lock import FileLock
+
+DEFAULT_STRATEGY_FILE = os.path.join(os.path.expanduser("~"), ".cache", "globalsqa_test", "click_strategies.json")
+
+# click() zanjiridagi usullar: "native", "retry" (ikkinchi oddiy click), "js".
+# Zanjirni qisqartiradigan (to'g'ridan-to'g'ri ishlatiladigan) usullar
+SHORTCUT_STRATEGIES = ("js",)
+
+
+def _key(page_name, locator):
+    by, value = locator
+    return f"{page_name}|{by}|{value}"
+
+
+class ClickStrategyStore:
+    """
+    * path - JSON fayl (CLICK_STRATEGY_FILE env)
+    * revalidate_every - o'rganilgan usul shuncha marta ishlatilgach to'liq zanjir qayta sinaladi
+    """
+
+    def __init__(self, path=None, revalidate_every=20):
+        self.path = path or os.getenv("CLICK_STRATEGY_FILE") or DEFAULT_STRATEGY_FILE
+        self.revalidate_every = revalidate_every
+        self.stats = {"learned_hits": 0, "revalidations": 0, "fallbacks": 0, "saved_seconds": 0.0}
+        self._entries = None
+        self._dirty = set()
+        self._lock = threading.Lock()
+
+    def _read_file(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _load(self):
+        if self._entries is None:
+            self._entries = self._read_file()
+        return self._entries
+
+    # ------------------------------------------------------------------------------
+
+    def lookup(self, page_name, locator):
+        """
+        Qisqa yo'l usuli ("js") yoki None - to'liq zanjir ishlatilsin.
+        Revalidatsiya navbati kelgan bo'lsa ham None qaytadi.
+        """
+        with self._lock:
+            entry = self._load().get(_key(page_name, locator))
+            if not entry or entry["strategy"] not in SHORTCUT_STRATEGIES:
+                return None
+            entry["uses"] = entry.get("uses", 0) + 1
+            self._dirty.add(_key(page_name, locator))
+            if entry["uses"] % self.revalidate_every == 0:
+                self.stats["revalidations"] += 1
+                return None
+            return entry["strategy"]
+
+    def chain_cost(self, page_name, locator):
+        """To'liq zanjir o'rtacha davomiyligi (soniya) yoki 0"""
+        with self._lock:
+            entry = self._load().get(_key(page_name, locator))
+            return entry.get("chain_cost", 0.0) if entry else 0.0
+
+    def record(self, page_name, locator, strategy, duration):
+        """To'liq zanjirda strategy ishladi, duration - zanjir davomiyligi"""
+        key = _key(page_name, locator)
+        with self._lock:
+            entries = self._load()
+            if strategy == "native":
+                # Oddiy holat saqlanmaydi (revalidatsiyada tuzalgan locator o'chiriladi) -
+                # fayl faqat muammoli locatorlar bilan o'sadi
+                if entries.pop(key, None) is not None:
+                    self._dirty.add(key)
+                return
+            entry = entries.get(key) or {"uses": 0}
+            # Zanjir narxi - eksponensial o'rtacha
+            previous = entry.get("chain_cost")
+            entry["chain_cost"] = duration if previous is None else previous * 0.7 + duration * 0.3
+            entry["strategy"] = strategy
+            entry["updated"] = time.time()
+            entries[key] = entry
+            self._dirty.add(key)
+
+    def record_learned(self, page_name, locator, duration):
+        """Qisqa yo'l ishladi: tejalgan vaqt = zanjir narxi - qisqa yo'l davomiyligi"""
+        saved = max(self.chain_cost(page_name, locator) - duration, 0.0)
+        with self._lock:
+            self.stats["learned_hits"] += 1
+            self.stats["saved_seconds"] += saved
+        return saved
+
+    def forget(self, page_name, locator):
+        """Qisqa yo'l ishlamadi - keyingi safar to'liq zanjir"""
+        key = _key(page_name, locator)
+        with self._lock:
+            self.stats["fallbacks"] += 1
+            if self._load().pop(key, None) is not None:
+                self._dirty.add(key)
+
+    # ------------------------------------------------------------------------------
+
+    def save(self):
+        """O'zgargan yozuvlarni diskdagi fayl bilan birlashtirib atomik yozish"""
+        with self._lock:
+            if not self._dirty:
+                return
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with FileLock(f"{self.path}.lock", timeout=30):
+                entries = self._read_file()
+                for key in self._dirty:
+                    if key in self._entries:
+                        entries[key] = self._entries[key]
+                    else:
+                        entries.pop(key, None)
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(entries, f, ensure_ascii=False, indent=1)
+                os.replace(tmp_path, self.path)
+            self._entries = entries
+            self._dirty.clear()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_click_strategy_store():
+    """Jarayon uchun yagona ClickStrategyStore"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ClickStrategyStore()
+        return _store
+
+
+def save_click_strategies():
+    """Store yaratilgan bo'lsa diskka yozish (sessiya oxirida)"""
+    if _store is not None:
+        _store.save()
+        return _store.stats
+    return None
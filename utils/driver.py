@@ -1,27 +1,222 @@
+import os
+import time
+
 from selenium import webdriver
+from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
 from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 
+from utils.driver_cache import resolve_driver_path
+from utils.launch_profiles import PROFILES, get_profile
 
-def get_driver(url, headless=False):
+PAGE_LOAD_STRATEGIES = ("normal", "eager", "none")
 
-    driver_path = ChromeDriverManager().install()
-    service = ChromeService(driver_path)
+# Reklama, analitika va shriftlar (CDP Network.setBlockedURLs patternlari)
+DEFAULT_BLOCKLIST = [
+    "*googlesyndication.com*",
+    "*doubleclick.net*",
+    "*googleadservices.com*",
+    "*googletagservices.com*",
+    "*googletagmanager.com*",
+    "*google-analytics.com*",
+    "*adservice.google.*",
+    "*amazon-adsystem.com*",
+    "*facebook.net*",
+    "*hotjar.com*",
+    "*fonts.googleapis.com*",
+    "*fonts.gstatic.com*",
+    "*.woff",
+    "*.woff2",
+]
+
+# Ochiq fetch/XHR so'rovlari hisoblagichi: PerformanceObserver faqat tugagan resurslarni ko'radi.
+# open_url uni CDP orqali har yangi hujjatga oldindan o'rnatadi (sahifaning birinchi so'rovlari ham sanaladi),
+# CDP bo'lmasa NETWORK_IDLE_JS kutish boshida o'rnatadi.
+NETWORK_TRACKER_JS = """
+(function () {
+    if (window.__networkTracker) { return; }
+    var tracker = window.__networkTracker = {pending: 0, last: performance.now()};
+    function settle() { tracker.pending = Math.max(tracker.pending - 1, 0); tracker.last = performance.now(); }
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function () {
+            tracker.pending++;
+            var result;
+            try { result = fetch.apply(this, arguments); } catch (e) { settle(); throw e; }
+            result.then(settle, settle);
+            return result;
+        };
+    }
+    if (window.XMLHttpRequest) {
+        var send = XMLHttpRequest.prototype.send;
+        XMLHttpRequest.prototype.send = function () {
+            tracker.pending++;
+            this.addEventListener('loadend', settle);
+            try { return send.apply(this, arguments); } catch (e) { this.removeEventListener('loadend', settle); settle(); throw e; }
+        };
+    }
+})();
+"""
+
+# Joriy hujjat identifikatori (navigatsiyadan oldin olinadi): yangi hujjatda u bo'lmaydi
+DOCUMENT_ID_JS = "return window.__documentId || (window.__documentId = String(Math.random()).slice(2));"
+
+# Tarmoq tinchlanishini kutish: ochiq fetch/XHR yo'q va idle_ms davomida yangi resurs yuklanmasa true,
+# vaqt tugasa false. Idle taymer hujjat maqsadga mos kelgandan keyin boshlanadi: eski hujjat
+# (previousDocument id si hali turibdi - navigatsiya boshlanmagan) yoki boshlang'ich about:blank da kutish davom etadi.
+NETWORK_IDLE_JS = NETWORK_TRACKER_JS + """
+var done = arguments[arguments.length - 1];
+var idleMs = arguments[0], timeoutMs = arguments[1], target = arguments[2], previousDocument = arguments[3];
+var tracker = window.__networkTracker;
+var start = performance.now(), last = start, ready = null;
+var observer = new PerformanceObserver(function () { last = performance.now(); });
+observer.observe({type: 'resource', buffered: false});
+(function check() {
+    var now = performance.now();
+    var current = previousDocument == null || window.__documentId !== previousDocument;
+    var loaded = current && document.readyState !== 'loading' && (document.URL !== 'about:blank' || target === 'about:blank');
+    ready = loaded ? (ready === null ? now : ready) : null;
+    var quiet = now - Math.max(last, tracker.last, ready === null ? now : ready);
+    if (loaded && tracker.pending === 0 && quiet >= idleMs) { observer.disconnect(); done(true); return; }
+    if (now - start >= timeoutMs) { observer.disconnect(); done(false); return; }
+    setTimeout(check, Math.min(50, idleMs));
+})();
+"""
+
+
+def _env_flag(name, default=False):
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_blocklist():
+    """BLOCK_URLS=default - DEFAULT_BLOCKLIST, yoki vergul bilan ajratilgan patternlar"""
+    value = os.getenv("BLOCK_URLS", "").strip()
+    if not value:
+        return None
+    if value.lower() in ("1", "default"):
+        return list(DEFAULT_BLOCKLIST)
+    return [pattern.strip() for pattern in value.split(",") if pattern.strip()]
+
+
+def ensure_script_timeout(driver, seconds, refresh=False):
+    """
+    Async skript timeoutini kamida seconds qilish (faqat oshiriladi).
+    Joriy qiymat sessiyadan (driver.timeouts) bir marta o'qiladi va eslab qolinadi; uni boshqa kod
+    (set_script_timeout, pool) o'zgartirgan bo'lsa "script timeout" xatosidan keyin refresh=True bilan qayta o'qiladi.
+    """
+    current = getattr(driver, "_wait_script_timeout", None)
+    if current is None or refresh:
+        current = driver.timeouts.script
+    if current < seconds:
+        driver.set_script_timeout(seconds)
+        current = seconds
+    driver._wait_script_timeout = current
+
+
+def wait_for_network_idle(driver, idle_time=0.5, timeout=30, url=None, previous_document=None):
+    """
+    Sahifada ochiq fetch/XHR qolmaguncha va idle_time davomida yangi so'rov bo'lmaguncha kutish (bitta async skript).
+    previous_document - navigatsiyadan oldingi hujjat id si (DOCUMENT_ID_JS): eski hujjatda idle hisoblanmaydi.
+    Kutish paytida sahifa almashsa, qolgan vaqt bilan yangi sahifada davom etadi. True - tinchlandi
+    """
+    end_time = time.monotonic() + timeout
+    ensure_script_timeout(driver, timeout + 5)
+    refreshed = False
+    while True:
+        remaining_ms = max(int((end_time - time.monotonic()) * 1000), 0)
+        try:
+            return bool(driver.execute_async_script(NETWORK_IDLE_JS, int(idle_time * 1000), remaining_ms,
+                                                    url or "about:blank", previous_document))
+        except TimeoutException:
+            # Sessiyadagi script timeout eslab qolingandan kichik (boshqa kod o'zgartirgan)
+            if refreshed or time.monotonic() >= end_time:
+                raise
+            ensure_script_timeout(driver, timeout + 5, refresh=True)
+            refreshed = True
+        except JavascriptException as e:
+            # Faqat hujjat almashganda (navigatsiya, unload) yangi sahifada qayta o'rnatamiz
+            if not is_navigation_error(e):
+                raise
+            if time.monotonic() >= end_time:
+                return False
 
-    options = Options()
 
+def is_navigation_error(error):
+    """Skript bajarilayotganda hujjat almashgani (unload/navigatsiya) sabab bo'lgan JavascriptException"""
+    message = str(error).lower()
+    return any(marker in message for marker in ("unload", "navigated", "execution context was destroyed", "frame detached"))
+
+
+def block_urls(driver, patterns):
+    """CDP orqali URL patternlarini bloklash (faqat Chrome). Bloklanmasa False"""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+        return True
+    except (AttributeError, WebDriverException):
+        return False
+
+
+def install_network_tracker(driver):
+    """CDP orqali fetch/XHR hisoblagichini har yangi hujjatga oldindan o'rnatish (faqat Chrome). O'rnatilmasa False"""
+    if getattr(driver, "_network_tracker", False):
+        return True
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": NETWORK_TRACKER_JS})
+    except (AttributeError, WebDriverException):
+        return False
+    driver._network_tracker = True
+    return True
+
+
+def open_url(driver, url, network_idle=False, idle_time=0.5, timeout=30):
+    """url ni ochish; network_idle=True - page load strategy dan keyin tarmoq tinchlanishini ham kutish"""
+    if not network_idle:
+        driver.get(url)
+        return
+    install_network_tracker(driver)
+    # Eski hujjat belgilanadi: strategy=none da get() qaytganda u hali joriy bo'lishi mumkin
+    previous_document = driver.execute_script(DOCUMENT_ID_JS)
+    driver.get(url)
+    wait_for_network_idle(driver, idle_time=idle_time, timeout=timeout, url=url, previous_document=previous_document)
+
+
+def get_driver(url, headless=False, offline=None, page_load=None, blocklist=None, disable_images=None,
+               network_idle=None, profile=None):
+    """
+    Chrome driver yaratish va url ni ochish.
+    * profile - launch profil(lar): "local", "throughput", "throughput+no_images"...; env DRIVER_PROFILE
+    * page_load - "normal" (to'liq load), "eager" (DOMContentLoaded), "none" (kutmaydi); env PAGE_LOAD_STRATEGY
+    * blocklist - bloklanadigan URL patternlari (CDP); env BLOCK_URLS=default yoki patternlar
+    * disable_images - rasmlar yuklanmaydi; env DISABLE_IMAGES=1
+    * network_idle - get() dan keyin tarmoq tinchlanishini kutish; eager/none da sukut bo'yicha yoqiq
+    """
+    page_load = (page_load or os.getenv("PAGE_LOAD_STRATEGY", "normal")).strip().lower()
+    if page_load not in PAGE_LOAD_STRATEGIES:
+        raise ValueError(f"Notogri page_load: '{page_load}'. Faqat {', '.join(PAGE_LOAD_STRATEGIES)}")
+    blocklist = _env_blocklist() if blocklist is None else blocklist
+    disable_images = _env_flag("DISABLE_IMAGES") if disable_images is None else disable_images
+    network_idle = _env_flag("NETWORK_IDLE", page_load != "normal") if network_idle is None else network_idle
+
+    # Keshlangan chromedriver (offline=True yoki DRIVER_OFFLINE=1 - tarmoqqa umuman chiqilmaydi)
+    driver_path = resolve_driver_path(offline=offline)
+    service = ChromeService(driver_path)
+
+    launch_profile = get_profile(profile)
     if headless:
-        options.add_argument("--headless=new")
+        launch_profile = launch_profile + PROFILES["headless"]
+    if disable_images:
+        launch_profile = launch_profile + PROFILES["no_images"]
 
-    # Faqat kerakli va qulay local sozlamalar
-    options.add_argument("--start-maximized")               # Brauzerni to‘liq ochish
-    options.add_argument("--disable-notifications")         # Bildirishnomalarni o‘chirish
-    options.add_argument("--disable-infobars")              # "Chrome is being controlled" banneri chiqmasin
-    options.add_argument("--disable-extensions")            # Keraksiz extensionlar bloklansin
+    options = launch_profile.to_options()
+    options.page_load_strategy = page_load
     options.add_experimental_option("excludeSwitches", ["enable-logging"])  # Terminal loglar kam bo‘lsin
 
     driver = webdriver.Chrome(service=service, options=options)
     driver.set_page_load_timeout(60)
-    driver.get(url)
+    if blocklist:
+        block_urls(driver, blocklist)
+    open_url(driver, url, network_idle=network_idle)
     return driver
@@ -0,0 +1,112 @@
+import json
+import os
+import shutil
+import stat
+from functools import lru_cache
+
+from utils.file_lock import FileLock
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "globalsqa_test", "chromedriver")
+
+
+def _env_flag(name):
+    return os.getenv(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+@lru_cache(maxsize=1)
+def get_chrome_version():
+    """O'rnatilgan Chrome versiyasini tarmoqsiz aniqlash (None - aniqlanmadi), jarayon davomida keshlanadi"""
+    version = os.getenv("CHROME_VERSION")
+    if version:
+        return version
+    try:
+        from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+        return OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception:
+        return None
+
+
+def _cache_key(chrome_version):
+    """Chromedriver major versiya bo'yicha mos keladi: '126.0.6478.126' -> '126'"""
+    return chrome_version.split(".")[0]
+
+
+def _driver_filename():
+    return "chromedriver.exe" if os.name == "nt" else "chromedriver"
+
+
+def _read_manifest(version_dir):
+    try:
+        with open(os.path.join(version_dir, "manifest.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    path = manifest.get("path")
+    if path and os.path.isfile(path) and os.access(path, os.X_OK):
+        return path
+    return None
+
+
+def _store(version_dir, source_path, chrome_version):
+    """Yuklangan binary ni keshga atomik ko'chirish va manifest yozish"""
+    os.makedirs(version_dir, exist_ok=True)
+    target = os.path.join(version_dir, _driver_filename())
+    tmp_target = f"{target}.{os.getpid()}.tmp"
+    shutil.copy2(source_path, tmp_target)
+    os.chmod(tmp_target, os.stat(tmp_target).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    os.replace(tmp_target, target)
+
+    manifest_path = os.path.join(version_dir, "manifest.json")
+    tmp_manifest = f"{manifest_path}.{os.getpid()}.tmp"
+    with open(tmp_manifest, "w", encoding="utf-8") as f:
+        json.dump({"path": target, "chrome_version": chrome_version, "source": source_path}, f)
+    os.replace(tmp_manifest, manifest_path)
+    return target
+
+
+def resolve_driver_path(offline=None, cache_dir=None):
+    """
+    Chromedriver yo'lini topish:
+    1. CHROMEDRIVER_PATH env
+    2. Chrome versiyasi bo'yicha diskdagi kesh (tarmoqsiz)
+    3. offline rejimda (DRIVER_OFFLINE=1) - PATH dagi chromedriver, topilmasa xato
+    4. aks holda qulf ostida webdriver_manager orqali yuklab, keshga saqlash
+    Chrome versiyasi aniqlanmasa kesh ishlatilmaydi: boshqa Chrome uchun saqlangan driver mos kelmasligi mumkin,
+    shuning uchun driver har safar webdriver_manager orqali aniqlanadi (u Chrome ni o'zi tekshiradi).
+    """
+    env_path = os.getenv("CHROMEDRIVER_PATH")
+    if env_path and os.path.isfile(env_path):
+        return env_path
+
+    offline = _env_flag("DRIVER_OFFLINE") if offline is None else offline
+    cache_dir = cache_dir or os.getenv("CHROMEDRIVER_CACHE_DIR") or DEFAULT_CACHE_DIR
+
+    chrome_version = get_chrome_version()
+    version_dir = os.path.join(cache_dir, _cache_key(chrome_version)) if chrome_version else None
+
+    cached = _read_manifest(version_dir) if version_dir else None
+    if cached:
+        return cached
+
+    if offline:
+        system_driver = shutil.which(_driver_filename())
+        if system_driver:
+            return system_driver
+        if not version_dir:
+            raise FileNotFoundError("❌ Offline rejim: Chrome versiyasi aniqlanmadi va PATH da chromedriver yo'q")
+        raise FileNotFoundError(
+            f"❌ Offline rejim: Chrome {chrome_version} uchun keshlangan chromedriver topilmadi ({version_dir})")
+
+    if not version_dir:
+        from webdriver_manager.chrome import ChromeDriverManager
+        return ChromeDriverManager().install()
+
+    # Bir nechta worker bir vaqtda yuklamasligi uchun qulf
+    with FileLock(os.path.join(cache_dir, f"{_cache_key(chrome_version)}.lock")):
+        cached = _read_manifest(version_dir)
+        if cached:
+            return cached
+
+        from webdriver_manager.chrome import ChromeDriverManager
+        downloaded = ChromeDriverManager().install()
+        return _store(version_dir, downloaded, chrome_version)
@@ -0,0 +1,265 @@
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.driver import get_driver
+from utils.logger import get_logger
+
+
+def _process_tree_rss_mb(pid):
+    """Linux: jarayon va uning bolalari RSS xotirasi (MB). Aniqlab bo'lmasa None"""
+    if not os.path.isdir("/proc"):
+        return None
+
+    total_kb = 0
+    stack = [pid]
+    seen = set()
+    while stack:
+        current = stack.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        try:
+            with open(f"/proc/{current}/status", encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total_kb += int(line.split()[1])
+                        break
+            with open(f"/proc/{current}/task/{current}/children", encoding="utf-8") as f:
+                stack.extend(int(child) for child in f.read().split())
+        except (OSError, ValueError):
+            continue
+    return total_kb / 1024
+
+
+def _origin(url):
+    """http(s) URL origini ("https://a.example:8443"), boshqa sxemalar uchun None"""
+    parts = urlsplit(url or "")
+    if parts.scheme in ("http", "https") and parts.netloc:
+        return f"{parts.scheme}://{parts.netloc}"
+    return None
+
+
+def visited_origins(driver):
+    """Joriy tab tarixidagi va hozirgi frame daraxtidagi originlar (CDP)"""
+    urls = [entry["url"] for entry in driver.execute_cdp_cmd("Page.getNavigationHistory", {})["entries"]]
+    stack = [driver.execute_cdp_cmd("Page.getFrameTree", {})["frameTree"]]
+    while stack:
+        node = stack.pop()
+        urls.append(node["frame"]["url"])
+        stack.extend(node.get("childFrames", ()))
+    return {origin for origin in map(_origin, urls) if origin}
+
+
+def driver_memory_mb(driver):
+    """Brauzer xotirasi (MB): avval jarayonlar RSS, bo'lmasa JS heap"""
+    service = getattr(driver, "service", None)
+    process = getattr(service, "process", None)
+    if process is not None:
+        rss = _process_tree_rss_mb(process.pid)
+        if rss:
+            return rss
+    try:
+        heap = driver.execute_script("return window.performance.memory ? performance.memory.usedJSHeapSize : null;")
+        return heap / (1024 * 1024) if heap else None
+    except WebDriverException:
+        return None
+
+
+class DriverPool:
+    """
+    Qayta ishlatiladigan WebDriver lar havzasi (har bir xdist worker jarayoni uchun bittadan).
+    * size - oldindan ishga tushiriladigan headless brauzerlar soni
+    * max_uses - brauzer shuncha testdan keyin qayta yaratiladi
+    * max_memory_mb - xotira shundan oshsa brauzer qayta yaratiladi
+    * profile - get_driver launch profili (None - DRIVER_PROFILE env yoki "local")
+    Testlar orasida brauzer yopilmaydi, faqat holati tozalanadi (cookies, test ochgan originlar storage,
+    IndexedDB, kesh, tablar). CDP siz tozalab bo'lmasa brauzer qayta yaratiladi.
+    """
+
+    def __init__(self, size=2, url="about:blank", headless=True, max_uses=50, max_memory_mb=1024, factory=None,
+                 profile=None):
+        self.size = size
+        self.url = url
+        self.max_uses = max_uses
+        self.max_memory_mb = max_memory_mb
+        self.factory = factory or (lambda: get_driver(url, headless=headless, profile=profile))
+        self.worker_id = os.getenv("PYTEST_XDIST_WORKER", "master")
+        self.logger = get_logger(f"driver_pool_{self.worker_id}")
+
+        self._idle = queue.Queue()
+        self._uses = {}
+        self._lock = threading.Lock()
+        self._alive = 0
+        self._created = 0
+        self.recycled = 0
+
+    # ------------------------------------------------------------------------------
+
+    def _create(self):
+        driver = self.factory()
+        with self._lock:
+            self._uses[id(driver)] = 0
+            self._created += 1
+        self.logger.info(f"⏺ [{self.worker_id}] Yangi brauzer ishga tushirildi ({self._created})")
+        return driver
+
+    def _create_reserved(self):
+        """_alive da joy oldindan band qilingan brauzerni yaratish; xato bo'lsa joy bo'shatiladi"""
+        try:
+            return self._create()
+        except BaseException:
+            with self._lock:
+                self._alive -= 1
+            raise
+
+    def warm_up(self):
+        """
+        size ta brauzerni parallel ravishda oldindan ishga tushirish.
+        Ba'zilari ishga tushmasa, tayyorlari havzaga qo'yiladi va birinchi xato ko'tariladi.
+        """
+        with self._lock:
+            missing = self.size - self._alive
+            self._alive += max(missing, 0)
+        if missing <= 0:
+            return
+        with ThreadPoolExecutor(max_workers=missing) as executor:
+            futures = [executor.submit(self._create_reserved) for _ in range(missing)]
+        errors = []
+        for future in futures:
+            if future.exception() is None:
+                self._idle.put(future.result())
+            else:
+                errors.append(future.exception())
+        if errors:
+            self.logger.error(f"❌ [{self.worker_id}] {len(errors)}/{missing} ta brauzer ishga tushmadi: {str(errors[0])}")
+            raise errors[0]
+
+    # ------------------------------------------------------------------------------
+
+    def acquire(self, timeout=None):
+        """
+        Bo'sh brauzerni olish. Havza hali to'lmagan bo'lsa yangisini yaratadi.
+        timeout (soniya) ichida bo'sh brauzer bo'lmasa TimeoutError.
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_create = self._alive < self.size
+            if can_create:
+                self._alive += 1
+        if can_create:
+            return self._create_reserved()
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"[{self.worker_id}] Havzada {timeout}s ichida bo'sh brauzer bo'lmadi "
+                               f"(size={self.size}, band={self._alive})") from None
+
+    def release(self, driver):
+        """Brauzerni havzaga qaytarish: holatini tozalash yoki kerak bo'lsa qayta yaratish"""
+        with self._lock:
+            self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+            uses = self._uses[id(driver)]
+
+        reason = None
+        if self.max_uses and uses >= self.max_uses:
+            reason = f"{uses} marta ishlatildi"
+        elif self.max_memory_mb:
+            memory = driver_memory_mb(driver)
+            if memory and memory > self.max_memory_mb:
+                reason = f"xotira {memory:.0f}MB > {self.max_memory_mb}MB"
+
+        if reason is None:
+            try:
+                self.reset_state(driver)
+                self._idle.put(driver)
+                return
+            except Exception as e:
+                reason = f"holatni tozalab bo'lmadi: {str(e)}"
+
+        # Brauzer havzaga qaytmaydi - har qanday holatda yopiladi va _alive dan chiqariladi
+        self.logger.info(f"⏺ [{self.worker_id}] Brauzer qayta yaratiladi: {reason}")
+        self._discard(driver)
+        with self._lock:
+            self._alive += 1
+            self.recycled += 1
+        try:
+            self._idle.put(self._create_reserved())
+        except Exception as e:
+            # Joy bo'sh qoldi - keyingi acquire() yangisini yaratadi
+            self.logger.error(f"❌ [{self.worker_id}] Brauzerni qayta yaratib bo'lmadi: {str(e)}")
+
+    @contextmanager
+    def driver(self, timeout=None):
+        """with pool.driver(timeout=...) as driver: - test oxirida brauzer havzaga qaytadi"""
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    # ------------------------------------------------------------------------------
+
+    def reset_state(self, driver):
+        """
+        Testlar orasida holatni tozalash: barcha cookies, HTTP kesh va test ochgan har bir origin storage i
+        (local, IndexedDB, Cache Storage, service worker). Storage.clearDataForOrigin wildcard ni qabul
+        qilmaydi, shuning uchun originlar har bir tab tarixi va frame daraxtidan yig'iladi.
+        Test yangi toza tabda boshlanadi (sessionStorage va tarix tabga bog'liq), eski tablar yopiladi.
+        CDP bo'lmasa xato ko'tariladi va release() brauzerni qayta yaratadi.
+        """
+        origins = set()
+        handles = driver.window_handles
+        for handle in handles:
+            driver.switch_to.window(handle)
+            origins |= visited_origins(driver)
+
+        driver.switch_to.new_window("tab")
+        fresh = driver.current_window_handle
+        for handle in handles:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(fresh)
+
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        for origin in sorted(origins):
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        if self.url != "about:blank":
+            driver.get(self.url)
+
+    def _discard(self, driver):
+        with self._lock:
+            self._uses.pop(id(driver), None)
+            self._alive -= 1
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            self.logger.warning(f"❗ Brauzerni yopishda xatolik: {str(e)}")
+
+    def close_all(self):
+        """Havzadagi barcha brauzerlarni yopish"""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+
+    def stats(self):
+        return {
+            "worker": self.worker_id,
+            "created": self._created,
+            "recycled": self.recycled,
+            "idle": self._idle.qsize(),
+            "in_use": self._alive - self._idle.qsize(),
+        }
@@ -0,0 +1,83 @@
+import time
+from collections import OrderedDict
+
+
+class ElementCache:
+    """
+    Locator -> WebElement LRU keshi (har bir page uchun alohida).
+    * maxsize - keshdagi elementlar soni chegarasi
+    * url_check_interval - URL o'zgarganini tekshirish oralig'i (soniya), har chaqiruvda emas
+    URL o'zgarsa yoki clear() chaqirilsa kesh tozalanadi, stale element invalidate() bilan chiqariladi.
+    """
+
+    def __init__(self, maxsize=64, url_check_interval=1.0):
+        self.maxsize = maxsize
+        self.url_check_interval = url_check_interval
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._items = OrderedDict()
+        self._url = None
+        self._url_checked_at = None
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, locator):
+        return tuple(locator) in self._items
+
+    def get(self, locator):
+        """Keshdan element olish (bo'lmasa None)"""
+        key = tuple(locator)
+        element = self._items.get(key)
+        if element is None:
+            self.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self.hits += 1
+        return element
+
+    def put(self, locator, element):
+        if element is None:
+            return
+        key = tuple(locator)
+        self._items[key] = element
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, locator):
+        """Bitta locatorni keshdan chiqarish (masalan, StaleElementReferenceException dan keyin)"""
+        if self._items.pop(tuple(locator), None) is not None:
+            self.evictions += 1
+
+    def clear(self):
+        """Butun keshni tozalash (navigatsiya yoki URL o'zgarganda)"""
+        self.evictions += len(self._items)
+        self._items.clear()
+
+    def check_url(self, get_url):
+        """
+        URL o'zgarganini tekshiradi, o'zgargan bo'lsa keshni tozalaydi.
+        get_url - joriy URL ni qaytaruvchi funksiya (WebDriver round trip), interval bilan chaqiriladi.
+        """
+        now = time.monotonic()
+        if self._url_checked_at is not None and now - self._url_checked_at < self.url_check_interval:
+            return
+        self._url_checked_at = now
+
+        url = get_url()
+        if self._url is not None and url != self._url:
+            self.clear()
+        self._url = url
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._items),
+            "hit_rate": self.hits / total if total else 0.0,
+        }
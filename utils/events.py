@@ -0,0 +1,222 @@
+"""
+Strukturalangan JSONL hodisalar logi: har bir BasePage amali uchun bitta JSON qator.
+Fayllar hajm yoki vaqt bo'yicha aylantiriladi, eski segmentlar gzip bilan siqiladi.
+Yozish ixtiyoriy: EVENT_LOG=1 bo'lsa yoqiladi (papka - EVENT_LOG_DIR, odatda logs/events).
+"""
+import atexit
+import glob
+import gzip
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+
+DEFAULT_EVENT_DIR = os.path.join("logs", "events")
+
+
+def _env_flag(name, default):
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+class EventSink:
+    """
+    JSONL hodisalar yozuvchisi.
+    * max_bytes - faol fayl shu hajmdan oshsa aylantiriladi
+    * max_age - faol fayl shuncha soniyadan eski bo'lsa aylantiriladi
+    * backup_count - saqlanadigan siqilgan segmentlar soni (eng eskilari o'chiriladi)
+    """
+
+    def __init__(self, directory=DEFAULT_EVENT_DIR, max_bytes=10 * 1024 * 1024, max_age=3600,
+                 backup_count=100, compress=True):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.backup_count = backup_count
+        self.compress = compress
+
+        worker = os.getenv("PYTEST_XDIST_WORKER", "master")
+        self.prefix = f"events_{worker}_{os.getpid()}"
+        self.path = os.path.join(directory, f"{self.prefix}.jsonl")
+
+        self._lock = threading.Lock()
+        self._file = None
+        self._size = 0
+        self._opened_at = None
+        self._compressors = []
+        # Siqish va eski segmentlarni o'chirish navbat bilan (bir vaqtda ikki thread bir faylga tegmasin)
+        self._compress_lock = threading.Lock()
+
+    def _open(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._size = self._file.tell()
+        self._opened_at = time.time()
+
+    def emit(self, event):
+        """Bitta hodisani (dict) JSON qator sifatida yozish"""
+        line = json.dumps(event, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._open()
+            elif self._should_rotate(len(line)):
+                self._rotate()
+            self._file.write(line)
+            self._size += len(line)
+
+    def _should_rotate(self, pending):
+        if self.max_bytes and self._size + pending > self.max_bytes:
+            return True
+        return bool(self.max_age) and time.time() - self._opened_at >= self.max_age
+
+    def _rotate(self):
+        self._file.close()
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        rolled = os.path.join(self.directory, f"{self.prefix}_{stamp}.jsonl")
+        os.replace(self.path, rolled)
+        self._open()
+
+        if self.compress:
+            # Siqish fon threadida, chaqiruvchi kutmaydi
+            thread = threading.Thread(target=self._compress, args=(rolled,), daemon=True)
+            thread.start()
+            self._compressors = [t for t in self._compressors if t.is_alive()] + [thread]
+        else:
+            self._prune()
+
+    def _compress(self, path):
+        with self._compress_lock:
+            try:
+                with open(path, "rb") as src, gzip.open(f"{path}.gz", "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+            except FileNotFoundError:
+                # Navbat kutayotganda backup_count dan eski bo'lib o'chirilgan
+                return
+            os.remove(path)
+            self._prune()
+
+    def _prune(self):
+        """backup_count dan ortiq eski segmentlarni o'chirish"""
+        if not self.backup_count:
+            return
+        mtimes = {}
+        for path in glob.glob(os.path.join(self.directory, f"{self.prefix}_*.jsonl*")):
+            try:
+                mtimes[path] = os.path.getmtime(path)
+            except OSError:
+                pass
+        segments = sorted(mtimes, key=mtimes.get)
+        for path in segments[:-self.backup_count]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def flush(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        for thread in self._compressors:
+            thread.join()
+
+
+_sink = None
+_sink_lock = threading.Lock()
+
+
+def get_event_sink():
+    """Jarayon uchun yagona EventSink (EVENT_LOG=1 bo'lmasa None)"""
+    global _sink
+    if _sink is None and _env_flag("EVENT_LOG", False):
+        with _sink_lock:
+            if _sink is None:
+                _sink = EventSink(directory=os.getenv("EVENT_LOG_DIR", DEFAULT_EVENT_DIR))
+                atexit.register(_sink.close)
+    return _sink
+
+
+def flush_events():
+    if _sink is not None:
+        _sink.flush()
+
+
+def emit_event(event):
+    sink = get_event_sink()
+    if sink is not None:
+        sink.emit(event)
+
+
+# =====================================================================================
+# O'qish va yig'ish (fayllarni xotiraga to'liq yuklamasdan)
+
+def _expand(paths):
+    if isinstance(paths, str):
+        paths = [paths]
+    for path in paths:
+        if os.path.isdir(path):
+            files = glob.glob(os.path.join(path, "**", "*.jsonl"), recursive=True)
+            files += glob.glob(os.path.join(path, "**", "*.jsonl.gz"), recursive=True)
+            yield from sorted(files)
+        else:
+            yield path
+
+
+def iter_events(paths):
+    """Papka yoki fayllardagi (.jsonl va .jsonl.gz) hodisalarni qatorma-qator qaytaradi"""
+    for path in _expand(paths):
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # Yozilish paytida uzilgan qator
+                    continue
+
+
+def aggregate_events(paths, key=("page", "method", "locator")):
+    """
+    Hodisalarni key bo'yicha yig'ish:
+    {key: {"count", "failures", "total_ms", "max_ms", "attempts"}}
+    """
+    stats = defaultdict(lambda: {"count": 0, "failures": 0, "total_ms": 0.0, "max_ms": 0.0, "attempts": 0})
+    for event in iter_events(paths):
+        item = stats[tuple(event.get(field) for field in key)]
+        duration = event.get("duration_ms") or 0.0
+        item["count"] += 1
+        item["total_ms"] += duration
+        item["max_ms"] = max(item["max_ms"], duration)
+        item["attempts"] += event.get("attempts") or 0
+        if event.get("outcome") != "ok":
+            item["failures"] += 1
+    return dict(stats)
+
+
+def main(argv=None):
+    """python -m utils.events [papka...] - eng sekin amallar ro'yxati"""
+    paths = (argv if argv is not None else sys.argv[1:]) or [DEFAULT_EVENT_DIR]
+    stats = aggregate_events(paths)
+    rows = sorted(stats.items(), key=lambda item: item[1]["total_ms"], reverse=True)
+    for (page, method, locator), item in rows[:50]:
+        mean = item["total_ms"] / item["count"]
+        print(f"{item['total_ms']:12.1f}ms  n={item['count']:<6} mean={mean:8.1f}ms  "
+              f"fail={item['failures']:<4} {page}.{method} {locator}")
+
+
+if __name__ == "__main__":
+    main()
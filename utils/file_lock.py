@@ -0,0 +1,101 @@
+import os
+import threading
+import time
+import uuid
+
+
+class FileLock:
+    """
+    Jarayonlar orasidagi oddiy fayl qulfi (O_CREAT | O_EXCL, Windows va Linux da ishlaydi).
+    * timeout - qulfni kutish vaqti (soniya)
+    * stale_after - qulf fayli shuncha vaqt yangilanmasa (egasi o'lgan yoki osilib qolgan) o'chiriladi.
+      Ushlab turilgan qulf mtime i fon threadda muntazam yangilanadi, shuning uchun uzoq setup qulfni yo'qotmaydi
+    Qulf faylida egasining tokeni turadi: faqat o'z qulfi o'chiriladi (release), eskirgan qulf esa
+    o'chirishdan oldin token o'zgarmaganligi tekshiriladi.
+    """
+
+    def __init__(self, path, timeout=120, stale_after=300, poll=0.05):
+        self.path = path
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self.poll = poll
+        self._token = None
+        self._stop = None
+        self._heartbeat = None
+
+    def acquire(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        end_time = time.monotonic() + self.timeout
+        token = f"{os.getpid()}:{uuid.uuid4().hex}"
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                self._remove_if_stale()
+                if time.monotonic() >= end_time:
+                    raise TimeoutError(f"Qulf {self.timeout}s ichida olinmadi: {self.path}")
+                time.sleep(self.poll)
+                continue
+            try:
+                os.write(fd, token.encode())
+            finally:
+                os.close(fd)
+            self._token = token
+            self._start_heartbeat()
+            return self
+
+    def _read_token(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _remove_if_stale(self):
+        token = self._read_token()
+        try:
+            if time.time() - os.path.getmtime(self.path) <= self.stale_after:
+                return
+            # Shu orada qulfni boshqa jarayon olgan bo'lsa (token boshqa) - o'chirilmaydi
+            if self._read_token() == token:
+                os.remove(self.path)
+        except OSError:
+            pass
+
+    def _start_heartbeat(self):
+        if not self.stale_after:
+            return
+        self._stop = threading.Event()
+        self._heartbeat = threading.Thread(target=self._beat, args=(self._stop, self._token, self.stale_after / 3),
+                                           name="file-lock-heartbeat", daemon=True)
+        self._heartbeat.start()
+
+    def _beat(self, stop, token, interval):
+        """Qulf ushlab turilganda mtime ni yangilash (qulf boshqaga o'tgan bo'lsa to'xtaydi)"""
+        while not stop.wait(interval):
+            if self._read_token() != token:
+                return
+            try:
+                os.utime(self.path)
+            except OSError:
+                return
+
+    def release(self):
+        if self._token is None:
+            return
+        if self._heartbeat is not None:
+            self._stop.set()
+            self._heartbeat.join()
+            self._stop = self._heartbeat = None
+        try:
+            if self._read_token() == self._token:
+                os.remove(self.path)
+        except OSError:
+            pass
+        self._token = None
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
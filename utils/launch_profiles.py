@@ -0,0 +1,100 @@
+"""
+Chrome ishga tushirish profillari. Profillar nom bilan tanlanadi va birlashtiriladi:
+get_driver(url, profile="throughput+no_images") yoki DRIVER_PROFILE=throughput,no_images.
+Birlashtirishda bir xil flag (masalan --window-size) keyingi profil qiymati bilan almashtiriladi,
+--disable-features / --enable-features ro'yxatlari esa qo'shiladi.
+"""
+import os
+import re
+
+from selenium.webdriver.chrome.options import Options
+
+# Qiymatlari vergul bilan qo'shiladigan flaglar
+LIST_FLAGS = ("--disable-features", "--enable-features")
+
+
+class LaunchProfile:
+    """
+    * arguments - Chrome buyruq qatori flaglari
+    * prefs - Chrome preferences (experimental "prefs")
+    """
+
+    def __init__(self, name, arguments=(), prefs=None):
+        self.name = name
+        self.arguments = list(arguments)
+        self.prefs = dict(prefs or {})
+
+    def __repr__(self):
+        return f"LaunchProfile({self.name!r})"
+
+    def __add__(self, other):
+        flags = {}
+        for argument in self.arguments + other.arguments:
+            key, _, value = argument.partition("=")
+            if key in LIST_FLAGS and key in flags:
+                merged = flags[key].partition("=")[2].split(",") + value.split(",")
+                argument = f"{key}={','.join(dict.fromkeys(item for item in merged if item))}"
+            flags[key] = argument
+        return LaunchProfile(f"{self.name}+{other.name}", flags.values(),
+                             {**self.prefs, **other.prefs})
+
+    def to_options(self, options=None):
+        options = options or Options()
+        for argument in self.arguments:
+            options.add_argument(argument)
+        if self.prefs:
+            options.add_experimental_option("prefs", self.prefs)
+        return options
+
+
+PROFILES = {
+    # Mahalliy interaktiv ishlash (avvalgi get_driver sozlamalari)
+    "local": LaunchProfile("local", [
+        "--start-maximized",                # Brauzerni to‘liq ochish
+        "--disable-notifications",          # Bildirishnomalarni o‘chirish
+        "--disable-infobars",               # "Chrome is being controlled" banneri chiqmasin
+        "--disable-extensions",             # Keraksiz extensionlar bloklansin
+    ]),
+    "headless": LaunchProfile("headless", ["--headless=new"]),
+    # CI / parallel ishga tushirish uchun: ko'rinmas, barqaror o'lcham, fon xizmatlarisiz, xotira cheklangan
+    "throughput": LaunchProfile("throughput", [
+        "--headless=new",
+        "--window-size=1920,1080",
+        "--disable-gpu",
+        "--disable-dev-shm-usage",          # /dev/shm kichik (Docker) bo'lsa crash bo'lmasin
+        "--disable-background-networking",
+        "--disable-component-update",
+        "--disable-sync",
+        "--disable-default-apps",
+        "--disable-extensions",
+        "--disable-notifications",
+        "--no-first-run",
+        "--mute-audio",
+        "--disable-features=Translate,OptimizationHints,MediaRouter",
+        "--js-flags=--max-old-space-size=512",  # Har bir renderer uchun V8 heap chegarasi (MB)
+        "--renderer-process-limit=4",
+    ]),
+    "no_images": LaunchProfile("no_images", ["--blink-settings=imagesEnabled=false"],
+                               prefs={"profile.managed_default_content_settings.images": 2}),
+    # Konteynerda root sifatida
+    "no_sandbox": LaunchProfile("no_sandbox", ["--no-sandbox"]),
+}
+
+
+def get_profile(spec=None):
+    """
+    "throughput+no_images" yoki "throughput,no_images" -> birlashtirilgan LaunchProfile.
+    spec berilmasa DRIVER_PROFILE env, u ham bo'lmasa "local"
+    """
+    spec = spec or os.getenv("DRIVER_PROFILE") or "local"
+    if isinstance(spec, LaunchProfile):
+        return spec
+    names = [name.strip() for name in re.split(r"[+,]", spec) if name.strip()]
+    unknown = [name for name in names if name not in PROFILES]
+    if unknown:
+        raise ValueError(f"Nomalum launch profil: {', '.join(unknown)}. Mavjudlari: {', '.join(PROFILES)}")
+
+    profile = PROFILES[names[0]]
+    for name in names[1:]:
+        profile = profile + PROFILES[name]
+    return profile
@@ -0,0 +1,162 @@
+"""
+Iframe va shadow DOM ichidagi elementlar uchun kompozit locatorlar:
+    PAY_BUTTON = composite(("frame", "iframe#payment"), ("shadow", "card-form"), (By.CSS_SELECTOR, "button.pay"))
+    # yoki: ("composite", "frame=iframe#payment >> shadow=card-form >> css selector=button.pay")
+Yo'l bir marta kompilyatsiya qilinadi (LocatorPlan, keshlanadi): frame qadamlari WebDriver switch
+buyruqlariga, qolgan shadow qadamlari bitta JS locatoriga ("shadow path") aylanadi.
+Joriy frame yo'li driverda kuzatiladi - kerakli frame da turgan bo'lsak qayta switch qilinmaydi.
+"""
+import json
+from functools import lru_cache
+
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.support.wait import WebDriverWait
+from selenium.common.exceptions import (
+    NoSuchFrameException, StaleElementReferenceException, TimeoutException)
+
+from base_functions.js_scripts import FIND_ELEMENT_JS
+
+COMPOSITE = "composite"
+# Brauzer ichida (FIND_ELEMENT_JS) shadow root lar orqali qidiruv; qiymati - [[by, value], ...] JSON
+SHADOW_PATH = "shadow path"
+
+FRAME = "frame"
+SHADOW = "shadow"
+STEP_SEPARATOR = " >> "
+STEP_KINDS = (FRAME, SHADOW, "css selector", "xpath", "id", "name", "class name", "tag name",
+              "link text", "partial link text")
+
+FIND_ONE_JS = FIND_ELEMENT_JS + "return __find(arguments[0], arguments[1]);"
+
+# Joriy frame ni o'zgartiradigan buyruqlar: FrameTracker dan tashqarida yuborilsa yo'l noma'lum bo'ladi
+FRAME_COMMANDS = frozenset((Command.SWITCH_TO_FRAME, Command.SWITCH_TO_PARENT_FRAME,
+                            Command.SWITCH_TO_WINDOW, Command.CLOSE,
+                            Command.GET, Command.REFRESH, Command.GO_BACK, Command.GO_FORWARD))
+
+
+def composite(*steps):
+    """(kind, value) qadamlaridan kompozit locator: kind - "frame", "shadow" yoki By qiymati"""
+    for kind, _ in steps:
+        if kind not in STEP_KINDS:
+            raise ValueError(f"Nomalum locator qadami: '{kind}'. Faqat {', '.join(STEP_KINDS)}")
+    return COMPOSITE, STEP_SEPARATOR.join(f"{kind}={value}" for kind, value in steps)
+
+
+def _parse_step(step):
+    kind, separator, value = step.partition("=")
+    if separator and kind.strip() in STEP_KINDS:
+        return kind.strip(), value.strip()
+    # Prefikssiz qadam - CSS selector
+    return "css selector", step.strip()
+
+
+def _document_locator(steps):
+    """Bitta hujjat ichidagi qadamlar -> (by, value); shadow bo'lmasa selenium locatorining o'zi"""
+    if len(steps) == 1:
+        return steps[0]
+    return SHADOW_PATH, json.dumps([list(step) for step in steps])
+
+
+class LocatorPlan:
+    """
+    * frames - ketma-ket kiriladigan iframe lar locatorlari (har biri o'z hujjatida)
+    * target - oxirgi hujjat ichidagi (by, value) locator
+    """
+    __slots__ = ("frames", "target")
+
+    def __init__(self, frames, target):
+        self.frames = frames
+        self.target = target
+
+    def __repr__(self):
+        return f"LocatorPlan(frames={self.frames}, target={self.target})"
+
+
+@lru_cache(maxsize=1024)
+def compile_locator(value):
+    """Kompozit yo'l qiymatini LocatorPlan ga kompilyatsiya qilish (natija keshlanadi)"""
+    frames, steps = [], []
+    for raw_step in value.split(STEP_SEPARATOR):
+        kind, step_value = _parse_step(raw_step)
+        if kind == FRAME:
+            frames.append(_document_locator(steps + [("css selector", step_value)]))
+            steps = []
+        elif kind == SHADOW:
+            steps.append(("css selector", step_value))
+        else:
+            steps.append((kind, step_value))
+    if not steps:
+        raise ValueError(f"Kompozit locator element qadami bilan tugashi kerak: '{value}'")
+    return LocatorPlan(tuple(frames), _document_locator(steps))
+
+
+def plan_for(locator):
+    """Har qanday locator uchun reja: oddiy (by, value) - frame siz, hujjatning yuqori darajasida"""
+    by, value = locator
+    if by == COMPOSITE:
+        return compile_locator(value)
+    return LocatorPlan((), (by, value))
+
+
+def install_frame_tracking(driver):
+    """
+    driver.execute ni o'rab, frame/oyna almashtiruvchi buyruqlardan keyin driver._frame_path ni
+    noma'lum (None) qiladi. Har bir driver uchun bir marta o'rnatiladi.
+    """
+    if "_frame_path" in vars(driver):
+        return driver
+    original_execute = driver.execute
+
+    def execute(driver_command, params=None):
+        if driver_command in FRAME_COMMANDS:
+            driver._frame_path = None
+        return original_execute(driver_command, params)
+
+    driver._frame_path = None
+    driver.execute = execute
+    return driver
+
+
+class FrameTracker:
+    """
+    Driver joriy frame yo'lini kuzatish (driver._frame_path).
+    Yo'l noma'lum bo'lsa (kompozit locator hali ishlatilmagan yoki test o'zi switch_to.frame qilgan)
+    oddiy locatorlar uchun frame ga tegilmaydi - qo'lda switch qilish avvalgidek ishlaydi.
+    """
+
+    def __init__(self, driver):
+        self.driver = install_frame_tracking(driver)
+        self.switches = 0
+        self.skipped = 0
+
+    @property
+    def path(self):
+        return getattr(self.driver, "_frame_path", None)
+
+    def reset(self, path=()):
+        self.driver._frame_path = path
+
+    def enter(self, frames, timeout):
+        """Kerakli frame yo'liga o'tish (allaqachon shu yerda bo'lsa hech narsa qilinmaydi)"""
+        if self.path == frames or (self.path is None and not frames):
+            self.skipped += 1
+            return
+        self.driver.switch_to.default_content()
+        self.reset(())
+        self.switches += 1
+        for index, frame_locator in enumerate(frames):
+            frame = self._wait_for_frame(frame_locator, timeout)
+            self.driver.switch_to.frame(frame)
+            self.switches += 1
+            self.reset(frames[:index + 1])
+
+    def _wait_for_frame(self, frame_locator, timeout):
+        def find(driver):
+            try:
+                return driver.execute_script(FIND_ONE_JS, *frame_locator)
+            except StaleElementReferenceException:
+                return None
+        try:
+            return WebDriverWait(self.driver, timeout).until(find)
+        except TimeoutException as e:
+            raise NoSuchFrameException(f"Frame {timeout}s ichida topilmadi: {frame_locator}") from e
@@ -1,30 +1,234 @@
-import inspect
+import atexit
+import contextvars
 import logging
 import os
+import queue
+import sys
+import threading
 from datetime import datetime
-from colorama import init, Fore, Style
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 
-# colorama ni faollashtirish (Windows uchun kerak)
-init(autoreset=True)
+LOG_FORMAT = '%(asctime)s - [%(levelname)s] - %(message)s'
+
+# Buferlangan rejimda shuncha yozuvdan keyin faylga yoziladi
+BUFFER_CAPACITY = 1000
+
+# Reyestrdagi ochiq loggerlar chegarasi (pytest dan tashqarida release_logger chaqirilmasa):
+# oshsa eng eskisi yopiladi
+MAX_OPEN_LOGGERS = 64
+
+# Async rejimdagi listenerlar: test_name -> (listener, queue, handlers)
+_listeners = {}
+_listeners_lock = threading.Lock()
+
+# Sozlangan loggerlar reyestri: (test_name, sana) -> logger
+_registry = {}
+_registry_lock = threading.Lock()
+
+# Daraja -> rang (colorama birinchi konsol handleri yaratilganda yuklanadi)
+_level_colors = None
+_colors_lock = threading.Lock()
+
+# Joriy test nomi (pytest hook orqali o'rnatiladi)
+_current_test = contextvars.ContextVar("current_test", default=None)
+# Joriy test ning to'liq identifikatori (pytest nodeid, parametrlar bilan)
+_current_test_id = contextvars.ContextVar("current_test_id", default=None)
+
+
+def _env_flag(name):
+    return os.getenv(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def init_colors():
+    """colorama ni jarayonda bir marta faollashtirish (Windows uchun kerak): (daraja -> rang, reset)"""
+    global _level_colors
+    if _level_colors is None:
+        with _colors_lock:
+            if _level_colors is None:
+                from colorama import init, Fore, Style
+                init(autoreset=True)
+                _level_colors = ({
+                    logging.DEBUG: Fore.LIGHTBLACK_EX,
+                    logging.INFO: Fore.BLUE,
+                    logging.WARNING: Fore.YELLOW,
+                    logging.ERROR: Fore.RED,
+                    logging.CRITICAL: Fore.MAGENTA,
+                }, Style.RESET_ALL)
+    return _level_colors
+
+
+class ColorFormatter(logging.Formatter):
+    """Rangli konsol formatteri"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.colors, self.reset = init_colors()
+
+    def format(self, record):
+        base_message = super().format(record)
+        color = self.colors.get(record.levelno)
+        return f"{color}{base_message}{self.reset}" if color else base_message
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    Standart QueueHandler xabarni chaqiruvchi threadda formatlaydi.
+    Bu yerda yozuv o'zgarishsiz navbatga qo'yiladi, formatlash listener threadida bo'ladi.
+    """
+
+    def prepare(self, record):
+        if record.exc_info and not record.exc_text:
+            # Traceback obyektlari threadlar orasida uzoq yashamasligi uchun
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def set_current_test(test_name, test_id=None):
+    """Joriy test nomi va nodeid sini o'rnatish (pytest hook dan), reset_current_test uchun token qaytaradi"""
+    return _current_test.set(test_name), _current_test_id.set(test_id)
+
+
+def reset_current_test(token):
+    name_token, id_token = token
+    _current_test.reset(name_token)
+    _current_test_id.reset(id_token)
+
+
+def get_test_id():
+    """
+    Joriy test nodeid si ("tests/test_x.py::test_login[chrome]") - parametrlangan holatlar alohida.
+    pytest dan tashqarida None.
+    """
+    test_id = _current_test_id.get()
+    if test_id:
+        return test_id
+    current = os.environ.get("PYTEST_CURRENT_TEST")
+    if current:
+        return current.rsplit(" ", 1)[0]
+    return None
 
 
 def get_test_name(default='test_unknown'):
     """
-    Joriy ishga tushgan test funksiyasi nomini topadi.
+    Joriy ishga tushgan test funksiyasi nomini topadi:
+    1. pytest hook o'rnatgan contextvar
+    2. PYTEST_CURRENT_TEST env ("tests/test_x.py::test_login[chrome] (call)")
+    3. stack framelari bo'ylab (inspect.stack() siz, manba kodini o'qimaydi)
     """
-    stack = inspect.stack()
-    for frame in stack:
-        name = frame.function
+    name = _current_test.get()
+    if name:
+        return name
+
+    current = os.environ.get("PYTEST_CURRENT_TEST")
+    if current:
+        name = current.rsplit("::", 1)[-1].split(" ", 1)[0].split("[", 1)[0]
+        if name:
+            return name
+
+    frame = sys._getframe(1)
+    while frame is not None:
+        name = frame.f_code.co_name
         if name.startswith('test'):
             return name
+        frame = frame.f_back
     return default
 
 
-def configure_logging(test_name='test_dafault'):
+def _close_handler(handler):
+    # MemoryHandler.close() target ni None qiladi - fayl handlerini oldindan olamiz
+    target = getattr(handler, "target", None)
+    handler.close()
+    if target is not None:
+        target.close()
+
+
+def _stop_listener(test_name):
+    with _listeners_lock:
+        entry = _listeners.pop(test_name, None)
+    if entry:
+        listener, _, handlers = entry
+        listener.stop()
+        for handler in handlers:
+            _close_handler(handler)
+
+
+def flush_logs(test_name=None):
+    """
+    Navbatdagi va buferdagi loglarni faylga yozish (test oxirida yoki xatolikda).
+    test_name berilmasa barcha loggerlar uchun.
+    """
+    with _listeners_lock:
+        entries = [entry for name, entry in _listeners.items() if test_name in (None, name)]
+    for _, log_queue, _ in entries:
+        log_queue.join()
+
+    names = [test_name] if test_name else list(logging.root.manager.loggerDict)
+    for name in names:
+        logger = logging.getLogger(name)
+        handlers = list(logger.handlers)
+        for _, _, listener_handlers in entries:
+            handlers.extend(listener_handlers)
+        for handler in handlers:
+            if isinstance(handler, MemoryHandler):
+                handler.flush()
+
+
+def get_logger(test_name='test_dafault'):
+    """
+    Reyestrdan tayyor logger olish. Test nomi va kun bo'yicha faqat bir marta sozlanadi,
+    keyingi chaqiruvlar handlerlar va ochiq fayllarni qayta ishlatadi.
+    """
+    key = (test_name, datetime.now().strftime('%Y%m%d'))
+    logger = _registry.get(key)
+    if logger is not None:
+        return logger
+
+    with _registry_lock:
+        logger = _registry.get(key)
+        if logger is None:
+            logger = configure_logging(test_name)
+        evicted = [name for name, _ in list(_registry)[:max(len(_registry) - MAX_OPEN_LOGGERS, 0)]]
+    for name in evicted:
+        release_logger(name)
+    return logger
+
+
+def release_logger(test_name):
+    """
+    Test tugagach uning loggerini yopish: navbat/bufer yoziladi, listener thread to'xtatiladi,
+    fayl handlerlari yopiladi va logger reyestrdan chiqariladi (keyingi get_logger qayta sozlaydi).
+    """
+    flush_logs(test_name)
+    with _registry_lock:
+        for key in [key for key in _registry if key[0] == test_name]:
+            del _registry[key]
+    _stop_listener(test_name)
+    logger = logging.getLogger(test_name)
+    for handler in list(logger.handlers):
+        _close_handler(handler)
+    logger.handlers.clear()
+
+
+def shutdown_logging():
+    """Barcha listener threadlarni to'xtatish"""
+    for test_name in list(_listeners):
+        _stop_listener(test_name)
+
+
+atexit.register(shutdown_logging)
+
+
+def configure_logging(test_name='test_dafault', async_mode=None, buffered=None):
     """
     Kuchli log tizimi: rangli konsol loglari,
     faylga yozish va test nomi asosida farqlash
+    * async_mode=True (yoki LOG_ASYNC=1) - formatlash va fayl I/O fon threadida (QueueListener)
+    * buffered=True (yoki LOG_BUFFERED=1) - fayl yozuvlari buferlanadi, ERROR da yoki flush_logs() da yoziladi
     """
+    async_mode = _env_flag("LOG_ASYNC") if async_mode is None else async_mode
+    buffered = _env_flag("LOG_BUFFERED") if buffered is None else buffered
+
     # Loglar uchun papka
     log_dir = 'logs'
     os.makedirs(log_dir, exist_ok=True)
@@ -36,42 +240,39 @@ def configure_logging(test_name='test_dafault'):
     logger = logging.getLogger(test_name)
     logger.setLevel(logging.DEBUG)
 
-    # Eski handlerlarni tozalash
-    if logger.hasHandlers():
-        logger.handlers.clear()
-
-    # Format
-    log_format = '%(asctime)s - [%(levelname)s] - %(message)s'
+    # Eski handlerlarni yopish va tozalash
+    _stop_listener(test_name)
+    for handler in list(logger.handlers):
+        _close_handler(handler)
+    logger.handlers.clear()
 
     # Faylga yozuvchi handler
     file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(logging.Formatter(log_format))
-    logger.addHandler(file_handler)
-
-    # Rangli konsol formatteri
-    class ColorFormatter(logging.Formatter):
-        def format(self, record):
-            base_message = super().format(record)
-            if record.levelno == logging.DEBUG:
-                return f'{Fore.LIGHTBLACK_EX}{base_message}{Style.RESET_ALL}'
-            elif record.levelno == logging.INFO:
-                return f"{Fore.BLUE}{base_message}{Style.RESET_ALL}"
-            elif record.levelno == logging.WARNING:
-                return f"{Fore.YELLOW}{base_message}{Style.RESET_ALL}"
-            elif record.levelno == logging.ERROR:
-                return f"{Fore.RED}{base_message}{Style.RESET_ALL}"
-            elif record.levelno == logging.CRITICAL:
-                return f"{Fore.MAGENTA}{base_message}{Style.RESET_ALL}"
-            return base_message
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    if buffered:
+        file_handler = MemoryHandler(BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler)
+        file_handler.setLevel(logging.DEBUG)
 
     # Konsolga chiqadigan handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.DEBUG)
-    console_handler.setFormatter(ColorFormatter(log_format))
-    logger.addHandler(console_handler)
+    console_handler.setFormatter(ColorFormatter(LOG_FORMAT))
+
+    if async_mode:
+        log_queue = queue.Queue()
+        listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+        listener.start()
+        with _listeners_lock:
+            _listeners[test_name] = (listener, log_queue, (file_handler, console_handler))
+        logger.addHandler(LazyQueueHandler(log_queue))
+    else:
+        logger.addHandler(file_handler)
+        logger.addHandler(console_handler)
 
     # Root loggerga propagatsiyani o'chirib qoyamiz
     logger.propagate = False
 
-    return logger
\ No newline at end of file
+    _registry[(test_name, datetime.now().strftime('%Y%m%d'))] = logger
+
+    return logger
@@ -0,0 +1,117 @@
+"""
+Page object lar reyestri: pages/ paketidagi klasslar nomi bo'yicha topiladi, lekin modul
+birinchi murojaatgacha import qilinmaydi. Yuzlab sahifa bo'lsa ham test yig'ish (collection)
+faqat ishlatilgan sahifalar modullarini yuklaydi.
+    from pages import registry
+    login = registry.create("LoginPage", driver)
+    username = registry.locator("LoginPage.USERNAME")
+"""
+import importlib
+import os
+import re
+import threading
+
+# Modul import qilinmasdan, manba matnidan top-level klasslar nomini o'qish
+_CLASS_RE = re.compile(r"^class\s+([A-Za-z_]\w*)\s*[(:]", re.MULTILINE)
+
+
+class PageRegistry:
+    """
+    * package - paket nomi ("pages")
+    * path - paket papkasi (ichki papkalar ham ko'riladi)
+    * suffix - faqat shu bilan tugaydigan klasslar ro'yxatga olinadi (None - barchasi)
+    """
+
+    def __init__(self, package, path, suffix="Page"):
+        self.package = package
+        self.path = path
+        self.suffix = suffix
+        self._modules = None
+        self._classes = {}
+        self._lock = threading.Lock()
+
+    def _discover(self):
+        """klass nomi -> modul nomi (fayllar faqat o'qiladi, import qilinmaydi)"""
+        modules = {}
+        for root, dirs, files in os.walk(self.path):
+            dirs[:] = sorted(d for d in dirs if not d.startswith((".", "__")))
+            relative = os.path.relpath(root, self.path)
+            prefix = self.package if relative == "." else f"{self.package}.{relative.replace(os.sep, '.')}"
+            for filename in sorted(files):
+                if not filename.endswith(".py") or filename.startswith("__"):
+                    continue
+                with open(os.path.join(root, filename), encoding="utf-8") as f:
+                    names = _CLASS_RE.findall(f.read())
+                for name in names:
+                    if self.suffix and not name.endswith(self.suffix):
+                        continue
+                    if name in modules:
+                        raise ValueError(f"Sahifa klassi nomi takrorlangan: {name} "
+                                         f"({modules[name]}, {prefix}.{filename[:-3]})")
+                    modules[name] = f"{prefix}.{filename[:-3]}"
+        return modules
+
+    @property
+    def modules(self):
+        if self._modules is None:
+            with self._lock:
+                if self._modules is None:
+                    self._modules = self._discover()
+        return self._modules
+
+    def names(self):
+        """Topilgan sahifa klasslari nomlari"""
+        return sorted(self.modules)
+
+    def __contains__(self, name):
+        return name in self.modules
+
+    def get(self, name):
+        """Sahifa klassi (moduli birinchi murojaatda import qilinadi)"""
+        page_class = self._classes.get(name)
+        if page_class is not None:
+            return page_class
+        try:
+            module_name = self.modules[name]
+        except KeyError:
+            raise LookupError(f"Sahifa topilmadi: '{name}' ({self.package} paketida)") from None
+        page_class = getattr(importlib.import_module(module_name), name)
+        self._classes[name] = page_class
+        return page_class
+
+    def create(self, name, driver):
+        """Sahifa obyekti: registry.create("LoginPage", driver)"""
+        return self.get(name)(driver)
+
+    def locator(self, path):
+        """Sahifa klassidagi locator: registry.locator("LoginPage.USERNAME")"""
+        name, _, attribute = path.partition(".")
+        return getattr(self.get(name), attribute)
+
+    def loaded(self):
+        """Import qilingan sahifalar (import vaqtini kuzatish uchun)"""
+        return sorted(self._classes)
+
+    def bind(self, driver):
+        """driver ga bog'langan fabrika: pages.LoginPage - sahifa obyekti (test ichida bir marta yaratiladi)"""
+        return _BoundPages(self, driver)
+
+
+class _BoundPages:
+    def __init__(self, registry, driver):
+        self._registry = registry
+        self._driver = driver
+        self._pages = {}
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        page = self._pages.get(name)
+        if page is None:
+            if name not in self._registry:
+                raise AttributeError(f"Sahifa topilmadi: '{name}'")
+            page = self._pages[name] = self._registry.create(name, self._driver)
+        return page
+
+    def __dir__(self):
+        return self._registry.names()
@@ -0,0 +1,138 @@
+"""
+BasePage amallari profileri: vaqt, WebDriver buyruqlari, retry va kutish vaqti
+(page klassi, method, locator) bo'yicha yig'iladi va sessiya oxirida hisobot chiqariladi.
+"""
+import os
+import threading
+from collections import defaultdict
+
+
+def _env_flag(name):
+    return os.getenv(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def install_command_counter(driver):
+    """
+    driver.execute ni o'rab, yuborilgan WebDriver buyruqlarini sanaydi (driver._command_count).
+    Har bir driver uchun bir marta o'rnatiladi.
+    """
+    if getattr(driver, "_command_count", None) is not None:
+        return driver
+    original_execute = driver.execute
+
+    def execute(driver_command, params=None):
+        driver._command_count += 1
+        return original_execute(driver_command, params)
+
+    driver._command_count = 0
+    driver.execute = execute
+    return driver
+
+
+def command_count(driver):
+    return getattr(driver, "_command_count", 0) or 0
+
+
+def percentile(values, percent):
+    """Saralangan ro'yxat uchun percentil (chiziqli interpolyatsiya)"""
+    if not values:
+        return 0.0
+    k = (len(values) - 1) * percent / 100
+    low = int(k)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (k - low)
+
+
+class _Stats:
+    __slots__ = ("durations", "commands", "retries", "sleep", "failures")
+
+    def __init__(self):
+        self.durations = []
+        self.commands = 0
+        self.retries = 0
+        self.sleep = 0.0
+        self.failures = 0
+
+
+class Profiler:
+    """Jarayon bo'yicha yagona profiler (PROFILE=1 yoki enable() bilan yoqiladi)"""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._locators = defaultdict(_Stats)
+        self._pages = defaultdict(_Stats)
+
+    def enable(self):
+        self.enabled = True
+
+    def reset(self):
+        with self._lock:
+            self._locators.clear()
+            self._pages.clear()
+
+    def record(self, page, method, locator, duration, commands, retries, sleep, failed, top_level):
+        """Bitta chaqiruv natijasini yozish. top_level - ichma-ich bo'lmagan amal (page jami uchun)"""
+        if not self.enabled:
+            return
+        items = [self._locators[(page, method, locator)]]
+        if top_level:
+            items.append(self._pages[page])
+        with self._lock:
+            for item in items:
+                item.durations.append(duration)
+                item.commands += commands
+                item.retries += retries
+                item.sleep += sleep
+                item.failures += int(failed)
+
+    @staticmethod
+    def _summary(item):
+        durations = sorted(item.durations)
+        return {
+            "count": len(durations),
+            "total": sum(durations),
+            "p50": percentile(durations, 50),
+            "p90": percentile(durations, 90),
+            "p99": percentile(durations, 99),
+            "max": durations[-1] if durations else 0.0,
+            "commands": item.commands,
+            "retries": item.retries,
+            "sleep": item.sleep,
+            "failures": item.failures,
+        }
+
+    def locator_stats(self):
+        with self._lock:
+            return {key: self._summary(item) for key, item in self._locators.items()}
+
+    def page_stats(self):
+        with self._lock:
+            return {page: self._summary(item) for page, item in self._pages.items()}
+
+    def report(self, top=20):
+        """Eng sekin locatorlar va sahifalar hisobotini matn ko'rinishida qaytaradi"""
+        lines = []
+        header = f"{'jami':>9} {'n':>6} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8} {'cmd':>6} {'retry':>5} {'sleep':>7}"
+
+        def row(summary, name):
+            return (f"{summary['total']:8.2f}s {summary['count']:>6} {summary['p50'] * 1000:7.0f}ms "
+                    f"{summary['p90'] * 1000:7.0f}ms {summary['p99'] * 1000:7.0f}ms {summary['max'] * 1000:7.0f}ms "
+                    f"{summary['commands']:>6} {summary['retries']:>5} {summary['sleep']:6.2f}s  {name}")
+
+        pages = sorted(self.page_stats().items(), key=lambda item: item[1]["total"], reverse=True)
+        if pages:
+            lines.append("Eng sekin sahifalar:")
+            lines.append(header)
+            lines.extend(row(summary, page) for page, summary in pages[:top])
+
+        locators = sorted(self.locator_stats().items(), key=lambda item: item[1]["total"], reverse=True)
+        if locators:
+            lines.append("")
+            lines.append("Eng sekin locatorlar:")
+            lines.append(header)
+            lines.extend(row(summary, f"{page}.{method} {locator}") for (page, method, locator), summary in locators[:top])
+        return "\n".join(lines)
+
+
+profiler = Profiler(enabled=_env_flag("PROFILE"))
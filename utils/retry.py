@@ -0,0 +1,250 @@
+import asyncio
+import os
+import random
+import threading
+import time
+from collections import defaultdict
+
+from selenium.common.exceptions import (
+    WebDriverException, NoSuchElementException,
+    StaleElementReferenceException, ElementClickInterceptedException,
+    TimeoutException, JavascriptException, InvalidSelectorException)
+
+from utils.exeption import (
+    ElementNotFoundError, ElementStaleError,
+    ScrollError, JavaScriptError,
+    ElementInteractionError, ElementVisibilityError,
+    ElementNotClickableError, LoaderTimeoutError)
+
+
+# DOM o'zgarishini kutuvchi async skript: o'zgarish bo'lsa yoki vaqt tugasa qaytadi
+DOM_CHANGE_JS = """
+var done = arguments[arguments.length - 1];
+var timeoutMs = arguments[0];
+var observer = null;
+var timer = setTimeout(function () {
+    if (observer) { observer.disconnect(); }
+    done(false);
+}, timeoutMs);
+observer = new MutationObserver(function () {
+    clearTimeout(timer);
+    observer.disconnect();
+    done(true);
+});
+observer.observe(document.documentElement || document, {
+    childList: true, subtree: true, attributes: true, characterData: true
+});
+"""
+
+TRANSIENT = "transient"
+DETERMINISTIC = "deterministic"
+
+# Qayta urinishda o'tib ketishi mumkin bo'lgan xatolar (DOM yangilandi, animatsiya, JS poyga)
+TRANSIENT_ERRORS = (
+    ElementStaleError, JavaScriptError, ScrollError,
+    StaleElementReferenceException, JavascriptException, ElementClickInterceptedException)
+# To'liq timeout dan keyin yoki locator xato - qayta urinish natijani o'zgartirmaydi
+DETERMINISTIC_ERRORS = (
+    ElementNotFoundError, ElementVisibilityError, ElementNotClickableError, LoaderTimeoutError,
+    TimeoutException, NoSuchElementException, InvalidSelectorException)
+
+_stats_lock = threading.Lock()
+_sleep_stats = defaultdict(lambda: defaultdict(float))
+_budgets = {}
+# Tugagan testlar byudjetlari hisoboti: test_id -> budget_report qatori
+_finished_budgets = {}
+
+
+class RetryPolicy:
+    """
+    Qayta urinishlar orasidagi kutish siyosati:
+    * birinchi qayta urinish qisqa (first_delay)
+    * keyingilari eksponensial o'sadi (base_delay * multiplier ** n), max_delay bilan cheklangan
+    * jitter - kutish vaqtini +/- foizga tasodifiy o'zgartiradi
+    * observe_dom=True - DOM o'zgarsa kutish muddatidan oldin davom etadi (MutationObserver)
+    """
+
+    def __init__(self, name="default", first_delay=0.1, base_delay=0.5, max_delay=4.0,
+                 multiplier=2.0, jitter=0.2, observe_dom=False):
+        self.name = name
+        self.first_delay = first_delay
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.observe_dom = observe_dom
+
+    def __repr__(self):
+        return f"RetryPolicy({self.name!r})"
+
+    def delay(self, attempt):
+        """attempt (0 dan boshlanadi) uchun kutish vaqtini hisoblaydi"""
+        if attempt <= 0:
+            delay = self.first_delay
+        else:
+            delay = self.base_delay * self.multiplier ** (attempt - 1)
+        delay = min(delay, self.max_delay)
+        if self.jitter:
+            delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return max(delay, 0)
+
+    def sleep(self, attempt, driver=None, test_name="test_unknown", delay=None):
+        """
+        Kutadi va haqiqiy kutilgan vaqtni qaytaradi.
+        delay berilsa, backoff o'rniga aynan shu vaqt kutiladi.
+        """
+        delay = self.delay(attempt) if delay is None else delay
+        start = time.monotonic()
+
+        if self.observe_dom and driver is not None and delay > 0:
+            self._wait_for_dom_change(driver, delay)
+        elif delay > 0:
+            time.sleep(delay)
+
+        slept = time.monotonic() - start
+        record_sleep(test_name, self.name, slept)
+        return slept
+
+    async def async_sleep(self, attempt, test_name="test_unknown", delay=None):
+        """sleep() ning asyncio varianti (AsyncBasePage uchun): event loop bloklanmaydi"""
+        delay = self.delay(attempt) if delay is None else delay
+        start = time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        slept = time.monotonic() - start
+        record_sleep(test_name, self.name, slept)
+        return slept
+
+    @staticmethod
+    def _wait_for_dom_change(driver, delay):
+        """DOM o'zgarishi yoki delay tugashini kutish, xato bo'lsa oddiy sleep"""
+        start = time.monotonic()
+        try:
+            return driver.execute_async_script(DOM_CHANGE_JS, int(delay * 1000))
+        except WebDriverException:
+            remaining = delay - (time.monotonic() - start)
+            if remaining > 0:
+                time.sleep(remaining)
+            return False
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy("default")
+OPTION_TEXT_POLICY = RetryPolicy("option_text", first_delay=0.05, base_delay=0.2, max_delay=1.0)
+
+
+def record_sleep(test_name, policy_name, seconds):
+    """Test va policy bo'yicha kutish vaqtini yig'ish"""
+    with _stats_lock:
+        _sleep_stats[test_name][policy_name] += seconds
+
+
+def sleep_report():
+    """{test_name: {policy_name: jami_kutish_soniya}} ko'rinishidagi hisobot"""
+    with _stats_lock:
+        return {test: dict(policies) for test, policies in _sleep_stats.items()}
+
+
+def reset_sleep_stats():
+    with _stats_lock:
+        _sleep_stats.clear()
+
+
+def is_invalid_selector_error(message):
+    """Sahifa skriptidagi querySelector/evaluate xatosi (SyntaxError): locator noto'g'ri, qayta urinish foydasiz"""
+    message = str(message)
+    return any(marker in message for marker in ("SyntaxError", "is not a valid selector", "is not a valid XPath"))
+
+
+def classify_failure(error):
+    """
+    Xatoni tasniflash: TRANSIENT - qayta urinish mumkin, DETERMINISTIC - darhol to'xtash.
+    Umumiy ElementInteractionError uchun asl sabab (original_error) tekshiriladi; noma'lum xatolar DETERMINISTIC
+    """
+    if isinstance(error, TRANSIENT_ERRORS):
+        return TRANSIENT
+    if isinstance(error, DETERMINISTIC_ERRORS):
+        return DETERMINISTIC
+    if isinstance(error, ElementInteractionError) and error.original_error is not None:
+        return classify_failure(error.original_error)
+    return DETERMINISTIC
+
+
+class RetryBudget:
+    """
+    Bitta test davomida qayta urinishlarga (muvaffaqiyatsiz urinishlar + kutishlar) sarflanadigan vaqt chegarasi.
+    * seconds - byudjet (RETRY_BUDGET env, sukut bo'yicha 30s)
+    * saved - to'xtatilgan urinishlar tejagan taxminiy vaqt
+    """
+
+    def __init__(self, seconds=None):
+        self.seconds = float(os.getenv("RETRY_BUDGET", "30")) if seconds is None else seconds
+        self.spent = 0.0
+        self.saved = 0.0
+        self.fail_fast = 0
+        self.exhausted_stops = 0
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self):
+        return max(self.seconds - self.spent, 0.0)
+
+    @property
+    def exhausted(self):
+        return self.spent >= self.seconds
+
+    def charge(self, seconds):
+        with self._lock:
+            self.spent += max(seconds, 0.0)
+
+    def record_stop(self, kind, saved):
+        """Qayta urinish to'xtatildi: kind - DETERMINISTIC (fail fast) yoki "budget" """
+        with self._lock:
+            if kind == DETERMINISTIC:
+                self.fail_fast += 1
+            else:
+                self.exhausted_stops += 1
+            self.saved += max(saved, 0.0)
+
+
+def retry_budget(test_id):
+    """
+    Test uchun yagona RetryBudget (birinchi chaqiruvda yaratiladi).
+    test_id - pytest nodeid: parametrlangan har bir holat o'z byudjetiga ega.
+    """
+    with _stats_lock:
+        if test_id not in _budgets:
+            _budgets[test_id] = RetryBudget()
+        return _budgets[test_id]
+
+
+def _budget_row(budget):
+    if budget.spent or budget.fail_fast or budget.exhausted_stops:
+        return {"spent": budget.spent, "saved": budget.saved,
+                "fail_fast": budget.fail_fast, "exhausted": budget.exhausted_stops}
+    return None
+
+
+def finish_retry_budget(test_id):
+    """Test tugadi (pytest_runtest_teardown): byudjet o'chiriladi, natijasi faqat hisobotda qoladi"""
+    with _stats_lock:
+        budget = _budgets.pop(test_id, None)
+        row = _budget_row(budget) if budget is not None else None
+        if row:
+            _finished_budgets[test_id] = row
+
+
+def budget_report():
+    """{test_id: {"spent", "saved", "fail_fast", "exhausted"}} - faqat retry bo'lgan testlar"""
+    with _stats_lock:
+        report = dict(_finished_budgets)
+        for test_id, budget in _budgets.items():
+            row = _budget_row(budget)
+            if row:
+                report[test_id] = row
+        return report
+
+
+def reset_retry_budgets():
+    with _stats_lock:
+        _budgets.clear()
+        _finished_budgets.clear()
@@ -0,0 +1,228 @@
+"""
+Screenshot xizmati: test threadida faqat PNG baytlari olinadi va aynan takror kadr (sha1) tekshiriladi,
+qolgan ish (decode, perceptual hash, siqish, kichraytirish va yozish) fon worker larida bajariladi.
+* ketma-ket bir xil kadrlar (bir test ichida) saqlanmaydi
+* run davomida diskka yoziladigan hajm kvota bilan cheklanadi, eng eskilari o'chiriladi
+* Pillow o'rnatilgan bo'lsa WebP/JPEG ga siqiladi va perceptual hash bilan solishtiriladi,
+  aks holda PNG o'zgarishsiz yoziladi va faqat aynan bir xil kadrlar tashlab yuboriladi
+"""
+import atexit
+import functools
+import hashlib
+import io
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+DEFAULT_SCREENSHOT_DIR = "screenshot"
+EXTENSIONS = {"png": "png", "webp": "webp", "jpeg": "jpg"}
+
+
+def _dhash(image, size=8):
+    """64 bitli difference hash: kichik o'zgarishlar (kursor, animatsiya) hashni deyarli o'zgartirmaydi"""
+    pixels = list(image.convert("L").resize((size + 1, size)).getdata())
+    bits = 0
+    for row in range(size):
+        for col in range(size):
+            left = pixels[row * (size + 1) + col]
+            bits = (bits << 1) | (left > pixels[row * (size + 1) + col + 1])
+    return bits
+
+
+class ScreenshotService:
+    """
+    * image_format - "png", "webp" yoki "jpeg" (Pillow kerak, bo'lmasa png)
+    * max_width - kengroq kadrlar shu kenglikka kichraytiriladi (Pillow kerak)
+    * quota_bytes - run davomida saqlanadigan jami hajm; oshsa eng eski fayllar o'chiriladi
+    * similarity - perceptual hash farqi shundan kichik bo'lsa kadr takror hisoblanadi
+    """
+
+    def __init__(self, directory=DEFAULT_SCREENSHOT_DIR, image_format="png", quality=80, max_width=None,
+                 quota_bytes=200 * 1024 * 1024, workers=2, similarity=3):
+        self.directory = directory
+        image_format = "jpeg" if image_format == "jpg" else image_format
+        if image_format not in EXTENSIONS:
+            raise ValueError(f"Notogri screenshot formati: '{image_format}'. Faqat {', '.join(EXTENSIONS)}")
+        self.image_format = image_format if Image is not None else "png"
+        self.quality = quality
+        self.max_width = max_width
+        self.quota_bytes = quota_bytes
+        self.similarity = similarity
+
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="screenshot")
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._tail = {}
+        self._last_digest = {}
+        self._last_hash = {}
+        self._written = deque()
+        self._total = 0
+        self.stats = {"captured": 0, "duplicates": 0, "written": 0, "evicted": 0, "errors": 0}
+
+    def path_for(self, filename):
+        return os.path.join(self.directory, f"{filename}.{EXTENSIONS[self.image_format]}")
+
+    def capture(self, driver, filename, key=None):
+        """
+        PNG ni olib, aynan takror (sha1) emasligini shu yerda tekshiradi va fayl yo'lini oldindan band qiladi.
+        key - takrorlarni solishtirish guruhi (odatda test nomi). Aynan takror kadr bo'lsa None.
+        Decode, perceptual hash, siqish va yozish worker da: fayl flush dan keyin diskda bo'ladi,
+        worker kadrni o'xshash deb topsa esa yozilmaydi (stats["duplicates"]).
+        """
+        png = driver.get_screenshot_as_png()
+        digest = hashlib.sha1(png).digest()
+        path = self.path_for(filename)
+        with self._lock:
+            self.stats["captured"] += 1
+            if self._last_digest.get(key) == digest:
+                self.stats["duplicates"] += 1
+                return None
+            self._last_digest[key] = digest
+            # Bir key kadrlari navbat bilan solishtiriladi: worker oldingi kadr tugashini kutadi
+            previous = self._tail.get(key)
+            future = self._executor.submit(self._process, png, path, key, previous)
+            self._tail[key] = future
+            self._pending.add(future)
+        future.add_done_callback(functools.partial(self._done, key))
+        return path
+
+    def _done(self, key, future):
+        with self._lock:
+            self._pending.discard(future)
+            if self._tail.get(key) is future:
+                del self._tail[key]
+            if future.exception() is not None:
+                self.stats["errors"] += 1
+
+    @staticmethod
+    def _open(png):
+        """Pillow bo'lmasa yoki baytlar rasm bo'lmasa None"""
+        if Image is None:
+            return None
+        try:
+            image = Image.open(io.BytesIO(png))
+            image.load()
+            return image
+        except OSError:
+            return None
+
+    def _needs_encoding(self, image):
+        return self.image_format != "png" or bool(self.max_width and image.width > self.max_width)
+
+    def _encode(self, image):
+        if self.max_width and image.width > self.max_width:
+            height = round(image.height * self.max_width / image.width)
+            image = image.resize((self.max_width, height))
+
+        output = io.BytesIO()
+        if self.image_format == "jpeg":
+            image.convert("RGB").save(output, "JPEG", quality=self.quality, optimize=True)
+        elif self.image_format == "webp":
+            image.save(output, "WEBP", quality=self.quality, method=4)
+        else:
+            image.save(output, "PNG", optimize=True)
+        return output.getvalue()
+
+    def _process(self, png, path, key, previous):
+        """Worker: o'xshash kadrni tashlab yuborish, kerak bo'lsa siqish (asosiy qimmat qism) va yozish"""
+        if previous is not None:
+            try:
+                previous.result()
+            except Exception:
+                pass
+
+        image = self._open(png)
+        if image is not None:
+            image_hash = _dhash(image)
+            with self._lock:
+                last = self._last_hash.get(key)
+                # Sekin o'zgarish ham sezilishi uchun oxirgi saqlangan kadr bilan solishtiriladi
+                if last is not None and bin(last ^ image_hash).count("1") < self.similarity:
+                    self.stats["duplicates"] += 1
+                    return None
+                self._last_hash[key] = image_hash
+
+        self._write(png if image is None or not self._needs_encoding(image) else self._encode(image), path)
+        return path
+
+    def _write(self, data, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+
+        with self._lock:
+            self._written.append((path, len(data)))
+            self._total += len(data)
+            self.stats["written"] += 1
+            evict = []
+            # Oxirgi kadr kvotadan katta bo'lsa ham saqlanadi
+            while self.quota_bytes and self._total > self.quota_bytes and len(self._written) > 1:
+                old_path, size = self._written.popleft()
+                self._total -= size
+                evict.append(old_path)
+            self.stats["evicted"] += len(evict)
+
+        for old_path in evict:
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
+
+    def forget(self, key):
+        """Test tugagach uning oxirgi kadr ma'lumotini tozalash"""
+        with self._lock:
+            self._last_digest.pop(key, None)
+            self._last_hash.pop(key, None)
+            self._tail.pop(key, None)
+
+    def flush(self, timeout=None):
+        """Navbatdagi barcha screenshotlar yozilishini kutish"""
+        with self._lock:
+            pending = list(self._pending)
+        for future in pending:
+            try:
+                future.result(timeout=timeout)
+            except Exception:
+                pass
+
+    def close(self):
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_screenshot_service():
+    """
+    Jarayon uchun yagona ScreenshotService. Sozlamalar env dan:
+    SCREENSHOT_DIR, SCREENSHOT_FORMAT, SCREENSHOT_MAX_WIDTH, SCREENSHOT_QUOTA_MB, SCREENSHOT_WORKERS
+    """
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                max_width = os.getenv("SCREENSHOT_MAX_WIDTH")
+                _service = ScreenshotService(
+                    directory=os.getenv("SCREENSHOT_DIR", DEFAULT_SCREENSHOT_DIR),
+                    image_format=os.getenv("SCREENSHOT_FORMAT", "png").strip().lower(),
+                    max_width=int(max_width) if max_width else None,
+                    quota_bytes=int(float(os.getenv("SCREENSHOT_QUOTA_MB", "200")) * 1024 * 1024),
+                    workers=int(os.getenv("SCREENSHOT_WORKERS", "2")),
+                )
+                atexit.register(_service.close)
+    return _service
+
+
+def flush_screenshots(key=None):
+    if _service is not None:
+        _service.flush()
+        if key is not None:
+            _service.forget(key)
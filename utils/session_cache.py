@@ -0,0 +1,213 @@
+"""
+Sessiya holati keshi: nomlangan setup (masalan login) bir marta bajariladi, so'ng
+cookies, localStorage, sessionStorage va URL faylga saqlanadi. Keyingi testlar
+holatni millisekundlarda tiklaydi. Yozuvlar TTL bilan eskiradi; fayllar atomik yoziladi
+va setup FileLock ostida bajariladi, shuning uchun parallel workerlar xavfsiz bo'lishadi.
+
+Diqqat: yozuvlarda login cookie lari va storage tokenlari ochiq (shifrlanmagan) holda turadi.
+Fayllar faqat egasi o'qiy oladigan qilib (papka 0700, fayl 0600) yoziladi; papkani boshqalar bilan
+bo'lishmang, repo ga yoki CI artefaktlariga qo'shmang.
+"""
+import json
+import os
+import re
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.file_lock import FileLock
+from utils.logger import get_logger
+
+DEFAULT_SESSION_DIR = os.path.join(os.path.expanduser("~"), ".cache", "globalsqa_test", "sessions")
+
+# CDP Network.setCookies qabul qiladigan maydonlar
+COOKIE_PARAMS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires",
+                 "priority", "sourceScheme", "sourcePort", "partitionKey")
+
+STORAGE_SNAPSHOT_JS = """
+function dump(storage) {
+    var items = {};
+    for (var i = 0; i < storage.length; i++) { items[storage.key(i)] = storage.getItem(storage.key(i)); }
+    return items;
+}
+try {
+    return {origin: location.origin, local: dump(localStorage), session: dump(sessionStorage)};
+} catch (e) {
+    return {origin: location.origin, local: {}, session: {}};
+}
+"""
+
+# Sahifa skriptlaridan oldin (yoki navigatsiyasiz) storage ni to'ldirish; origin mos kelsagina
+STORAGE_RESTORE_JS = """
+(function (origin, local, session) {
+    if (location.origin !== origin) { return; }
+    try {
+        Object.keys(local).forEach(function (key) { localStorage.setItem(key, local[key]); });
+        Object.keys(session).forEach(function (key) { sessionStorage.setItem(key, session[key]); });
+    } catch (e) {}
+})(%s, %s, %s);
+"""
+
+
+def _safe_name(name):
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", name)
+
+
+class SessionCache:
+    """
+    * directory - yozuvlar papkasi (SESSION_CACHE_DIR env)
+    * ttl - yozuv yaroqlilik muddati (soniya, SESSION_CACHE_TTL env)
+    """
+
+    def __init__(self, directory=None, ttl=None, lock_timeout=300):
+        self.directory = directory or os.getenv("SESSION_CACHE_DIR") or DEFAULT_SESSION_DIR
+        self.ttl = float(os.getenv("SESSION_CACHE_TTL", "1800")) if ttl is None else ttl
+        self.lock_timeout = lock_timeout
+        worker = os.getenv("PYTEST_XDIST_WORKER", "master")
+        self.logger = get_logger(f"session_cache_{worker}")
+
+    def _path(self, name):
+        return os.path.join(self.directory, f"{_safe_name(name)}.json")
+
+    def _lock(self, name):
+        return FileLock(os.path.join(self.directory, f"{_safe_name(name)}.lock"),
+                        timeout=self.lock_timeout, stale_after=max(300, self.lock_timeout))
+
+    # ------------------------------------------------------------------------------
+
+    def load(self, name, ttl=None):
+        """Yaroqli yozuvni o'qish, yo'q yoki eskirgan bo'lsa None"""
+        ttl = self.ttl if ttl is None else ttl
+        try:
+            with open(self._path(name), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if ttl and time.time() - entry.get("created", 0) > ttl:
+            return None
+        return entry
+
+    def invalidate(self, name):
+        try:
+            os.remove(self._path(name))
+        except OSError:
+            pass
+
+    def _write(self, name, entry):
+        """Atomik yozish; fayl 0600 huquq bilan yaratiladi (ichida credential lar bor)"""
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        path = self._path(name)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        # Avvalgi uzilgan yozuvdan qolgan tmp fayl boshqa huquqlarda bo'lishi mumkin
+        os.chmod(tmp_path, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    # ------------------------------------------------------------------------------
+
+    @staticmethod
+    def _get_cookies(driver):
+        """Barcha domenlar cookie lari (CDP), bo'lmasa joriy domen cookie lari"""
+        try:
+            return driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"], "cdp"
+        except (AttributeError, WebDriverException):
+            return driver.get_cookies(), "webdriver"
+
+    def capture(self, driver, name):
+        """Joriy brauzer holatini name ostida saqlash"""
+        cookies, cookie_format = self._get_cookies(driver)
+        storage = driver.execute_script(STORAGE_SNAPSHOT_JS)
+        entry = {
+            "name": name,
+            "created": time.time(),
+            "url": driver.current_url,
+            "origin": storage["origin"],
+            "cookie_format": cookie_format,
+            "cookies": cookies,
+            "local_storage": storage["local"],
+            "session_storage": storage["session"],
+        }
+        self._write(name, entry)
+        self.logger.info("⏺ Sessiya holati saqlandi: %s (%s cookie)", name, len(cookies))
+        return entry
+
+    def restore(self, driver, name, ttl=None):
+        """
+        Saqlangan holatni tiklash. CDP bo'lsa bitta navigatsiya: cookie lar CDP bilan,
+        storage sahifa skriptlaridan oldin qo'yiladi. Yozuv yo'q/eskirgan bo'lsa False.
+        """
+        entry = self.load(name, ttl)
+        if entry is None:
+            return False
+
+        storage_js = STORAGE_RESTORE_JS % (json.dumps(entry["origin"]), json.dumps(entry["local_storage"]),
+                                           json.dumps(entry["session_storage"]))
+        try:
+            self._restore_cdp(driver, entry, storage_js)
+        except (AttributeError, WebDriverException):
+            self._restore_webdriver(driver, entry, storage_js)
+        self.logger.info("⏺ Sessiya holati tiklandi: %s -> %s", name, entry["url"])
+        return True
+
+    @staticmethod
+    def _restore_cdp(driver, entry, storage_js):
+        if entry["cookie_format"] == "cdp":
+            cookies = []
+            for cookie in entry["cookies"]:
+                param = {key: cookie[key] for key in COOKIE_PARAMS if key in cookie}
+                if cookie.get("session") or param.get("expires", -1) < 0:
+                    param.pop("expires", None)
+                cookies.append(param)
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+        else:
+            for cookie in entry["cookies"]:
+                param = {key: cookie[key] for key in ("name", "value", "domain", "path", "secure", "httpOnly",
+                                                      "sameSite") if key in cookie}
+                if "expiry" in cookie:
+                    param["expires"] = cookie["expiry"]
+                driver.execute_cdp_cmd("Network.setCookie", {**param, "url": entry["origin"]})
+
+        script = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": storage_js})
+        try:
+            driver.get(entry["url"])
+        finally:
+            driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script["identifier"]})
+
+    @staticmethod
+    def _restore_webdriver(driver, entry, storage_js):
+        """CDP siz: origin ochiladi, cookie va storage qo'yiladi, so'ng saqlangan URL ochiladi"""
+        driver.get(entry["origin"])
+        for cookie in entry["cookies"]:
+            cookie = {key: value for key, value in cookie.items() if key in ("name", "value", "path", "domain",
+                                                                            "secure", "httpOnly", "expiry", "sameSite")}
+            try:
+                driver.add_cookie(cookie)
+            except WebDriverException:
+                # Boshqa domen cookie si - WebDriver faqat joriy domenga qo'yadi
+                continue
+        driver.execute_script(storage_js)
+        driver.get(entry["url"])
+
+    # ------------------------------------------------------------------------------
+
+    def ensure(self, driver, name, setup, ttl=None, validate=None):
+        """
+        Holatni tiklash yoki (bo'lmasa) setup(driver) ni bajarib saqlash.
+        validate(driver) -> bool: tiklangan holat hali yaroqliligini tekshirish (masalan login sahifasi chiqmadi).
+        Setup FileLock ostida: parallel workerlardan faqat bittasi bajaradi, qolganlari natijani tiklaydi.
+        "restored" yoki "created" qaytaradi.
+        """
+        if self.restore(driver, name, ttl) and (validate is None or validate(driver)):
+            return "restored"
+
+        with self._lock(name):
+            # Qulfni kutayotganda boshqa worker saqlagan bo'lishi mumkin
+            if self.restore(driver, name, ttl) and (validate is None or validate(driver)):
+                return "restored"
+            self.invalidate(name)
+            self.logger.info("⏺ Sessiya setup bajarilmoqda: %s", name)
+            setup(driver)
+            self.capture(driver, name)
+            return "created"
@@ -0,0 +1,49 @@
+import difflib
+import re
+import unicodedata
+
+
+def normalize_text(text):
+    """Taqqoslash uchun matnni normallashtirish: bo'shliqlar, registr, diakritik belgilar"""
+    text = unicodedata.normalize("NFKD", str(text))
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    text = text.replace("‘", "'").replace("’", "'").replace("ʻ", "'").replace("ʼ", "'")
+    return re.sub(r"\s+", " ", text).strip().casefold()
+
+
+def build_text_index(items, key="text"):
+    """{normallashgan_matn: item} indeksi (birinchi uchragani saqlanadi)"""
+    index = {}
+    for item in items:
+        index.setdefault(normalize_text(item[key]), item)
+    return index
+
+
+def find_best_match(items, wanted, fuzzy=False, cutoff=0.85):
+    """
+    items ichidan wanted ga mosini topish (dict lar, 'text' va 'value' kalitlari bilan):
+    1. aniq matn  2. normallashgan matn  3. value  4. fuzzy (difflib) - faqat fuzzy=True bo'lsa
+    disabled=True bo'lgan elementlar hisobga olinmaydi.
+    Fuzzy noto'g'ri elementni tanlashi mumkin ("Country 1" -> "Country 11"), shuning uchun sukut bo'yicha o'chiq.
+    Natija: (item, usul) yoki (None, None)
+    """
+    items = [item for item in items if not item.get("disabled")]
+    wanted_str = str(wanted).strip()
+    for item in items:
+        if item["text"] == wanted_str:
+            return item, "exact"
+
+    index = build_text_index(items)
+    normalized = normalize_text(wanted_str)
+    if normalized in index:
+        return index[normalized], "normalized"
+
+    for item in items:
+        if str(item.get("value", "")).strip() == wanted_str:
+            return item, "value"
+
+    if fuzzy:
+        close = difflib.get_close_matches(normalized, list(index), n=1, cutoff=cutoff)
+        if close:
+            return index[close[0]], "fuzzy"
+    return None, None